@@ -0,0 +1,32 @@
+-- backfill_stats.sql
+-- Recalcula StartupStats y StartupVoteStatsSnapshot a partir de Vote y Comment.
+-- Ejecutar después de cargar los seeds (o cualquier carga masiva por SQL).
+DELETE FROM StartupStats;
+
+INSERT INTO StartupStats (startup_id, upvotes, downvotes, total_votes, total_comments)
+SELECT 
+    s.startup_id,
+    (SELECT COUNT(*) FROM Vote v WHERE v.startup_id = s.startup_id AND v.vote_type = 'upvote'),
+    (SELECT COUNT(*) FROM Vote v WHERE v.startup_id = s.startup_id AND v.vote_type = 'downvote'),
+    (SELECT COUNT(*) FROM Vote v WHERE v.startup_id = s.startup_id),
+    (SELECT COUNT(*) FROM Comment c WHERE c.startup_id = s.startup_id)
+FROM Startup s;
+
+-- Mismo cálculo que la vista StartupVoteStats (views.sql), pero sobre Vote y
+-- Startup: en docker la vista no existe cuando corre este script.
+-- Los cambios y borrados de votos hechos por SQL no los ve el refresco
+-- incremental del backend: usar este script.
+DELETE FROM StartupVoteStatsSnapshot;
+
+INSERT INTO StartupVoteStatsSnapshot (startup_id, startup_name, upvotes, downvotes, total_votes, net_votes, refreshed_at)
+SELECT 
+    s.startup_id,
+    s.name,
+    COUNT(CASE WHEN v.vote_type = 'upvote' THEN 1 END),
+    COUNT(CASE WHEN v.vote_type = 'downvote' THEN 1 END),
+    COUNT(v.vote_id),
+    COUNT(CASE WHEN v.vote_type = 'upvote' THEN 1 END) - COUNT(CASE WHEN v.vote_type = 'downvote' THEN 1 END),
+    CURRENT_TIMESTAMP
+FROM Startup s
+LEFT JOIN Vote v ON s.startup_id = v.startup_id
+GROUP BY s.startup_id, s.name;
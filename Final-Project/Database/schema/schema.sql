@@ -40,6 +40,7 @@ CREATE TABLE Startup (
     website VARCHAR(255),
     social_media VARCHAR(255),
     created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+    modified_date DATETIME NULL,
     owner_user_id INT NOT NULL,
     category_id INT NOT NULL,
     CONSTRAINT fk_startup_owner 
@@ -55,8 +56,11 @@ CREATE TABLE Startup (
 
 CREATE INDEX idx_startup_name ON Startup(name);
 CREATE INDEX idx_startup_owner ON Startup(owner_user_id);
-CREATE INDEX idx_startup_category ON Startup(category_id);
+-- Startups de una categoría por fecha (también sirve al filtro por categoría)
+CREATE INDEX idx_startup_category_created ON Startup(category_id, created_date);
 CREATE INDEX idx_startup_created ON Startup(created_date);
+-- Búsqueda de texto (SearchService usa MATCH ... AGAINST en modo booleano)
+CREATE FULLTEXT INDEX ft_startup_name_description ON Startup(name, description);
 
 
 
@@ -113,8 +117,10 @@ CREATE TABLE Comment (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE INDEX idx_comment_user ON Comment(user_id);
-CREATE INDEX idx_comment_startup ON Comment(startup_id);
-CREATE INDEX idx_comment_date ON Comment(created_date);
+-- Listado por startup paginado por cursor (created_date, comment_id)
+CREATE INDEX idx_comment_startup_created ON Comment(startup_id, created_date, comment_id);
+-- Comentarios recientes de todas las startups y ventana de trending
+CREATE INDEX idx_comment_created ON Comment(created_date, comment_id);
 
 CREATE TABLE Vote (
     vote_id INT PRIMARY KEY AUTO_INCREMENT,
@@ -134,10 +140,55 @@ CREATE TABLE Vote (
         UNIQUE (user_id, startup_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
-CREATE INDEX idx_vote_user ON Vote(user_id);
-CREATE INDEX idx_vote_startup ON Vote(startup_id);
+-- Votos de un usuario: unique_vote_per_user_startup (user_id, startup_id)
+-- Conteos por startup y tipo sin leer la tabla (StartupStats, StartupVoteStats)
+CREATE INDEX idx_vote_startup_type ON Vote(startup_id, vote_type);
+-- Votos recientes: ventana de trending y refresco incremental del snapshot
+CREATE INDEX idx_vote_created ON Vote(created_date, startup_id, vote_type);
 CREATE INDEX idx_vote_type ON Vote(vote_type);
 
+-- Contadores desnormalizados por startup (mantenidos por el backend FastAPI)
+CREATE TABLE StartupStats (
+    startup_id INT PRIMARY KEY,
+    upvotes INT NOT NULL DEFAULT 0,
+    downvotes INT NOT NULL DEFAULT 0,
+    total_votes INT NOT NULL DEFAULT 0,
+    total_comments INT NOT NULL DEFAULT 0,
+    CONSTRAINT fk_stats_startup 
+        FOREIGN KEY (startup_id) 
+        REFERENCES Startup(startup_id) 
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Ranking "trending" precalculado (lo recalcula periódicamente el backend FastAPI)
+CREATE TABLE StartupTrending (
+    startup_id INT PRIMARY KEY,
+    trending_rank INT NOT NULL,
+    score DOUBLE NOT NULL,
+    computed_at DATETIME NOT NULL,
+    CONSTRAINT fk_trending_startup 
+        FOREIGN KEY (startup_id) 
+        REFERENCES Startup(startup_id) 
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE UNIQUE INDEX idx_trending_rank ON StartupTrending(trending_rank);
+
+-- Copia materializada de la vista StartupVoteStats (la refresca incrementalmente el backend FastAPI)
+CREATE TABLE StartupVoteStatsSnapshot (
+    startup_id INT PRIMARY KEY,
+    startup_name VARCHAR(255) NOT NULL,
+    upvotes INT NOT NULL DEFAULT 0,
+    downvotes INT NOT NULL DEFAULT 0,
+    total_votes INT NOT NULL DEFAULT 0,
+    net_votes INT NOT NULL DEFAULT 0,
+    refreshed_at DATETIME NOT NULL,
+    CONSTRAINT fk_vote_stats_snapshot_startup 
+        FOREIGN KEY (startup_id) 
+        REFERENCES Startup(startup_id) 
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 CREATE TABLE UserStartupPartnership (
     user_id INT NOT NULL,
     startup_id INT NOT NULL,
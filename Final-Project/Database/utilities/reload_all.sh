@@ -79,6 +79,9 @@ echo "  - Comments..."
 echo "  - Votes..."
 "$MYSQL_CMD" --sql -u "$MYSQL_USER" -p"$MYSQL_PASSWORD" -D starthub < ../seeds/seed_votes.sql 2>&1 | grep -v "WARNING" | grep "Records:"
 
+echo "  - StartupStats counters..."
+"$MYSQL_CMD" --sql -u "$MYSQL_USER" -p"$MYSQL_PASSWORD" -D starthub < ../schema/backfill_stats.sql 2>&1 | grep -v "WARNING"
+
 echo -e "${GREEN}✓ Seed data loaded${NC}"
 
 # Step 5: Verify tables
@@ -55,6 +55,9 @@ $SQL starthub < ../seeds/seed_comments.sql
 echo "  - Votes..."
 $SQL starthub < ../seeds/seed_votes.sql
 
+echo "  - StartupStats counters..."
+$SQL starthub < ../schema/backfill_stats.sql
+
 echo -e "${GREEN}✓ Seed data loaded${NC}"
 
 echo -e "${YELLOW}[5/7] Verifying tables...${NC}"
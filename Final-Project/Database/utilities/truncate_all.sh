@@ -50,6 +50,9 @@ echo -e "${YELLOW}Truncating all tables...${NC}"
 "$MYSQL_CMD" --sql -u "$MYSQL_USER" -p"$MYSQL_PASSWORD" -D starthub << 'EOF' 2>&1 | grep -v "WARNING"
 SET FOREIGN_KEY_CHECKS = 0;
 
+TRUNCATE TABLE StartupTrending;
+TRUNCATE TABLE StartupVoteStatsSnapshot;
+TRUNCATE TABLE StartupStats;
 TRUNCATE TABLE Vote;
 TRUNCATE TABLE Comment;
 TRUNCATE TABLE UserStartupPartnership;
@@ -4,5 +4,5 @@ SELECT COUNT(*) FROM Comment;
 SELECT COUNT(*) FROM Vote;
 SELECT COUNT(*) FROM UserStartupPartnership;
 
-SELECT * FROM StartupVoteStats ORDER BY total_votes DESC LIMIT 10;
+SELECT * FROM StartupVoteStatsSnapshot ORDER BY total_votes DESC LIMIT 10;
 SELECT * FROM StartupDetails ORDER BY created_date DESC LIMIT 10;
\ No newline at end of file
@@ -21,8 +21,22 @@ SELECT * FROM StartupVoteStats LIMIT 10;
 SELECT 
     sd.startup_name,
     sd.category,
-    sv.total_upvotes,
-    sv.total_downvotes
+    sv.upvotes,
+    sv.downvotes
 FROM StartupDetails sd
-LEFT JOIN StartupVoteStats sv ON sd.startup_id = sv.startup_id
-ORDER BY sv.total_upvotes DESC;
+LEFT JOIN StartupVoteStatsSnapshot sv ON sd.startup_id = sv.startup_id
+ORDER BY sv.upvotes DESC;
+
+-- 5. Materialized snapshot vs. view: rows that differ (empty = in sync;
+--    right after a vote it may lag by up to VOTE_STATS_REFRESH_SECONDS)
+SELECT 
+    v.startup_id,
+    v.upvotes, snap.upvotes AS snapshot_upvotes,
+    v.downvotes, snap.downvotes AS snapshot_downvotes,
+    snap.refreshed_at
+FROM StartupVoteStats v
+LEFT JOIN StartupVoteStatsSnapshot snap ON v.startup_id = snap.startup_id
+WHERE snap.startup_id IS NULL
+   OR snap.upvotes <> v.upvotes
+   OR snap.downvotes <> v.downvotes
+   OR snap.startup_name <> v.startup_name;
@@ -622,42 +622,38 @@ export class HomePage {
         const res = await fetch(`${DATA_API}/startups/?skip=0&limit=50`);
         if (!res.ok) throw new Error('No se pudieron cargar las startups');
         const items = await res.json();
+        const voteCounts = await this.fetchVoteCounts(items.map(s => s.startup_id));
+
+        return items.map((s) => ({
+            id: s.startup_id,
+            name: s.name,
+            description: s.description || '',
+            email: s.email || '',
+            website: s.website || '',
+            social_media: s.social_media || '',
+            category: s.category_name || (s.category_id ? `Categoría ${s.category_id}` : 'General'),
+            created_date: s.created_date || new Date().toISOString(),
+            votes: voteCounts[s.startup_id] || 0,
+        }));
+    }
 
-        const withVotes = await Promise.all(items.map(async (s) => {
-            try {
-                const vc = await fetch(`${DATA_API}/votes/count/${s.startup_id}`);
-                let votes = 0;
-                if (vc.ok) {
-                    const data = await vc.json();
-                    votes = (data.upvotes || 0) - (data.downvotes || 0);
-                }
-                return {
-                    id: s.startup_id,
-                    name: s.name,
-                    description: s.description || '',
-                    email: s.email || '',
-                    website: s.website || '',
-                    social_media: s.social_media || '',
-                    category: s.category_name || (s.category_id ? `Categoría ${s.category_id}` : 'General'),
-                    created_date: s.created_date || new Date().toISOString(),
-                    votes,
-                };
-            } catch (e) {
-                console.error('Error loading votes for startup:', s.startup_id, e);
-                return {
-                    id: s.startup_id,
-                    name: s.name,
-                    description: s.description || '',
-                    email: s.email || '',
-                    website: s.website || '',
-                    social_media: s.social_media || '',
-                    category: s.category_name || (s.category_id ? `Categoría ${s.category_id}` : 'General'),
-                    created_date: s.created_date || new Date().toISOString(),
-                    votes: 0,
-                };
+    // Un solo request para los conteos de todas las tarjetas (antes era uno por startup)
+    async fetchVoteCounts(startupIds) {
+        const counts = {};
+        if (startupIds.length === 0) return counts;
+
+        try {
+            const res = await fetch(`${DATA_API}/votes/counts?ids=${startupIds.join(',')}`);
+            if (res.ok) {
+                const data = await res.json();
+                data.forEach(vc => {
+                    counts[vc.startup_id] = (vc.upvotes || 0) - (vc.downvotes || 0);
+                });
             }
-        }));
-        return withVotes;
+        } catch (e) {
+            console.error('Error loading vote counts:', e);
+        }
+        return counts;
     }
 
     renderStartups(startups) {
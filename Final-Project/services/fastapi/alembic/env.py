@@ -12,8 +12,11 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from app.core.config import get_settings  # noqa: E402
 from app.db.base import Base  # noqa: E402
+from app.services.search_backend import reset_search_backends  # noqa: E402
 # Import models so that Base.metadata is populated
-from app.models import comment, vote, user, startup  # noqa: F401,E402
+from app.models import (  # noqa: F401,E402
+    comment, vote, user, startup, startup_stats, startup_trending, startup_vote_stats,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -65,6 +68,8 @@ def run_migrations_online() -> None:
 
         with context.begin_transaction():
             context.run_migrations()
+    # Migraciones ejecutadas dentro del proceso de la app: el índice pudo cambiar
+    reset_search_backends()
 
 
 if context.is_offline_mode():
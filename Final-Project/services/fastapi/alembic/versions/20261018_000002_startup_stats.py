@@ -0,0 +1,44 @@
+"""startup stats counters
+
+Revision ID: 20261018_000002
+Revises: 20251118_000001
+Create Date: 2026-10-18 00:00:02
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_000002'
+down_revision = '20251118_000001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'StartupStats',
+        sa.Column('startup_id', sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column('upvotes', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('downvotes', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('total_votes', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('total_comments', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.ForeignKeyConstraint(['startup_id'], ['Startup.startup_id'], ondelete='CASCADE'),
+    )
+
+    # Backfill: cada agregado se calcula de forma independiente por startup
+    op.execute(
+        """
+        INSERT INTO StartupStats (startup_id, upvotes, downvotes, total_votes, total_comments)
+        SELECT s.startup_id,
+               (SELECT COUNT(*) FROM Vote v WHERE v.startup_id = s.startup_id AND v.vote_type = 'upvote'),
+               (SELECT COUNT(*) FROM Vote v WHERE v.startup_id = s.startup_id AND v.vote_type = 'downvote'),
+               (SELECT COUNT(*) FROM Vote v WHERE v.startup_id = s.startup_id),
+               (SELECT COUNT(*) FROM Comment c WHERE c.startup_id = s.startup_id)
+        FROM Startup s
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('StartupStats')
@@ -0,0 +1,36 @@
+"""startup full-text index
+
+Revision ID: 20261018_000003
+Revises: 20261018_000002
+Create Date: 2026-10-18 00:00:03
+
+"""
+from alembic import op
+
+from app.services.search_backend import SQLiteFTS5Backend
+
+# revision identifiers, used by Alembic.
+revision = '20261018_000003'
+down_revision = '20261018_000002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        # InnoDB mantiene el índice FULLTEXT por sí mismo; no hacen falta triggers
+        op.execute("CREATE FULLTEXT INDEX ft_startup_name_description ON Startup(name, description)")
+    elif dialect == 'sqlite':
+        # Mismo DDL que usan los tests y las bases creadas con create_all
+        for statement in SQLiteFTS5Backend.DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.execute("DROP INDEX ft_startup_name_description ON Startup")
+    elif dialect == 'sqlite':
+        for statement in SQLiteFTS5Backend.DROP_DDL:
+            op.execute(statement)
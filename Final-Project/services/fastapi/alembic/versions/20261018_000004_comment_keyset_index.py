@@ -0,0 +1,25 @@
+"""comment keyset pagination index
+
+Revision ID: 20261018_000004
+Revises: 20261018_000003
+Create Date: 2026-10-18 00:00:04
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261018_000004'
+down_revision = '20261018_000003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Comentarios de una startup paginados por cursor (created_date, comment_id)
+    op.create_index(
+        'idx_comment_startup_created', 'Comment', ['startup_id', 'created_date', 'comment_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_comment_startup_created', table_name='Comment')
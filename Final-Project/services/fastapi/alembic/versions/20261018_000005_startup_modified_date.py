@@ -0,0 +1,31 @@
+"""startup created_date and modified_date for conditional requests
+
+Revision ID: 20261018_000005
+Revises: 20261018_000004
+Create Date: 2026-10-18 00:00:05
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_000005'
+down_revision = '20261018_000004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # La tabla Startup mínima de la migración inicial no tenía created_date (sí el modelo y schema.sql);
+    # la usan el ETag y idx_startup_category_created de 20261018_000008
+    op.add_column(
+        'Startup',
+        sa.Column('created_date', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    )
+    # Marca de la última edición: junto con created_date forma el ETag de la startup
+    op.add_column('Startup', sa.Column('modified_date', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('Startup', 'modified_date')
+    op.drop_column('Startup', 'created_date')
@@ -0,0 +1,33 @@
+"""startup trending ranking table
+
+Revision ID: 20261018_000006
+Revises: 20261018_000005
+Create Date: 2026-10-18 00:00:06
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_000006'
+down_revision = '20261018_000005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sin backfill: el job de trending la llena al arrancar el backend
+    op.create_table(
+        'StartupTrending',
+        sa.Column('startup_id', sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column('trending_rank', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['startup_id'], ['Startup.startup_id'], ondelete='CASCADE'),
+    )
+    op.create_index('idx_trending_rank', 'StartupTrending', ['trending_rank'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_trending_rank', table_name='StartupTrending')
+    op.drop_table('StartupTrending')
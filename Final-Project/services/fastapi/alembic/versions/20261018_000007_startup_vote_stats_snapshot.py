@@ -0,0 +1,52 @@
+"""materialized StartupVoteStats snapshot
+
+Revision ID: 20261018_000007
+Revises: 20261018_000006
+Create Date: 2026-10-18 00:00:07
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_000007'
+down_revision = '20261018_000006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'StartupVoteStatsSnapshot',
+        sa.Column('startup_id', sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column('startup_name', sa.String(length=255), nullable=False),
+        sa.Column('upvotes', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('downvotes', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('total_votes', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('net_votes', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['startup_id'], ['Startup.startup_id'], ondelete='CASCADE'),
+    )
+
+    # Backfill con el mismo SELECT de la vista StartupVoteStats; el job lo
+    # reconstruye igualmente en el primer refresco de cada worker
+    op.execute(
+        """
+        INSERT INTO StartupVoteStatsSnapshot
+            (startup_id, startup_name, upvotes, downvotes, total_votes, net_votes, refreshed_at)
+        SELECT s.startup_id,
+               s.name,
+               COUNT(CASE WHEN v.vote_type = 'upvote' THEN 1 END),
+               COUNT(CASE WHEN v.vote_type = 'downvote' THEN 1 END),
+               COUNT(v.vote_id),
+               COUNT(CASE WHEN v.vote_type = 'upvote' THEN 1 END) - COUNT(CASE WHEN v.vote_type = 'downvote' THEN 1 END),
+               CURRENT_TIMESTAMP
+        FROM Startup s
+        LEFT JOIN Vote v ON s.startup_id = v.startup_id
+        GROUP BY s.startup_id, s.name
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('StartupVoteStatsSnapshot')
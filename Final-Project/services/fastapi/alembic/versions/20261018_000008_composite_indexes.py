@@ -0,0 +1,40 @@
+"""composite indexes for hot queries
+
+Revision ID: 20261018_000008
+Revises: 20261018_000007
+Create Date: 2026-10-18 00:00:08
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_000008'
+down_revision = '20261018_000007'
+branch_labels = None
+depends_on = None
+
+# (nombre, tabla, columnas); tests/test_query_plans.py verifica que las consultas los usan
+INDEXES = (
+    # Conteos por startup y tipo (VoteRepository, StartupStats, StartupVoteStats) sin leer la tabla
+    ('idx_vote_startup_type', 'Vote', ['startup_id', 'vote_type']),
+    # Votos recientes: ventana de trending y refresco incremental del snapshot
+    ('idx_vote_created', 'Vote', ['created_date', 'startup_id', 'vote_type']),
+    # Comentarios recientes de todas las startups, paginados por (created_date, comment_id)
+    ('idx_comment_created', 'Comment', ['created_date', 'comment_id']),
+    # "Mis startups"
+    ('idx_startup_owner', 'Startup', ['owner_user_id']),
+    # Startups de una categoría por fecha
+    ('idx_startup_category_created', 'Startup', ['category_id', 'created_date']),
+)
+
+
+def upgrade() -> None:
+    # Startup.created_date viene de 20261018_000005: si falta una columna, create_index falla
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
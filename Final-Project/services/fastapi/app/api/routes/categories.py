@@ -1,17 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.db.session import get_db
+from app.core.http_cache import conditional_get
 from app.schemas.startup_crud import CategoryOut
-from app.models.category import Category
+from app.services.category_catalog import get_category_catalog
 
 router = APIRouter()
 
 @router.get("/", response_model=List[CategoryOut])
-def list_categories(db: Session = Depends(get_db)):
+def list_categories(request: Request, response: Response, db: Session = Depends(get_db)):
     try:
-        categories = db.query(Category).all()
-        return categories
+        # Catálogo en memoria: sin consulta mientras la instantánea esté vigente
+        snapshot = get_category_catalog().snapshot(db)
+        not_modified = conditional_get(request, response, snapshot.version)
+        if not_modified:
+            return not_modified
+        return list(snapshot.ordered)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al cargar categorías: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error al cargar categorías: {str(e)}")
@@ -1,8 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.concurrency import InThreadpool
+from app.db.session import get_db, get_read_db
 from app.schemas.comment import CommentCreate, CommentOut, CommentUpdate
-from app.services.comment_service import CommentService
+from app.services.comment_service import AsyncCommentService, CommentService
+from app.core.http_cache import conditional_get
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import fast_json
 
 router = APIRouter()
 
@@ -11,6 +16,13 @@ def get_comment_service(db: Session = Depends(get_db)):
     return CommentService(db)
 
 
+def get_async_comment_service(db: AsyncSession | Session = Depends(get_read_db)):
+    if isinstance(db, AsyncSession):
+        return AsyncCommentService(db)
+    # Sin engine asíncrono (SQLite en memoria): servicio síncrono en el threadpool
+    return InThreadpool(CommentService(db))
+
+
 @router.post("/", response_model=CommentOut, status_code=201)
 def create_comment(
     payload: CommentCreate,
@@ -27,13 +39,26 @@ def create_comment(
 
 
 @router.get("/", response_model=list[CommentOut])
-def list_comments(
+async def list_comments(
+    request: Request,
+    response: Response,
     startup_id: int | None = Query(default=None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    service: CommentService = Depends(get_comment_service),
+    cursor: str | None = Query(default=None, description="Cursor de la cabecera X-Next-Cursor (reemplaza a skip)"),
+    service: AsyncCommentService = Depends(get_async_comment_service),
 ):
-    return service.list(startup_id, skip=skip, limit=limit)
+    try:
+        version = await service.list_version(startup_id, skip=skip, limit=limit, cursor=cursor)
+        not_modified = conditional_get(request, response, version)
+        if not_modified:
+            return not_modified
+        comments, next_cursor = await service.list_page(startup_id, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return fast_json(comments, response)
 
 
 @router.put("/{comment_id}", response_model=CommentOut)
@@ -0,0 +1,40 @@
+"""Endpoints internos entre servicios (no para el frontend).
+
+Protegidos con el token compartido ``INTERNAL_API_TOKEN`` en la cabecera
+``X-Internal-Token``; sin token configurado responden 404, como si no existieran.
+"""
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import get_db
+from app.models.startup import Startup
+from app.services.read_cache import invalidate_startup
+from app.services.user_names import get_user_name_resolver
+
+router = APIRouter()
+
+
+def require_internal_token(x_internal_token: str | None = Header(default=None)):
+    expected = get_settings().internal_api_token
+    if not expected:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not x_internal_token or not hmac.compare_digest(x_internal_token, expected):
+        raise HTTPException(status_code=403, detail="Token interno inválido")
+
+
+@router.post("/users/{user_id}/invalidate", status_code=204, dependencies=[Depends(require_internal_token)])
+def invalidate_user(user_id: int, db: Session = Depends(get_db)):
+    """El servicio de autenticación editó el perfil: olvidar el nombre en caché.
+
+    También se invalida el detalle en caché de sus startups, que incluye ``owner_name``.
+    Solo afecta al worker que atiende la petición; los demás esperan al TTL
+    de la caché de nombres.
+    """
+    get_user_name_resolver().invalidate(user_id)
+    for startup_id in db.execute(select(Startup.startup_id).where(Startup.owner_user_id == user_id)).scalars():
+        invalidate_startup(startup_id)
+    return None
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 
-from app.db.session import get_db
+from app.core.concurrency import InThreadpool
+from app.db.session import get_db, get_read_db
+from app.core.responses import fast_json
 from app.models.startup import Startup
 from app.schemas.search import (
     StartupSearchRequest, 
@@ -12,15 +15,22 @@ from app.schemas.search import (
     SearchSortBy,
     AutocompleteResult
 )
-from app.services.search_service import SearchService
+from app.services.search_backend import get_async_search_backend
+from app.services.search_service import AsyncSearchService, SearchService
 
 router = APIRouter()
 
 def get_search_service(db: Session = Depends(get_db)):
     return SearchService(db)
 
+async def get_async_search_service(db: AsyncSession | Session = Depends(get_read_db)):
+    if isinstance(db, AsyncSession):
+        return AsyncSearchService(db, await get_async_search_backend(db.bind))
+    # Sin engine asíncrono (SQLite en memoria): servicio síncrono en el threadpool
+    return InThreadpool(SearchService(db))
+
 @router.get("/search", response_model=SearchResponse)
-def search_startups(
+async def search_startups(
     q: Optional[str] = Query(None, description="Término de búsqueda"),
     categorias: Optional[str] = Query(None, description="Filtrar por categorías"),
     min_votos: Optional[int] = Query(None, ge=0, description="Mínimo número de votos"),
@@ -28,7 +38,8 @@ def search_startups(
     sort_by: SearchSortBy = Query(SearchSortBy.RELEVANCIA, description="Criterio de ordenamiento"),
     page: int = Query(1, ge=1, description="Página"),
     limit: int = Query(50, ge=1, le=100, description="Resultados por página"),
-    service: SearchService = Depends(get_search_service)
+    cursor: Optional[str] = Query(None, description="Cursor next_cursor de la respuesta anterior (reemplaza a page)"),
+    service: AsyncSearchService = Depends(get_async_search_service)
 ):
     print(f"🔍 DEBUG: categorias parameter = {categorias} (type: {type(categorias)})")  # ← DEBUG    
     """Búsqueda avanzada de startups con todos los filtros"""
@@ -52,10 +63,14 @@ def search_startups(
         filters=filters,
         sort_by=sort_by,
         skip=skip,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
-    
-    return service.search_startups(search_request)
+
+    try:
+        return fast_json(await service.search_startups(search_request))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/autocomplete", response_model=List[AutocompleteResult])
 def autocomplete_startups(
@@ -79,14 +94,12 @@ def get_startup_detail(
     if not result:
         raise HTTPException(status_code=404, detail="Startup no encontrada")
     
-    startup, total_comentarios, total_votos = result
-    
     return StartupSearchResult(
-        startup_id=startup.startup_id,
-        name=startup.name,
-        description=startup.description or "",
-        owner_user_id=startup.owner_user_id,
-        category_id=startup.category_id,
-        total_votos=total_votos,
-        total_comentarios=total_comentarios
+        startup_id=result.startup_id,
+        name=result.name,
+        description=result.description or "",
+        owner_user_id=result.owner_user_id,
+        category_id=result.category_id,
+        total_votos=result.total_votos,
+        total_comentarios=result.total_comentarios
     )
\ No newline at end of file
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.db.session import get_db
-from app.schemas.startup_crud import StartupCreate, StartupOut, StartupUpdate, StartupWithStats, CategoryOut
+from app.core.http_cache import conditional_get
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import fast_json
+from app.schemas.startup_crud import StartupCreate, StartupOut, StartupUpdate, StartupWithStats, CategoryOut, TrendingStartupOut
 from app.services.startup_service import StartupService
 
 router = APIRouter()
@@ -23,25 +26,55 @@ def create_startup(
 
 @router.get("/", response_model=List[StartupOut])
 def list_startups(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Cursor de la cabecera X-Next-Cursor (reemplaza a skip)"),
     service: StartupService = Depends(get_startup_service),
 ):
-    return service.list(skip=skip, limit=limit)
+    try:
+        not_modified = conditional_get(request, response, service.list_version(skip=skip, limit=limit, cursor=cursor))
+        if not_modified:
+            return not_modified
+        startups, next_cursor = service.list_page(skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return fast_json(startups, response)
 
 @router.get("/my-startups", response_model=List[StartupOut])
 def list_my_startups(
     user_id: int = Query(..., description="ID del usuario propietario"),
     service: StartupService = Depends(get_startup_service),
 ):
-    return service.list_by_owner(user_id)
+    return fast_json(service.list_by_owner(user_id))
+
+@router.get("/trending", response_model=List[TrendingStartupOut])
+def list_trending_startups(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    service: StartupService = Depends(get_startup_service),
+):
+    """Ranking trending precalculado (se recalcula cada TRENDING_REFRESH_SECONDS)."""
+    return fast_json(service.list_trending(skip=skip, limit=limit))
 
 @router.get("/{startup_id}", response_model=StartupOut)
 def get_startup(
     startup_id: int,
+    request: Request,
+    response: Response,
     service: StartupService = Depends(get_startup_service),
 ):
-    startup = service.get(startup_id)
+    version = service.version(startup_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Startup no encontrada")
+    not_modified = conditional_get(request, response, version)
+    if not_modified:
+        return not_modified
+    # El cuerpo debe corresponder al ETag: una entrada de caché de otra versión se relee
+    startup = service.get(startup_id, version)
     if not startup:
         raise HTTPException(status_code=404, detail="Startup no encontrada")
     return startup
@@ -1,20 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
+from app.core.config import get_settings
 from app.db.session import get_db
-from app.schemas.vote import VoteCreate, VoteOut, VoteCount
+from app.schemas.vote import VoteCreate, VoteOut, VoteCount, VoteQueued
+from app.services.vote_queue import get_vote_queue
 from app.services.vote_service import VoteService
 
 router = APIRouter()
 
+# Coincide con el límite máximo de GET /startups/
+MAX_BULK_COUNT_IDS = 200
+
 
 def get_vote_service(db: Session = Depends(get_db)):
-    return VoteService(db)
+    queue = get_vote_queue() if get_settings().vote_buffer_enabled else None
+    return VoteService(db, queue=queue)
 
 
-@router.post("/", response_model=VoteOut)
+@router.post("/", response_model=VoteOut | VoteQueued)
 def upsert_vote(payload: VoteCreate, user_id: int = Query(...), response: Response = None, service: VoteService = Depends(get_vote_service)):
     try:
         vote, created = service.upsert(user_id, payload)
+        if vote is None:
+            # Cola de votos activa: se escribirá en el próximo volcado
+            if response is not None:
+                response.status_code = 202
+            return VoteQueued(user_id=user_id, **payload.model_dump())
         if created and response is not None:
             # Devolver 201 en creación; FastAPI serializa con VoteOut
             response.status_code = 201
@@ -25,6 +36,20 @@ def upsert_vote(payload: VoteCreate, user_id: int = Query(...), response: Respon
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/counts", response_model=list[VoteCount])
+def count_votes_bulk(
+    ids: str = Query(..., description="IDs de startups separados por coma, ej. 1,2,3"),
+    service: VoteService = Depends(get_vote_service),
+):
+    try:
+        startup_ids = [int(sid.strip()) for sid in ids.split(",") if sid.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Formato de ids inválido")
+    if len(startup_ids) > MAX_BULK_COUNT_IDS:
+        raise HTTPException(status_code=400, detail=f"Máximo {MAX_BULK_COUNT_IDS} ids por consulta")
+    return service.count_many(startup_ids)
+
+
 @router.get("/count/{startup_id}", response_model=VoteCount)
 def count_votes(startup_id: int, service: VoteService = Depends(get_vote_service)):
     return service.count(startup_id)
@@ -0,0 +1,216 @@
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+
+_MISSING = object()
+
+# Generaciones de invalidación repartidas por hash de clave: acotadas en memoria
+# y sin falsos negativos (a lo sumo se descarta algún set de otra clave)
+GENERATION_STRIPES = 1024
+
+
+class CacheBackend(ABC):
+    """Interfaz de caché clave-valor con TTL y contadores de aciertos/fallos.
+
+    ``LRUCache`` es la implementación en proceso; ``RedisCache`` comparte la
+    caché entre workers. Los servicios solo usan ``get_or_set`` y ``delete``.
+
+    Cada ``delete``/``clear`` sube la generación de las claves afectadas; un
+    ``get_or_set`` cuyo ``loader`` empezó antes de la invalidación no guarda
+    su resultado (podría ser el valor anterior a la escritura).
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._generations = [0] * GENERATION_STRIPES
+        self._generation_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, *keys: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def generation(self, key: Hashable) -> int:
+        return self._generations[hash(key) % GENERATION_STRIPES]
+
+    def _invalidate(self, keys: Optional[Iterable[Hashable]] = None) -> None:
+        """Sube la generación de ``keys`` (de todas si es None); el llamador tiene el lock."""
+        if keys is None:
+            self._generations = [generation + 1 for generation in self._generations]
+            return
+        for key in keys:
+            self._generations[hash(key) % GENERATION_STRIPES] += 1
+
+    def set_if_current(self, key: Hashable, value: Any, generation: int, ttl: Optional[float] = None) -> bool:
+        """``set`` solo si la clave no se invalidó desde que se leyó ``generation``."""
+        with self._generation_lock:
+            if self.generation(key) != generation:
+                return False
+            self.set(key, value, ttl)
+            return True
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Lectura a través de la caché: en un fallo llama a ``loader`` y guarda el resultado.
+
+        ``None`` (p. ej. entidad inexistente) no se guarda, para que un 404 no
+        sobreviva a la creación posterior del recurso.
+        """
+        generation = self.generation(key)
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = loader()
+        if value is not None:
+            self.set_if_current(key, value, generation, ttl)
+        return value
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class LRUCache(CacheBackend):
+    """Caché LRU acotada y segura entre hilos, con TTL opcional por entrada."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        # Mismo lock para datos y generaciones: comprobar y guardar es atómico
+        self._lock = self._generation_lock
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[1] is not None and entry[1] <= time.monotonic():
+                # Expirada: se descarta en la lectura, sin hilo de limpieza
+                del self._data[key]
+                entry = _MISSING
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def set_if_current(self, key: Hashable, value: Any, generation: int, ttl: Optional[float] = None) -> bool:
+        with self._lock:
+            if self.generation(key) != generation:
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, *keys: Hashable) -> None:
+        with self._lock:
+            self._invalidate(keys)
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidate()
+            self._data.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self), "maxsize": self.maxsize, "ttl": self.ttl}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache(CacheBackend):
+    """Caché compartida sobre un cliente compatible con ``redis.Redis``.
+
+    Los valores se serializan con pickle; las claves llevan ``prefix`` para
+    que ``clear`` no borre datos ajenos. Las generaciones son del proceso: un
+    ``get_or_set`` de otro worker que compita con la invalidación lo acota el TTL.
+    """
+
+    def __init__(self, client, prefix: str = "starthub:", ttl: Optional[float] = None):
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}{key}"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        raw = self.client.get(self._key(key))
+        if raw is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(raw)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self.client.set(self._key(key), pickle.dumps(value), px=int(ttl * 1000) if ttl else None)
+
+    def delete(self, *keys: Hashable) -> None:
+        with self._generation_lock:
+            self._invalidate(keys)
+        if keys:
+            self.client.delete(*(self._key(key) for key in keys))
+
+    def clear(self) -> None:
+        with self._generation_lock:
+            self._invalidate()
+        keys = list(self.client.scan_iter(f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class NullCache(CacheBackend):
+    """Caché desactivada: toda lectura va a la base de datos."""
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+
+    def delete(self, *keys: Hashable) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
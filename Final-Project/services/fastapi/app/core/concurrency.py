@@ -0,0 +1,26 @@
+"""Servicios síncronos detrás de una interfaz asíncrona.
+
+Las rutas ``async def`` de lectura usan servicios sobre ``AsyncSession``.
+Cuando no hay engine asíncrono (SQLite ``:memory:``), reciben el servicio
+síncrono envuelto en ``InThreadpool``: cada método se vuelve una corrutina
+que lo ejecuta en el threadpool, fuera del event loop.
+"""
+import functools
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+
+class InThreadpool:
+    def __init__(self, service: Any):
+        self._service = service
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._service, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await run_in_threadpool(attr, *args, **kwargs)
+        return call
@@ -21,8 +21,52 @@ try:
     class Settings(BaseSettings):
         # database_url may be omitted; fallback to in-memory SQLite for tests/CI/local dev when absent.
         database_url: str | None = None
+        # URL para el engine asíncrono; por defecto DATABASE_URL con aiomysql/aiosqlite.
+        # Con SQLite en memoria no hay engine asíncrono: las rutas async usan la sesión síncrona
+        async_database_url: str | None = None
         app_debug: bool = False
         cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000"  # Comma-separated list
+        # Backend de búsqueda de texto: auto (según dialecto) | mysql | sqlite | like
+        search_backend: str = "auto"
+        # Índice invertido en memoria (para despliegues sin FULLTEXT/FTS5)
+        search_index_enabled: bool = False
+        # Pool de conexiones (solo motores con servidor; SQLite usa el pool por defecto).
+        # Conexiones máximas por worker de uvicorn = pool_size + max_overflow.
+        pool_size: int = 5
+        max_overflow: int = 10
+        pool_timeout: float = 30
+        pool_recycle: int = 1800
+        pool_pre_ping: bool = True
+        # Cola de votos write-behind: POST /votes/ encola y una tarea de fondo
+        # vuelca cada flush_ms o al llegar a max_items; max_lag_ms acota el retraso.
+        vote_buffer_enabled: bool = False
+        vote_buffer_flush_ms: int = 200
+        vote_buffer_max_items: int = 500
+        vote_buffer_max_lag_ms: int = 2000
+        # Caché de lectura (detalle de startup, conteos de votos): memory | redis | none
+        cache_backend: str = "memory"
+        cache_url: str = "redis://localhost:6379/0"
+        cache_ttl_seconds: float = 30
+        cache_max_entries: int = 10000
+        # Motor de autocompletado en memoria: recarga completa periódica (0 = solo cambios del propio worker)
+        autocomplete_ttl_seconds: float = 300
+        # Catálogo de categorías en memoria: recarga periódica (0 = solo al arrancar o ante ids desconocidos)
+        category_catalog_ttl_seconds: float = 300
+        # Caché LRU de nombres de usuario (autores de comentarios, dueños de startups)
+        user_name_cache_size: int = 10000
+        user_name_cache_ttl_seconds: float = 300
+        # Token compartido para /api/v1/internal/* (vacío = endpoints internos desactivados)
+        internal_api_token: str = ""
+        # Con app_debug: aviso de posible N+1 al superar estas sentencias SQL por petición (0 = sin aviso)
+        query_count_warn_threshold: int = 25
+        # Ranking trending: recálculo periódico en el worker líder (0 = sin job), vida media de votos/comentarios y tamaño
+        trending_refresh_seconds: float = 300
+        trending_half_life_hours: float = 48
+        trending_top_n: int = 1000
+        # Snapshot de StartupVoteStats: refresco incremental (0 = sin job) y origen de los conteos
+        # de VoteService ("live" agrega Vote y no arranca el job, "snapshot" lee StartupVoteStatsSnapshot)
+        vote_stats_refresh_seconds: float = 60
+        vote_counts_source: str = "live"
 
         # Pydantic Settings v2 config
         model_config = SettingsConfigDict(
@@ -43,8 +87,35 @@ except ModuleNotFoundError:
 
     class Settings(BaseModel):
         database_url: str
+        async_database_url: str | None = None
         app_debug: bool = False
         cors_origins: str = "*"
+        search_backend: str = "auto"
+        search_index_enabled: bool = False
+        pool_size: int = 5
+        max_overflow: int = 10
+        pool_timeout: float = 30
+        pool_recycle: int = 1800
+        pool_pre_ping: bool = True
+        vote_buffer_enabled: bool = False
+        vote_buffer_flush_ms: int = 200
+        vote_buffer_max_items: int = 500
+        vote_buffer_max_lag_ms: int = 2000
+        cache_backend: str = "memory"
+        cache_url: str = "redis://localhost:6379/0"
+        cache_ttl_seconds: float = 30
+        cache_max_entries: int = 10000
+        autocomplete_ttl_seconds: float = 300
+        category_catalog_ttl_seconds: float = 300
+        user_name_cache_size: int = 10000
+        user_name_cache_ttl_seconds: float = 300
+        internal_api_token: str = ""
+        query_count_warn_threshold: int = 25
+        trending_refresh_seconds: float = 300
+        trending_half_life_hours: float = 48
+        trending_top_n: int = 1000
+        vote_stats_refresh_seconds: float = 60
+        vote_counts_source: str = "live"
 
     _cached: Settings | None = None
 
@@ -58,5 +129,38 @@ except ModuleNotFoundError:
                 )
             debug = os.getenv("APP_DEBUG", "false").lower() == "true"
             cors = os.getenv("CORS_ORIGINS", "*")
-            _cached = Settings(database_url=db_url, app_debug=debug, cors_origins=cors)
+            search_backend = os.getenv("SEARCH_BACKEND", "auto")
+            search_index = os.getenv("SEARCH_INDEX_ENABLED", "false").lower() == "true"
+            _cached = Settings(
+                database_url=db_url,
+                async_database_url=os.getenv("ASYNC_DATABASE_URL"),
+                app_debug=debug,
+                cors_origins=cors,
+                search_backend=search_backend,
+                search_index_enabled=search_index,
+                pool_size=int(os.getenv("POOL_SIZE", "5")),
+                max_overflow=int(os.getenv("MAX_OVERFLOW", "10")),
+                pool_timeout=float(os.getenv("POOL_TIMEOUT", "30")),
+                pool_recycle=int(os.getenv("POOL_RECYCLE", "1800")),
+                pool_pre_ping=os.getenv("POOL_PRE_PING", "true").lower() == "true",
+                vote_buffer_enabled=os.getenv("VOTE_BUFFER_ENABLED", "false").lower() == "true",
+                vote_buffer_flush_ms=int(os.getenv("VOTE_BUFFER_FLUSH_MS", "200")),
+                vote_buffer_max_items=int(os.getenv("VOTE_BUFFER_MAX_ITEMS", "500")),
+                vote_buffer_max_lag_ms=int(os.getenv("VOTE_BUFFER_MAX_LAG_MS", "2000")),
+                cache_backend=os.getenv("CACHE_BACKEND", "memory"),
+                cache_url=os.getenv("CACHE_URL", "redis://localhost:6379/0"),
+                cache_ttl_seconds=float(os.getenv("CACHE_TTL_SECONDS", "30")),
+                cache_max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "10000")),
+                autocomplete_ttl_seconds=float(os.getenv("AUTOCOMPLETE_TTL_SECONDS", "300")),
+                category_catalog_ttl_seconds=float(os.getenv("CATEGORY_CATALOG_TTL_SECONDS", "300")),
+                user_name_cache_size=int(os.getenv("USER_NAME_CACHE_SIZE", "10000")),
+                user_name_cache_ttl_seconds=float(os.getenv("USER_NAME_CACHE_TTL_SECONDS", "300")),
+                internal_api_token=os.getenv("INTERNAL_API_TOKEN", ""),
+                query_count_warn_threshold=int(os.getenv("QUERY_COUNT_WARN_THRESHOLD", "25")),
+                trending_refresh_seconds=float(os.getenv("TRENDING_REFRESH_SECONDS", "300")),
+                trending_half_life_hours=float(os.getenv("TRENDING_HALF_LIFE_HOURS", "48")),
+                trending_top_n=int(os.getenv("TRENDING_TOP_N", "1000")),
+                vote_stats_refresh_seconds=float(os.getenv("VOTE_STATS_REFRESH_SECONDS", "60")),
+                vote_counts_source=os.getenv("VOTE_COUNTS_SOURCE", "live"),
+            )
         return _cached
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Peticiones condicionales (ETag / Last-Modified) para endpoints de lectura.
+
+Cada endpoint obtiene primero la *versión* de lo que va a devolver con una
+consulta mínima (ids y fechas de modificación de las filas de la página, sin
+joins ni contenido). Si coincide con ``If-None-Match`` (o no es posterior a
+``If-Modified-Since``) se responde 304 sin cargar ni serializar el cuerpo.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, NamedTuple, Optional
+
+from fastapi import Request, Response
+
+# Fuerza a los navegadores a revalidar siempre: la respuesta se reutiliza solo tras un 304
+CACHE_CONTROL = "no-cache"
+
+
+class ResourceVersion(NamedTuple):
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def resource_version(rows: Iterable[tuple]) -> ResourceVersion:
+    """Versión a partir de filas ``(id, fecha_modificación, ...)``.
+
+    El ETag es débil: identifica el contenido, no los bytes de la respuesta.
+    """
+    rows = [tuple(row) for row in rows]
+    digest = hashlib.sha1(repr(rows).encode()).hexdigest()[:20]
+    dates = [row[1] for row in rows if len(row) > 1 and isinstance(row[1], datetime)]
+    return ResourceVersion(f'W/"{digest}"', max(dates) if dates else None)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Comparación débil (RFC 9110 §8.8.3.2): se ignora el prefijo W/
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # Las fechas de la base de datos son UTC naive; HTTP tiene resolución de segundos
+    return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+
+def conditional_get(request: Request, response: Response, version: ResourceVersion) -> Optional[Response]:
+    """Añade ETag/Last-Modified a ``response`` y devuelve un 304 si el cliente ya tiene esta versión."""
+    headers = {"ETag": version.etag, "Cache-Control": CACHE_CONTROL}
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(version.last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match tiene prioridad; If-Modified-Since se ignora si está presente
+        fresh = _etag_matches(if_none_match, version.etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = bool(if_modified_since and version.last_modified
+                     and _not_modified_since(if_modified_since, version.last_modified))
+    return Response(status_code=304, headers=headers) if fresh else None
@@ -0,0 +1,68 @@
+"""Paginación por cursor (keyset).
+
+El cursor es un token opaco (JSON en base64 url-safe) con los valores de las
+claves de orden de la última fila devuelta. La página siguiente se pide con
+``WHERE (k1, k2) < (v1, v2)`` en lugar de ``OFFSET``, así que su costo no
+crece con la profundidad.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, literal, or_, tuple_
+
+# Cabecera con el cursor siguiente en los endpoints que devuelven una lista
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Tipo no serializable en cursor: {type(value).__name__}")
+
+
+def encode_cursor(values: Sequence[Any], scope: str = "") -> str:
+    """Token para los valores de orden ``values``; ``scope`` identifica el orden usado."""
+    payload = json.dumps({"s": scope, "v": list(values)}, default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, scope: str = "", size: Optional[int] = None) -> list:
+    """Valores de un cursor; ``ValueError`` si el token no es válido para ``scope``."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["v"]
+        token_scope = payload.get("s", "")
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise ValueError("Cursor inválido")
+    if token_scope != scope or not isinstance(values, list) or (size is not None and len(values) != size):
+        raise ValueError("Cursor inválido")
+    return values
+
+
+def keyset_after(keys: Sequence[Tuple[Any, bool]], values: Sequence[Any]):
+    """Condición para las filas posteriores a ``values`` según ``keys``.
+
+    ``keys`` es una lista de ``(columna, descendente)`` en el orden del
+    ``ORDER BY``. Si todas las claves van en la misma dirección se usa la
+    comparación de tuplas ``(k1, k2) < (v1, v2)``, que el motor resuelve como
+    un rango sobre un índice compuesto; con direcciones mezcladas se expande a
+    ``k1 < v1 OR (k1 = v1 AND k2 > v2) ...``.
+    """
+    columns = [column for column, _ in keys]
+    # Cada valor con el tipo de su columna (formato de fechas del dialecto)
+    values = [literal(value, column.type) for column, value in zip(columns, values)]
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        left, right = tuple_(*columns), tuple_(*values)
+        return left < right if directions.pop() else left > right
+
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        previous = [keys[j][0] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*previous, step))
+    return or_(*clauses)
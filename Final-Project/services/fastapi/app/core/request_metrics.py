@@ -0,0 +1,164 @@
+"""Sentencias SQL y latencia por petición.
+
+``attach_query_hooks`` escucha ``before_cursor_execute``/``after_cursor_execute``
+de un engine y anota cada sentencia en las ``RequestStats`` de la petición en
+curso (``ContextVar``: los endpoints sync se ejecutan en el threadpool y los
+async sobre greenlets, ambos con el contexto de la petición). Las sentencias
+fuera de una petición (arranque, cola de votos) no se cuentan.
+
+``QueryMetricsMiddleware`` abre las estadísticas de cada petición, añade la
+cabecera ``Server-Timing`` y las acumula por ruta en ``RouteMetrics``, que
+``/metrics`` publica en formato de texto de Prometheus. Con ``APP_DEBUG`` se
+registra un aviso de posible N+1 cuando una petición supera
+``QUERY_COUNT_WARN_THRESHOLD`` sentencias.
+"""
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Ruta de las peticiones que no coinciden con ningún endpoint (evita una serie por URL)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestStats:
+    __slots__ = ("statements", "db_seconds", "slowest_seconds", "slowest_statement")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.db_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds, self.slowest_statement = seconds, statement
+
+
+current_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats.get()
+    started = getattr(context, "_metrics_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def attach_query_hooks(engine) -> None:
+    """Cuenta y cronometra las sentencias de ``engine`` (el ``sync_engine`` si es asíncrono)."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class RouteMetrics:
+    """Acumulados por (método, ruta) de las peticiones de este worker."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            # (método, ruta) -> [peticiones, segundos, sentencias, segundos de BD,
+            #                    máx. sentencias por petición, sentencia más lenta (s)]
+            self.routes: Dict[Tuple[str, str], list] = {}
+
+    def observe(self, method: str, route: str, seconds: float, stats: RequestStats) -> None:
+        with self._lock:
+            entry = self.routes.setdefault((method, route), [0, 0.0, 0, 0.0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += stats.statements
+            entry[3] += stats.db_seconds
+            entry[4] = max(entry[4], stats.statements)
+            entry[5] = max(entry[5], stats.slowest_seconds)
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            routes = sorted(self.routes.items())
+        series = (
+            ("starthub_http_requests_total", "counter", "Requests handled, by route.", 0),
+            ("starthub_http_request_duration_seconds_total", "counter", "Total request time, by route.", 1),
+            ("starthub_db_statements_total", "counter", "SQL statements executed, by route.", 2),
+            ("starthub_db_duration_seconds_total", "counter", "Time spent in SQL statements, by route.", 3),
+            ("starthub_db_statements_per_request_max", "gauge", "Most SQL statements in a single request.", 4),
+            ("starthub_db_slowest_statement_seconds", "gauge", "Slowest single SQL statement.", 5),
+        )
+        lines = []
+        for name, kind, help_text, index in series:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (method, route), entry in routes:
+                value = entry[index]
+                formatted = str(value) if isinstance(value, int) else repr(round(value, 6))
+                lines.append(f'{name}{{method="{_label(method)}",route="{_label(route)}"}} {formatted}')
+        return "\n".join(lines) + "\n"
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+route_metrics = RouteMetrics()
+
+
+def server_timing(stats: RequestStats, seconds: float) -> str:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.statements} queries", '
+        f"db-slowest;dur={stats.slowest_seconds * 1000:.2f}, "
+        f"total;dur={seconds * 1000:.2f}"
+    )
+
+
+class QueryMetricsMiddleware:
+    """Middleware ASGI: estadísticas por petición, ``Server-Timing`` y acumulados por ruta."""
+
+    def __init__(self, app, *, warn_threshold: int = 0, debug: bool = False):
+        self.app = app
+        self.warn_threshold = warn_threshold
+        self.debug = debug
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                # Las sentencias de la petición ya se ejecutaron al empezar la respuesta
+                headers = list(message.get("headers", []))
+                timing = server_timing(stats, time.perf_counter() - started)
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_stats.reset(token)
+            elapsed = time.perf_counter() - started
+            route = scope.get("route")
+            route_metrics.observe(scope["method"], getattr(route, "path", UNMATCHED_ROUTE), elapsed, stats)
+            if self.debug and self.warn_threshold and stats.statements > self.warn_threshold:
+                logger.warning(
+                    "Posible N+1: %s %s ejecutó %d sentencias SQL (%.1f ms); la más lenta (%.1f ms): %s",
+                    scope["method"], scope["path"], stats.statements, stats.db_seconds * 1000,
+                    stats.slowest_seconds * 1000, stats.slowest_statement,
+                )
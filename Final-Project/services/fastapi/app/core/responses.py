@@ -0,0 +1,35 @@
+"""Serialización rápida de los listados.
+
+Los servicios validan cada listado una sola vez, como lista, con un
+``TypeAdapter`` (en pydantic-core; más rápido que construir modelos fila a
+fila, incluso con ``model_construct``) y las rutas devuelven
+``FastJSONResponse``: orjson serializa la página completa sin la segunda
+validación + ``jsonable_encoder`` + ``json.dumps`` que FastAPI aplica con
+``response_model``. Las rutas conservan ``response_model`` para la
+documentación OpenAPI.
+"""
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any):
+    # Los modelos anidados se serializan por sus campos (orjson vuelve a llamar para cada uno)
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"{type(obj).__name__} no es serializable a JSON")
+
+
+class FastJSONResponse(ORJSONResponse):
+    """``ORJSONResponse`` que acepta modelos Pydantic (y listas de ellos) como contenido."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def fast_json(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """Respuesta con ``content`` y las cabeceras ya puestas en ``response`` (ETag, cursor...)."""
+    return FastJSONResponse(content, headers=dict(response.headers) if response is not None else None)
@@ -1,22 +1,249 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from app.core.config import get_settings
+from app.core.request_metrics import attach_query_hooks
 
 settings = get_settings()
 
+
+class PoolMetrics:
+    """Contadores del pool de conexiones, alimentados por los eventos del pool.
+
+    No hay evento "antes del checkout", así que las esperas se miden con
+    ``timed_checkout`` alrededor de la obtención de la conexión (``get_db`` y
+    ``get_async_db``). ``max_overflow`` es el configurado al crear el engine.
+    """
+
+    def __init__(self, max_overflow: int = 0):
+        self.max_overflow = max_overflow
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.peak_checked_out = 0
+            self.waits = 0
+            self.wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+            self.timeouts = 0
+
+    def attach(self, pool) -> None:
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+    @contextmanager
+    def timed_checkout(self, pool):
+        """Mide la obtención de una conexión de ``pool``.
+
+        Solo cuenta como espera si al pedirla el pool ya estaba al máximo
+        (``pool_size + max_overflow`` en uso) y hubo que esperar a un
+        ``checkin`` o hasta ``pool_timeout``.
+        """
+        saturated = isinstance(pool, QueuePool) and pool.checkedout() >= pool.size() + self.max_overflow
+        started = time.perf_counter()
+        try:
+            yield
+        except PoolTimeoutError:
+            self.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if saturated:
+            self.record_wait(time.perf_counter() - started)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        status = {"pool_class": type(pool).__name__}
+        # QueuePool expone el estado actual; SingletonThreadPool/StaticPool (SQLite) no
+        if isinstance(pool, QueuePool):
+            status.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=self.max_overflow,
+                timeout=pool.timeout(),
+            )
+        with self._lock:
+            status.update(
+                connects=self.connects,
+                checkouts=self.checkouts,
+                checkins=self.checkins,
+                invalidations=self.invalidations,
+                peak_checked_out=self.peak_checked_out,
+                waits=self.waits,
+                wait_seconds=round(self.wait_seconds, 6),
+                max_wait_seconds=round(self.max_wait_seconds, 6),
+                timeouts=self.timeouts,
+            )
+        return status
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checkouts - self.checkins)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+
+def engine_options(settings, asynchronous: bool = False) -> dict:
+    """Opciones de create_engine; el pool solo se configura para motores con servidor."""
+    options = {"echo": settings.app_debug}
+    if not asynchronous:
+        options["future"] = True
+    if make_url(settings.database_url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_recycle=settings.pool_recycle,
+            pool_pre_ping=settings.pool_pre_ping,
+        )
+    return options
+
+
+def enable_sqlite_foreign_keys(engine) -> None:
+    """SQLite no aplica las FK salvo ``PRAGMA foreign_keys=ON`` en cada conexión.
+
+    Las escrituras de votos y comentarios dependen de las FK para rechazar
+    usuarios/startups inexistentes (como en MySQL).
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Driver asíncrono por motor (ASYNC_DATABASE_URL permite elegir otro, p. ej. asyncmy)
+ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def async_db_enabled(settings) -> bool:
+    """False con SQLite en memoria: las rutas async usan entonces la sesión síncrona."""
+    return not _is_sqlite_memory(make_url(settings.async_database_url or settings.database_url))
+
+
+def async_database_url(settings) -> URL:
+    url = make_url(settings.async_database_url or settings.database_url)
+    backend = url.get_backend_name()
+    if _is_sqlite_memory(url):
+        # Cada engine abriría su propia base en memoria: las lecturas asíncronas
+        # no verían lo escrito por el engine síncrono
+        raise ValueError("El engine asíncrono necesita una base SQLite en archivo, no ':memory:'")
+    if settings.async_database_url:
+        return url
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Sin driver asíncrono para '{backend}'; defina ASYNC_DATABASE_URL")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
 # Engine is created lazily friendly; settings.database_url is guaranteed non-empty after fallback.
-engine = create_engine(settings.database_url, echo=settings.app_debug, future=True)
+engine = create_engine(settings.database_url, **engine_options(settings))
+enable_sqlite_foreign_keys(engine)
+pool_metrics = PoolMetrics(max_overflow=settings.max_overflow)
+pool_metrics.attach(engine.pool)
+attach_query_hooks(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 
 
-def get_db():
+@contextmanager
+def _session():
     db = SessionLocal()
     try:
+        # La conexión se toma aquí y no en la primera consulta, para medir la espera del pool
+        with pool_metrics.timed_checkout(engine.pool):
+            db.connection()
         yield db
     finally:
         db.close()
 
 
+def get_db():
+    with _session() as db:
+        yield db
+
+
+# El engine asíncrono se crea en el primer uso: los scripts y tests sync no
+# necesitan el driver asíncrono instalado.
+async_pool_metrics = PoolMetrics(max_overflow=settings.max_overflow)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    async_engine = create_async_engine(async_database_url(settings), **engine_options(settings, asynchronous=True))
+    enable_sqlite_foreign_keys(async_engine.sync_engine)
+    async_pool_metrics.attach(async_engine.sync_engine.pool)
+    attach_query_hooks(async_engine.sync_engine)
+    return async_engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def _async_session():
+    async with get_async_sessionmaker()() as db:
+        with async_pool_metrics.timed_checkout(get_async_engine().sync_engine.pool):
+            await db.connection()
+        yield db
+
+
+async def get_async_db():
+    async with _async_session() as db:
+        yield db
+
+
+async def get_read_db():
+    """Sesión de las rutas async de lectura: ``AsyncSession`` o, sin engine
+    asíncrono (``async_db_enabled``), la ``Session`` síncrona de ``get_db``."""
+    if async_db_enabled(settings):
+        async with _async_session() as db:
+            yield db
+    else:
+        with _session() as db:
+            yield db
+
+
 def ping_db() -> dict:
     try:
         with engine.connect() as conn:
@@ -24,3 +251,10 @@ def ping_db() -> dict:
             return {"ok": True, "result": int(result)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
+
+
+def pool_status() -> dict:
+    status = pool_metrics.snapshot(engine.pool)
+    if get_async_engine.cache_info().currsize:
+        status["async"] = async_pool_metrics.snapshot(get_async_engine().sync_engine.pool)
+    return status
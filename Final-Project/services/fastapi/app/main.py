@@ -1,8 +1,42 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from app.api.router import api_router
-from app.db.session import ping_db
+from app.db.session import ping_db, pool_status, SessionLocal
 from app.core.config import get_settings
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.request_metrics import QueryMetricsMiddleware, route_metrics
+from app.services.category_catalog import get_category_catalog
+from app.services.read_cache import get_read_cache
+from app.services.search_index import get_search_index
+from app.services.trending import get_trending_job
+from app.services.vote_queue import get_vote_queue
+from app.services.vote_stats import get_vote_stats_job, get_vote_stats_snapshot, vote_stats_job_enabled
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    with SessionLocal() as db:
+        get_category_catalog().load(db)
+        if settings.search_index_enabled:
+            get_search_index().build(db)
+    if settings.vote_buffer_enabled:
+        await get_vote_queue().start()
+    if settings.trending_refresh_seconds > 0:
+        await get_trending_job().start()
+    if vote_stats_job_enabled(settings):
+        await get_vote_stats_job().start()
+    yield
+    if vote_stats_job_enabled(settings):
+        await get_vote_stats_job().stop()
+    if settings.trending_refresh_seconds > 0:
+        await get_trending_job().stop()
+    if settings.vote_buffer_enabled:
+        # Vuelca los votos pendientes antes de que el worker termine
+        await get_vote_queue().stop()
+
 
 app = FastAPI(
     title="StartHub Backend - Comentarios y Votos",
@@ -15,6 +49,7 @@ app = FastAPI(
         "name": "StartHub",
         "url": "https://example.com",
     },
+    lifespan=lifespan,
 )
 
 # CORS - Usa solo la configuración del settings
@@ -32,6 +67,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
+)
+
+# Sentencias SQL y tiempos por petición: cabecera Server-Timing y /metrics
+app.add_middleware(
+    QueryMetricsMiddleware,
+    warn_threshold=settings.query_count_warn_threshold,
+    debug=settings.app_debug,
 )
 
 app.include_router(api_router, prefix="/api/v1")
@@ -42,4 +85,43 @@ def health():
 
 @app.get("/health/db")
 def health_db():
-    return ping_db()
\ No newline at end of file
+    return ping_db()
+
+@app.get("/health/db/pool")
+def health_db_pool():
+    """Estado del pool de conexiones de este worker (en uso, overflow, esperas)."""
+    return pool_status()
+
+@app.get("/health/cache")
+def health_cache():
+    """Aciertos/fallos de la caché de lectura de este worker."""
+    return get_read_cache().stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Peticiones, sentencias SQL y tiempos por ruta de este worker (formato Prometheus)."""
+    return PlainTextResponse(route_metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/health/trending")
+def health_trending():
+    """Recálculos del ranking trending en este worker."""
+    return {"enabled": get_settings().trending_refresh_seconds > 0, **get_trending_job().metrics()}
+
+@app.get("/health/vote-stats")
+def health_vote_stats():
+    """Refrescos del snapshot StartupVoteStatsSnapshot en este worker."""
+    settings = get_settings()
+    snapshot = get_vote_stats_snapshot()
+    return {
+        "enabled": vote_stats_job_enabled(settings),
+        "counts_source": settings.vote_counts_source,
+        "pending": snapshot.pending(),
+        "full_refreshes": snapshot.full_refreshes,
+        "incremental_refreshes": snapshot.incremental_refreshes,
+        **get_vote_stats_job().metrics(),
+    }
+
+@app.get("/health/votes/queue")
+def health_vote_queue():
+    """Cola de votos de este worker: profundidad, retraso y latencia de volcado."""
+    return {"enabled": get_settings().vote_buffer_enabled, **get_vote_queue().metrics()}
@@ -3,6 +3,10 @@ from .category import Category
 from .startup import Startup
 from .comment import Comment
 from .vote import Vote
+from .startup_stats import StartupStats
+from .startup_trending import StartupTrending
+from .startup_vote_stats import StartupVoteStatsSnapshot
 
 # Esto asegura que todos los modelos estén disponibles
-__all__ = ["User", "Category", "Startup", "Comment", "Vote"]
\ No newline at end of file
+__all__ = ["User", "Category", "Startup", "Comment", "Vote", "StartupStats", "StartupTrending",
+           "StartupVoteStatsSnapshot"]
\ No newline at end of file
@@ -1,13 +1,31 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects import sqlite
 from app.db.base import Base
 
+# En SQLite, mismo formato que CURRENT_TIMESTAMP (segundos, como DATETIME de MySQL):
+# con fracciones, '... 12:00:00' < '... 12:00:00.000000' rompería los empates del cursor.
+CreatedDate = DateTime(timezone=False).with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite",
+)
+
 
 class Comment(Base):
     __tablename__ = "Comment"
 
     comment_id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
-    created_date = Column(DateTime(timezone=False), server_default=func.now(), nullable=False)
+    created_date = Column(CreatedDate, server_default=func.now(), nullable=False)
     modified_date = Column(DateTime(timezone=False), nullable=True)
     user_id = Column(Integer, ForeignKey("User.user_id", ondelete="CASCADE"), nullable=False, index=True)
-    startup_id = Column(Integer, ForeignKey("Startup.startup_id", ondelete="CASCADE"), nullable=False, index=True)
+    # Sin índice propio: idx_comment_startup_created empieza por startup_id
+    startup_id = Column(Integer, ForeignKey("Startup.startup_id", ondelete="CASCADE"), nullable=False)
+
+    # Listado por startup paginado por cursor: WHERE startup_id = ? AND (created_date, comment_id) < (?, ?)
+    # Listado global y ventana de trending: ORDER BY / WHERE created_date, sin ordenar en memoria
+    __table_args__ = (
+        Index("idx_comment_startup_created", "startup_id", "created_date", "comment_id"),
+        Index("idx_comment_created", "created_date", "comment_id"),
+    )
+    # created_date (server_default) vuelve en el propio INSERT cuando hay RETURNING
+    __mapper_args__ = {"eager_defaults": True}
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -13,8 +13,18 @@ class Startup(Base):
     website = Column(String(255))
     social_media = Column(String(255))
     created_date = Column(DateTime, default=datetime.utcnow)
+    # Solo se rellena al editar; coalesce(modified_date, created_date) es la versión (ETag)
+    modified_date = Column(DateTime, nullable=True, onupdate=datetime.utcnow)
     owner_user_id = Column(Integer, ForeignKey("User.user_id"), nullable=False)
     category_id = Column(Integer, ForeignKey("Category.category_id"), nullable=False)
 
-    # Usar relación por cadena para evitar problemas de importación
-    category = relationship("Category", backref="startups", lazy="joined")
\ No newline at end of file
+    # Usar relación por cadena para evitar problemas de importación.
+    # Carga perezosa: el nombre de la categoría se toma del catálogo en memoria,
+    # no de un JOIN en cada consulta de Startup.
+    category = relationship("Category", backref="startups", lazy="select")
+
+    # "Mis startups" por dueño; startups de una categoría (filtro de búsqueda), por fecha
+    __table_args__ = (
+        Index("idx_startup_owner", "owner_user_id"),
+        Index("idx_startup_category_created", "category_id", "created_date"),
+    )
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from app.db.base import Base
+
+
+class StartupStats(Base):
+    """Contadores desnormalizados por startup, mantenidos en cada escritura de votos/comentarios."""
+    __tablename__ = "StartupStats"
+
+    startup_id = Column(Integer, ForeignKey("Startup.startup_id", ondelete="CASCADE"), primary_key=True)
+    upvotes = Column(Integer, nullable=False, default=0, server_default="0")
+    downvotes = Column(Integer, nullable=False, default=0, server_default="0")
+    total_votes = Column(Integer, nullable=False, default=0, server_default="0")
+    total_comments = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index
+from app.db.base import Base
+
+
+class StartupTrending(Base):
+    """Ranking "trending" precalculado por el job periódico de app/services/trending.py.
+
+    Solo guarda las ``TRENDING_TOP_N`` startups con puntaje; cada recálculo
+    reemplaza la tabla completa en una transacción.
+    """
+    __tablename__ = "StartupTrending"
+
+    startup_id = Column(Integer, ForeignKey("Startup.startup_id", ondelete="CASCADE"), primary_key=True)
+    # Posición 1..N tras cada recálculo; borrar una startup deja un hueco hasta el siguiente
+    trending_rank = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+    computed_at = Column(DateTime(timezone=False), nullable=False)
+
+    __table_args__ = (
+        Index("idx_trending_rank", "trending_rank", unique=True),
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from app.db.base import Base
+
+
+class StartupVoteStatsSnapshot(Base):
+    """Copia materializada de la vista StartupVoteStats (mismas columnas).
+
+    La mantiene ``app/services/vote_stats.py`` reprocesando solo las startups
+    con votos nuevos o modificados desde el último refresco.
+    """
+    __tablename__ = "StartupVoteStatsSnapshot"
+
+    startup_id = Column(Integer, ForeignKey("Startup.startup_id", ondelete="CASCADE"), primary_key=True)
+    startup_name = Column(String(255), nullable=False)
+    upvotes = Column(Integer, nullable=False, default=0, server_default="0")
+    downvotes = Column(Integer, nullable=False, default=0, server_default="0")
+    total_votes = Column(Integer, nullable=False, default=0, server_default="0")
+    net_votes = Column(Integer, nullable=False, default=0, server_default="0")
+    refreshed_at = Column(DateTime(timezone=False), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum, func
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum, Index, UniqueConstraint, func
 import enum
 from app.db.base import Base
 
@@ -15,4 +15,19 @@ class Vote(Base):
     vote_type = Column(Enum(VoteType), nullable=False, index=True)
     created_date = Column(DateTime(timezone=False), server_default=func.now(), nullable=False)
     user_id = Column(Integer, ForeignKey("User.user_id", ondelete="CASCADE"), nullable=False, index=True)
-    startup_id = Column(Integer, ForeignKey("Startup.startup_id", ondelete="CASCADE"), nullable=False, index=True)
+    # Sin índice propio: idx_vote_startup_type empieza por startup_id
+    startup_id = Column(Integer, ForeignKey("Startup.startup_id", ondelete="CASCADE"), nullable=False)
+
+    # Un voto por usuario y startup (mismo nombre que en la migración inicial y schema.sql);
+    # es la clave de conflicto del upsert atómico de VoteRepository.
+    # idx_vote_startup_type cubre los conteos por startup y tipo sin leer la tabla;
+    # idx_vote_created, los votos recientes (trending, snapshot de StartupVoteStats).
+    __table_args__ = (
+        UniqueConstraint("user_id", "startup_id", name="unique_vote_per_user_startup"),
+        Index("idx_vote_startup_type", "startup_id", "vote_type"),
+        Index("idx_vote_created", "created_date", "startup_id", "vote_type"),
+    )
+
+    # created_date (server_default) se lee en el mismo flush del INSERT
+    # (RETURNING donde el motor lo soporta) en lugar de un refresh posterior.
+    __mapper_args__ = {"eager_defaults": True}
@@ -1,85 +1,147 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
 from app.models.comment import Comment
-from app.models.user import User  # NUEVA IMPORTACIÓN
+from app.core.pagination import keyset_after
+from app.repositories.startup_stats_repository import StartupStatsRepository
+from app.services.user_names import get_user_name_resolver
+
+
+# Orden de los listados y claves del cursor: (created_date, comment_id) descendente
+ORDER_KEYS = ((Comment.created_date, True), (Comment.comment_id, True))
+
+
+def list_statement(startup_id: int | None, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+    """Comentarios de una startup o de todas (sin JOIN: los autores se resuelven aparte)."""
+    return _paged(select(Comment), startup_id, skip=skip, limit=limit, after=after)
+
+
+def version_statement(startup_id: int | None, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+    """Misma página que ``list_statement``, solo con id, fecha de última edición y autor (ETag)."""
+    stmt = select(Comment.comment_id, func.coalesce(Comment.modified_date, Comment.created_date), Comment.user_id)
+    return _paged(stmt, startup_id, skip=skip, limit=limit, after=after)
+
+
+def _paged(stmt, startup_id: int | None, *, skip: int, limit: int, after: tuple | None):
+    stmt = stmt.order_by(Comment.created_date.desc(), Comment.comment_id.desc()).limit(limit)
+    if startup_id is not None:
+        stmt = stmt.where(Comment.startup_id == startup_id)
+    # Con cursor se continúa desde la última fila (índice startup_id, created_date, comment_id)
+    return stmt.where(keyset_after(ORDER_KEYS, after)) if after else stmt.offset(skip)
+
+
+def rows_to_dicts(comments, user_names: dict[int, str]) -> list[dict]:
+    # Convertir resultados a formato adecuado
+    comments_with_users = []
+    for comment in comments:
+        comment_dict = {
+            "comment_id": comment.comment_id,
+            "content": comment.content,
+            "created_date": comment.created_date,
+            "modified_date": comment.modified_date,
+            "user_id": comment.user_id,
+            "startup_id": comment.startup_id,
+            "user_name": user_names[comment.user_id],
+        }
+        comments_with_users.append(comment_dict)
+    return comments_with_users
 
 
 class CommentRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.stats = StartupStatsRepository(db)
+        self.user_names = get_user_name_resolver()
+
+    def _to_dicts(self, comments) -> list[dict]:
+        return rows_to_dicts(comments, self.user_names.resolve_many(self.db, (c.user_id for c in comments)))
 
-    def create(self, *, user_id: int, content: str, startup_id: int) -> Comment:
+    def create(self, *, user_id: int, content: str, startup_id: int) -> dict:
         comment = Comment(user_id=user_id, content=content, startup_id=startup_id)
         self.db.add(comment)
+        self.db.flush()
+        self.stats.apply_delta(startup_id, comments=1)
+        # created_date llega con el INSERT (eager_defaults): no hace falta releer la fila
+        created = {
+            "comment_id": comment.comment_id,
+            "content": comment.content,
+            "created_date": comment.created_date,
+            "modified_date": comment.modified_date,
+            "user_id": user_id,
+            "startup_id": startup_id,
+        }
         self.db.commit()
-        self.db.refresh(comment)
-        return comment
-
-    def list_by_startup(self, startup_id: int, *, skip: int = 0, limit: int = 50):
-        stmt = (
-            select(Comment, User.first_name, User.last_name)  # MODIFICADO: incluir nombre y apellido
-            .join(User, Comment.user_id == User.user_id)      # NUEVO: JOIN con User
-            .where(Comment.startup_id == startup_id)
-            .order_by(Comment.created_date.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        results = self.db.execute(stmt).all()
-
-        # Convertir resultados a formato adecuado
-        comments_with_users = []
-        for comment, first_name, last_name in results:
-            comment_dict = {
-                "comment_id": comment.comment_id,
-                "content": comment.content,
-                "created_date": comment.created_date,
-                "modified_date": comment.modified_date,
-                "user_id": comment.user_id,
-                "startup_id": comment.startup_id,
-                "user_name": f"{first_name} {last_name}"  # Combinar nombre y apellido
-            }
-            comments_with_users.append(comment_dict)
-
-        return comments_with_users
-
-    def list_all(self, *, skip: int = 0, limit: int = 50):
-        stmt = (
-            select(Comment, User.first_name, User.last_name)  # MODIFICADO
-            .join(User, Comment.user_id == User.user_id)      # NUEVO: JOIN con User
-            .order_by(Comment.created_date.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        results = self.db.execute(stmt).all()
-
-        # Convertir resultados a formato adecuado
-        comments_with_users = []
-        for comment, first_name, last_name in results:
-            comment_dict = {
-                "comment_id": comment.comment_id,
-                "content": comment.content,
-                "created_date": comment.created_date,
-                "modified_date": comment.modified_date,
-                "user_id": comment.user_id,
-                "startup_id": comment.startup_id,
-                "user_name": f"{first_name} {last_name}"  # Combinar nombre y apellido
-            }
-            comments_with_users.append(comment_dict)
-
-        return comments_with_users
+        return {**created, "user_name": self.user_names.resolve(self.db, user_id)}
+
+    def list_by_startup(self, startup_id: int, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+        stmt = list_statement(startup_id, skip=skip, limit=limit, after=after)
+        return self._to_dicts(self.db.execute(stmt).scalars().all())
+
+    def list_all(self, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+        stmt = list_statement(None, skip=skip, limit=limit, after=after)
+        return self._to_dicts(self.db.execute(stmt).scalars().all())
+
+    def version_rows(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+        """(comment_id, fecha de última edición, user_name) de la página; ver ``AsyncCommentRepository``."""
+        rows = self.db.execute(version_statement(startup_id, skip=skip, limit=limit, after=after)).all()
+        names = self.user_names.resolve_many(self.db, (user_id for _, _, user_id in rows))
+        return [(comment_id, modified, names[user_id]) for comment_id, modified, user_id in rows]
 
     def get(self, comment_id: int) -> Comment | None:
         return self.db.get(Comment, comment_id)
 
-    def update(self, comment: Comment, content: str) -> Comment:
+    def get_with_author(self, comment_id: int) -> dict | None:
+        comment = self.get(comment_id)
+        return self._to_dicts([comment])[0] if comment else None
+
+    def update(self, comment: dict, content: str) -> dict:
+        """Actualiza el contenido de ``comment`` (dict de get_with_author) sin volver a leerlo."""
         from datetime import datetime, timezone
 
-        comment.content = content
-        comment.modified_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        modified_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.db.execute(
+            update(Comment)
+            .where(Comment.comment_id == comment["comment_id"])
+            .values(content=content, modified_date=modified_date)
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
-        self.db.refresh(comment)
-        return comment
+        return {**comment, "content": content, "modified_date": modified_date}
 
     def delete(self, comment: Comment) -> None:
+        startup_id = comment.startup_id
         self.db.delete(comment)
-        self.db.commit()
\ No newline at end of file
+        self.db.flush()
+        self.stats.apply_delta(startup_id, comments=-1)
+        self.db.commit()
+
+
+class AsyncCommentRepository:
+    """Lecturas de comentarios sobre ``AsyncSession`` (las escrituras siguen en CommentRepository)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.user_names = get_user_name_resolver()
+
+    async def _to_dicts(self, comments) -> list[dict]:
+        names = await self.user_names.resolve_many_async(self.db, (c.user_id for c in comments))
+        return rows_to_dicts(comments, names)
+
+    async def list_by_startup(self, startup_id: int, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+        stmt = list_statement(startup_id, skip=skip, limit=limit, after=after)
+        return await self._to_dicts((await self.db.execute(stmt)).scalars().all())
+
+    async def list_all(self, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+        stmt = list_statement(None, skip=skip, limit=limit, after=after)
+        return await self._to_dicts((await self.db.execute(stmt)).scalars().all())
+
+    async def version_rows(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+        """(comment_id, fecha de última edición, user_name) de la página.
+
+        El nombre del autor entra en el ETag: renombrar al usuario cambia la
+        versión aunque el comentario no cambie.
+        """
+        stmt = version_statement(startup_id, skip=skip, limit=limit, after=after)
+        rows = (await self.db.execute(stmt)).all()
+        names = await self.user_names.resolve_many_async(self.db, (user_id for _, _, user_id in rows))
+        return [(comment_id, modified, names[user_id]) for comment_id, modified, user_id in rows]
@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from typing import Optional
+
+from sqlalchemy import exists, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.startup import Startup
+from app.models.user import User
+
+
+def missing_entity(db: Session, user_id: int, startup_id: int) -> Optional[str]:
+    """Qué entidad referenciada no existe, en una sola consulta (``None`` si existen ambas)."""
+    user_exists, startup_exists = db.execute(select(
+        exists().where(User.user_id == user_id),
+        exists().where(Startup.startup_id == startup_id),
+    )).one()
+    if not user_exists:
+        return "User not found"
+    if not startup_exists:
+        return "Startup not found"
+    return None
+
+
+@contextmanager
+def foreign_keys_as_not_found(db: Session, user_id: int, startup_id: int):
+    """Traduce la violación de FK de una escritura en ``ValueError("... not found")``.
+
+    Las escrituras ya no consultan User/Startup antes de insertar: se apoyan
+    en las claves foráneas y solo si fallan se averigua cuál falta.
+    """
+    try:
+        yield
+    except IntegrityError:
+        db.rollback()
+        missing = missing_entity(db, user_id, startup_id)
+        if missing:
+            raise ValueError(missing)
+        raise
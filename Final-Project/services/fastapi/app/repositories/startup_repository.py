@@ -1,80 +1,109 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from typing import List, Optional
 from app.models.startup import Startup
-from app.models.comment import Comment
-from app.models.vote import Vote
+from app.models.startup_stats import StartupStats
+from app.models.startup_trending import StartupTrending
 from app.models.category import Category
-from app.models.user import User  # IMPORTAR USER
+from app.repositories.startup_stats_repository import live_comment_count, live_vote_count
+from app.services.user_names import get_user_name_resolver
+
+# Columnas de StartupOut que salen de Startup: los listados seleccionan solo
+# estas (filas livianas, sin entidades ni identity map)
+LIST_COLUMNS = (
+    Startup.startup_id,
+    Startup.name,
+    Startup.description,
+    Startup.category_id,
+    Startup.owner_user_id,
+    Startup.created_date,
+    Startup.email,
+    Startup.website,
+    Startup.social_media,
+)
 
 
 class StartupRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.user_names = get_user_name_resolver()
+
+    def _with_owner_names(self, startups: List[Startup]) -> List[Startup]:
+        """Asigna ``owner_name`` desde la caché de nombres (un IN para los que falten)."""
+        names = self.user_names.resolve_many(self.db, (s.owner_user_id for s in startups))
+        for startup in startups:
+            setattr(startup, 'owner_name', names[startup.owner_user_id])
+        return startups
+
+    def _rows_with_owner_names(self, stmt) -> List[dict]:
+        """Filas de ``LIST_COLUMNS`` como dicts, con ``owner_name`` de la caché de nombres."""
+        rows = self.db.execute(stmt).mappings().all()
+        names = self.user_names.resolve_many(self.db, (row["owner_user_id"] for row in rows))
+        return [{**row, "owner_name": names[row["owner_user_id"]]} for row in rows]
 
     def create(self, startup: Startup) -> Startup:
         self.db.add(startup)
+        self.db.flush()
+        self.db.add(StartupStats(startup_id=startup.startup_id))
         self.db.commit()
         self.db.refresh(startup)
+        self._with_owner_names([startup])
         return startup
 
     def get_by_id(self, startup_id: int) -> Optional[Startup]:
-        result = self.db.query(
-            Startup,
-            Category.name.label('category_name'),
-            User.first_name,
-            User.last_name
-        )\
-            .join(Category, Startup.category_id == Category.category_id)\
-            .join(User, Startup.owner_user_id == User.user_id)\
-            .filter(Startup.startup_id == startup_id)\
-            .first()
-
-        if result:
-            startup, category_name, first_name, last_name = result
-            # Asignar el nombre de la categoría y del usuario al objeto startup
-            setattr(startup, 'category_name', category_name)
-            setattr(startup, 'owner_name', f"{first_name} {last_name}")
+        startup = self.db.query(Startup).filter(Startup.startup_id == startup_id).first()
+        if startup:
+            # Nombres del dueño y de la categoría: de las cachés en memoria, no de JOINs
+            self._with_owner_names([startup])
             return startup
         return None
 
-    def get_by_owner(self, owner_user_id: int) -> List[Startup]:
-        results = self.db.query(
-            Startup,
-            Category.name.label('category_name'),
-            User.first_name,
-            User.last_name
-        )\
-            .join(Category, Startup.category_id == Category.category_id)\
-            .join(User, Startup.owner_user_id == User.user_id)\
-            .filter(Startup.owner_user_id == owner_user_id)\
-            .all()
-
-        startups = []
-        for startup, category_name, first_name, last_name in results:
-            setattr(startup, 'category_name', category_name)
-            setattr(startup, 'owner_name', f"{first_name} {last_name}")
-            startups.append(startup)
-        return startups
+    def get_by_owner(self, owner_user_id: int) -> List[dict]:
+        stmt = select(*LIST_COLUMNS).where(Startup.owner_user_id == owner_user_id)
+        return self._rows_with_owner_names(stmt)
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Startup]:
-        results = self.db.query(
-            Startup,
-            Category.name.label('category_name'),
-            User.first_name,
-            User.last_name
-        )\
-            .join(Category, Startup.category_id == Category.category_id)\
-            .join(User, Startup.owner_user_id == User.user_id)\
-            .offset(skip).limit(limit)\
-            .all()
-
-        startups = []
-        for startup, category_name, first_name, last_name in results:
-            setattr(startup, 'category_name', category_name)
-            setattr(startup, 'owner_name', f"{first_name} {last_name}")
-            startups.append(startup)
-        return startups
+    def get_all(self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[dict]:
+        stmt = select(*LIST_COLUMNS).order_by(Startup.startup_id)
+        # Con cursor se continúa por la clave primaria en lugar de usar OFFSET
+        if after_id is not None:
+            stmt = stmt.where(Startup.startup_id > after_id)
+        else:
+            stmt = stmt.offset(skip)
+        return self._rows_with_owner_names(stmt.limit(limit))
+
+    def get_trending(self, skip: int = 0, limit: int = 20) -> List[dict]:
+        """Página del ranking precalculado, en orden de ``trending_rank``.
+
+        Con OFFSET y no ``trending_rank > skip``: borrar una startup deja un
+        hueco en las posiciones hasta el próximo recálculo. El ranking tiene a
+        lo sumo ``TRENDING_TOP_N`` filas y se recorre por ``idx_trending_rank``.
+        """
+        stmt = (
+            select(*LIST_COLUMNS, StartupTrending.trending_rank, StartupTrending.score.label("trending_score"))
+            .join(StartupTrending, StartupTrending.startup_id == Startup.startup_id)
+            .order_by(StartupTrending.trending_rank)
+            .offset(skip)
+            .limit(limit)
+        )
+        return self._rows_with_owner_names(stmt)
+
+    def version_rows(self, *, startup_id: Optional[int] = None, skip: int = 0, limit: int = 100,
+                     after_id: Optional[int] = None) -> list:
+        """(startup_id, fecha de última edición, dueño, categoría) de una startup o de la página de ``get_all``."""
+        stmt = select(
+            Startup.startup_id,
+            func.coalesce(Startup.modified_date, Startup.created_date),
+            Startup.owner_user_id,
+            Startup.category_id,
+        )
+        if startup_id is not None:
+            return self.db.execute(stmt.where(Startup.startup_id == startup_id)).all()
+        stmt = stmt.order_by(Startup.startup_id)
+        if after_id is not None:
+            stmt = stmt.where(Startup.startup_id > after_id)
+        else:
+            stmt = stmt.offset(skip)
+        return self.db.execute(stmt.limit(limit)).all()
 
     def update(self, startup_id: int, update_data: dict) -> Optional[Startup]:
         startup = self.get_by_id(startup_id)
@@ -94,27 +123,24 @@ class StartupRepository:
         return False
 
     def get_with_stats(self, startup_id: int) -> Optional[tuple]:
-        """Obtiene startup con estadísticas de votos y comentarios"""
+        """Obtiene startup con estadísticas de votos y comentarios.
+
+        Lee los contadores de StartupStats; si la startup aún no tiene fila de
+        contadores, cada total se calcula con su propia subconsulta correlacionada
+        (nunca se unen Comment y Vote en el mismo FROM, que multiplicaría filas).
+        """
         result = self.db.query(
             Startup,
-            Category.name.label('category_name'),
-            User.first_name,
-            User.last_name,
-            func.count(Comment.comment_id).label('total_comentarios'),
-            func.count(Vote.vote_id).label('total_votos')
+            func.coalesce(StartupStats.total_comments, live_comment_count()).label('total_comentarios'),
+            func.coalesce(StartupStats.total_votes, live_vote_count()).label('total_votos')
         )\
-         .join(Category, Startup.category_id == Category.category_id)\
-         .join(User, Startup.owner_user_id == User.user_id)\
-         .outerjoin(Comment, Comment.startup_id == Startup.startup_id)\
-         .outerjoin(Vote, Vote.startup_id == Startup.startup_id)\
+         .outerjoin(StartupStats, StartupStats.startup_id == Startup.startup_id)\
          .filter(Startup.startup_id == startup_id)\
-         .group_by(Startup.startup_id, Category.name, User.first_name, User.last_name)\
          .first()
 
         if result:
-            startup, category_name, first_name, last_name, total_comentarios, total_votos = result
-            setattr(startup, 'category_name', category_name)
-            setattr(startup, 'owner_name', f"{first_name} {last_name}")
+            startup, total_comentarios, total_votos = result
+            self._with_owner_names([startup])
             return (startup, total_comentarios, total_votos)
         return None
 
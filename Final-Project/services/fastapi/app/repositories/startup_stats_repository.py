@@ -0,0 +1,130 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, case
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.startup import Startup
+from app.models.startup_stats import StartupStats
+from app.models.comment import Comment
+from app.models.vote import Vote, VoteType
+
+
+def live_comment_count():
+    """Subconsulta escalar correlacionada: comentarios de la startup externa."""
+    return (
+        select(func.count(Comment.comment_id))
+        .where(Comment.startup_id == Startup.startup_id)
+        .correlate(Startup)
+        .scalar_subquery()
+    )
+
+
+def live_vote_count():
+    """Subconsulta escalar correlacionada: votos de la startup externa."""
+    return (
+        select(func.count(Vote.vote_id))
+        .where(Vote.startup_id == Startup.startup_id)
+        .correlate(Startup)
+        .scalar_subquery()
+    )
+
+
+class StartupStatsRepository:
+    """Mantiene los contadores de StartupStats.
+
+    Ningún método hace commit: se ejecutan dentro de la transacción del
+    repositorio que escribe el voto o comentario, para que contador y dato
+    se confirmen (o se descarten) juntos.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_delta(self, startup_id: int, *, upvotes: int = 0, downvotes: int = 0, comments: int = 0) -> None:
+        stmt = (
+            update(StartupStats)
+            .where(StartupStats.startup_id == startup_id)
+            .values(
+                upvotes=StartupStats.upvotes + upvotes,
+                downvotes=StartupStats.downvotes + downvotes,
+                total_votes=StartupStats.total_votes + upvotes + downvotes,
+                total_comments=StartupStats.total_comments + comments,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.execute(stmt).rowcount == 0:
+            # Startup sin fila de contadores (p. ej. cargada desde los seeds SQL):
+            # se reconstruye desde las tablas, que ya incluyen la escritura en curso.
+            self.refresh(startup_id)
+
+    def refresh(self, startup_id: int) -> StartupStats:
+        """Recalcula los contadores de una startup a partir de Vote y Comment."""
+        self.refresh_many([startup_id])
+        return self.db.get(StartupStats, startup_id, populate_existing=True)
+
+    def refresh_many(self, startup_ids) -> None:
+        """``refresh`` para varias startups con consultas agrupadas (lotes de votos)."""
+        startup_ids = sorted(set(startup_ids))
+        if not startup_ids:
+            return
+        up_case = case((Vote.vote_type == VoteType.upvote, 1), else_=0)
+        down_case = case((Vote.vote_type == VoteType.downvote, 1), else_=0)
+        votes = {
+            sid: (int(up), int(down))
+            for sid, up, down in self.db.execute(
+                select(Vote.startup_id, func.sum(up_case), func.sum(down_case))
+                .where(Vote.startup_id.in_(startup_ids))
+                .group_by(Vote.startup_id)
+            ).all()
+        }
+        comments = dict(self.db.execute(
+            select(Comment.startup_id, func.count(Comment.comment_id))
+            .where(Comment.startup_id.in_(startup_ids))
+            .group_by(Comment.startup_id)
+        ).all())
+        rows = []
+        for sid in startup_ids:
+            upvotes, downvotes = votes.get(sid, (0, 0))
+            rows.append({
+                "startup_id": sid,
+                "upvotes": upvotes,
+                "downvotes": downvotes,
+                "total_votes": upvotes + downvotes,
+                "total_comments": int(comments.get(sid, 0)),
+            })
+        self._upsert(rows)
+
+    def _upsert(self, rows: list[dict]) -> None:
+        """Inserta o reemplaza filas de StartupStats en una sentencia.
+
+        Dos primeras escrituras simultáneas sobre la misma startup (ambas sin
+        fila de contadores) no chocan por clave duplicada: la segunda
+        sobrescribe con valores recalculados desde las tablas.
+        """
+        dialect = self.db.get_bind().dialect.name
+        columns = ("upvotes", "downvotes", "total_votes", "total_comments")
+        if dialect == "mysql":
+            stmt = mysql_insert(StartupStats).values(rows)
+            stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in columns})
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(StartupStats).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[StartupStats.startup_id],
+                set_={column: stmt.excluded[column] for column in columns},
+            )
+        else:
+            existing = {
+                stats.startup_id: stats
+                for stats in self.db.execute(
+                    select(StartupStats).where(StartupStats.startup_id.in_([row["startup_id"] for row in rows]))
+                ).scalars()
+            }
+            for row in rows:
+                stats = existing.get(row["startup_id"])
+                if stats is None:
+                    self.db.add(StartupStats(**row))
+                else:
+                    for column in columns:
+                        setattr(stats, column, row[column])
+            self.db.flush()
+            return
+        self.db.execute(stmt)
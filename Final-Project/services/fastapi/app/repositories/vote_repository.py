@@ -1,26 +1,157 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, case
+from sqlalchemy import select, update, func, case
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models.vote import Vote, VoteType
+from app.models.startup_vote_stats import StartupVoteStatsSnapshot
+from app.repositories.startup_stats_repository import StartupStatsRepository
+
+
+def _opposite(vote_type: VoteType) -> VoteType:
+    return VoteType.downvote if vote_type == VoteType.upvote else VoteType.upvote
+
+
+def _vote_delta(vote_type: VoteType, step: int) -> dict:
+    """Delta de StartupStats para sumar/restar un voto del tipo dado."""
+    return {"upvotes": step} if vote_type == VoteType.upvote else {"downvotes": step}
 
 
 class VoteRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.stats = StartupStatsRepository(db)
 
     def upsert(self, *, user_id: int, startup_id: int, vote_type: VoteType) -> tuple[Vote, bool]:
-        """Upsert del voto. Retorna (voto, creado_bool)."""
+        """Upsert atómico del voto. Retorna (voto, creado_bool).
+
+        Sin lectura previa: la restricción ``unique_vote_per_user_startup``
+        resuelve el conflicto en la base de datos, así que dos peticiones
+        simultáneas del mismo usuario no pueden crear dos votos. El voto se
+        devuelve como objeto fuera de la sesión (no requiere refresh).
+        """
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mysql":
+            vote, created, changed = self._upsert_mysql(user_id, startup_id, vote_type)
+        elif dialect == "sqlite":
+            vote, created, changed = self._upsert_returning(user_id, startup_id, vote_type)
+        else:
+            vote, created, changed = self._upsert_select_first(user_id, startup_id, vote_type)
+
+        if created:
+            self.stats.apply_delta(startup_id, **_vote_delta(vote_type, +1))
+        elif changed:
+            self.stats.apply_delta(startup_id, **_vote_delta(vote_type, +1), **_vote_delta(_opposite(vote_type), -1))
+        self.db.commit()
+        return vote, created
+
+    def _upsert_mysql(self, user_id: int, startup_id: int, vote_type: VoteType) -> tuple[Vote, bool, bool]:
+        """``INSERT ... ON DUPLICATE KEY UPDATE`` en una sentencia.
+
+        ``LAST_INSERT_ID(0)`` en la rama de actualización deja ``lastrowid`` en
+        0, así que ``lastrowid != 0`` indica inserción; MySQL informa 2 filas
+        afectadas solo cuando la fila existente cambió de valor.
+        """
+        stmt = mysql_insert(Vote).values(user_id=user_id, startup_id=startup_id, vote_type=vote_type)
+        stmt = stmt.on_duplicate_key_update(
+            vote_type=stmt.inserted.vote_type,
+            vote_id=Vote.vote_id + func.last_insert_id(0),
+        )
+        result = self.db.execute(stmt)
+        created = bool(result.lastrowid)
+        changed = not created and result.rowcount == 2
+        # MySQL no tiene RETURNING: vote_id y created_date se leen aparte
+        row = self.db.execute(
+            select(Vote.vote_id, Vote.created_date)
+            .where(Vote.user_id == user_id, Vote.startup_id == startup_id)
+        ).one()
+        return self._detached(row, user_id, startup_id, vote_type), created, changed
+
+    def _upsert_returning(self, user_id: int, startup_id: int, vote_type: VoteType) -> tuple[Vote, bool, bool]:
+        """Upsert con ``ON CONFLICT`` y ``RETURNING`` (SQLite >= 3.35).
+
+        ``RETURNING`` devuelve la fila final tanto al insertar como al
+        actualizar, sin indicar cuál ocurrió: se intenta primero el INSERT con
+        ``DO NOTHING`` y, si había conflicto, un UPDATE condicionado a que el
+        tipo cambie. Ambas sentencias corren con el bloqueo de escritura de la
+        misma transacción.
+        """
+        columns = (Vote.vote_id, Vote.created_date)
+        inserted = self.db.execute(
+            sqlite_insert(Vote)
+            .values(user_id=user_id, startup_id=startup_id, vote_type=vote_type)
+            .on_conflict_do_nothing(index_elements=[Vote.user_id, Vote.startup_id])
+            .returning(*columns)
+        ).one_or_none()
+        if inserted is not None:
+            return self._detached(inserted, user_id, startup_id, vote_type), True, False
+
+        updated = self.db.execute(
+            update(Vote)
+            .where(Vote.user_id == user_id, Vote.startup_id == startup_id, Vote.vote_type != vote_type)
+            .values(vote_type=vote_type)
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if updated is not None:
+            return self._detached(updated, user_id, startup_id, vote_type), False, True
+
+        # Mismo voto repetido (doble clic): nada que escribir
+        row = self.db.execute(
+            select(*columns).where(Vote.user_id == user_id, Vote.startup_id == startup_id)
+        ).one()
+        return self._detached(row, user_id, startup_id, vote_type), False, False
+
+    def _upsert_select_first(self, user_id: int, startup_id: int, vote_type: VoteType) -> tuple[Vote, bool, bool]:
+        """Camino genérico (otros motores): lectura previa y escritura ORM."""
         stmt = select(Vote).where(Vote.user_id == user_id, Vote.startup_id == startup_id)
         existing = self.db.execute(stmt).scalar_one_or_none()
         if existing:
+            changed = existing.vote_type != vote_type
             existing.vote_type = vote_type
-            self.db.commit()
-            self.db.refresh(existing)
-            return existing, False
+            self.db.flush()
+            self.db.expunge(existing)
+            return existing, False, changed
         vote = Vote(user_id=user_id, startup_id=startup_id, vote_type=vote_type)
         self.db.add(vote)
+        self.db.flush()
+        self.db.expunge(vote)
+        return vote, True, False
+
+    def upsert_many(self, votes: list[tuple[int, int, VoteType]]) -> None:
+        """Upsert de un lote ``(user_id, startup_id, vote_type)`` en una sentencia.
+
+        Cada par (usuario, startup) debe aparecer una sola vez. Los contadores
+        de las startups afectadas se recalculan en bloque en vez de aplicar
+        deltas, porque el upsert multi-fila no dice qué filas cambiaron.
+        """
+        if not votes:
+            return
+        rows = [
+            {"user_id": user_id, "startup_id": startup_id, "vote_type": vote_type}
+            for user_id, startup_id, vote_type in votes
+        ]
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mysql":
+            stmt = mysql_insert(Vote).values(rows)
+            self.db.execute(stmt.on_duplicate_key_update(vote_type=stmt.inserted.vote_type))
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(Vote).values(rows)
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[Vote.user_id, Vote.startup_id],
+                set_={"vote_type": stmt.excluded.vote_type},
+            ))
+        else:
+            for row in rows:
+                self._upsert_select_first(row["user_id"], row["startup_id"], row["vote_type"])
+        self.stats.refresh_many(row["startup_id"] for row in rows)
         self.db.commit()
-        self.db.refresh(vote)
-        return vote, True
+
+    @staticmethod
+    def _detached(row, user_id: int, startup_id: int, vote_type: VoteType) -> Vote:
+        return Vote(
+            vote_id=row.vote_id, created_date=row.created_date,
+            user_id=user_id, startup_id=startup_id, vote_type=vote_type,
+        )
 
     def count_for_startup(self, startup_id: int) -> tuple[int, int]:
         up_case = case((Vote.vote_type == VoteType.upvote, 1), else_=0)
@@ -29,12 +160,39 @@ class VoteRepository:
         upvotes, downvotes = self.db.execute(stmt).one()
         return int(upvotes or 0), int(downvotes or 0)
 
+    def count_for_startups(self, startup_ids: list[int]) -> dict[int, tuple[int, int]]:
+        """Conteo agrupado de votos para varias startups en una sola consulta."""
+        if not startup_ids:
+            return {}
+        up_case = case((Vote.vote_type == VoteType.upvote, 1), else_=0)
+        down_case = case((Vote.vote_type == VoteType.downvote, 1), else_=0)
+        stmt = (
+            select(Vote.startup_id, func.sum(up_case), func.sum(down_case))
+            .where(Vote.startup_id.in_(startup_ids))
+            .group_by(Vote.startup_id)
+        )
+        return {
+            startup_id: (int(upvotes or 0), int(downvotes or 0))
+            for startup_id, upvotes, downvotes in self.db.execute(stmt).all()
+        }
+
+    def snapshot_counts_for_startups(self, startup_ids: list[int]) -> dict[int, tuple[int, int]]:
+        """Como ``count_for_startups`` pero desde StartupVoteStatsSnapshot (sin agregar Vote)."""
+        if not startup_ids:
+            return {}
+        stmt = select(
+            StartupVoteStatsSnapshot.startup_id, StartupVoteStatsSnapshot.upvotes, StartupVoteStatsSnapshot.downvotes
+        ).where(StartupVoteStatsSnapshot.startup_id.in_(startup_ids))
+        return {startup_id: (upvotes, downvotes) for startup_id, upvotes, downvotes in self.db.execute(stmt).all()}
+
     def delete(self, *, user_id: int, startup_id: int) -> bool:
         stmt = select(Vote).where(Vote.user_id == user_id, Vote.startup_id == startup_id)
         existing = self.db.execute(stmt).scalar_one_or_none()
         if not existing:
             return False
         self.db.delete(existing)
+        self.db.flush()
+        self.stats.apply_delta(startup_id, **_vote_delta(existing.vote_type, -1))
         self.db.commit()
         return True
 
@@ -8,6 +8,7 @@ class SearchSortBy(str, Enum):
     VOTOS_DESC = "votos_desc"
     COMENTARIOS_ASC = "comentarios_asc"
     COMENTARIOS_DESC = "comentarios_desc"
+    TRENDING = "trending"
 
 class StartupSearchFilters(BaseModel):
     categorias: Optional[list[int]] = None
@@ -20,6 +21,7 @@ class StartupSearchRequest(BaseModel):
     sort_by: SearchSortBy = SearchSortBy.RELEVANCIA
     skip: int = 0
     limit: int = 50
+    cursor: Optional[str] = None
 
 class StartupSearchResult(BaseModel):
     startup_id: int
@@ -30,12 +32,15 @@ class StartupSearchResult(BaseModel):
     total_votos: int = 0
     total_comentarios: int = 0
     relevance_score: Optional[float] = None
+    # Puntaje del ranking precalculado (solo con sort_by=trending)
+    trending_score: Optional[float] = None
 
 class SearchResponse(BaseModel):
     results: List[StartupSearchResult]
     total: int
     page: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 class AutocompleteResult(BaseModel):
     startup_id: int
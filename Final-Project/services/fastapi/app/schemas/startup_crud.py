@@ -76,4 +76,9 @@ class StartupOut(StartupBase):
 
 class StartupWithStats(StartupOut):
     total_votos: int = 0
-    total_comentarios: int = 0
\ No newline at end of file
+    total_comentarios: int = 0
+
+
+class TrendingStartupOut(StartupOut):
+    trending_rank: int
+    trending_score: float
@@ -29,6 +29,12 @@ class VoteOut(VoteBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class VoteQueued(VoteBase):
+    """Respuesta de POST /votes/ con la cola de votos activa (202 Accepted)."""
+    user_id: int
+    status: str = "queued"
+
+
 class VoteCount(BaseModel):
     startup_id: int
     upvotes: int
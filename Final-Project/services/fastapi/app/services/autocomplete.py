@@ -0,0 +1,180 @@
+"""Motor de autocompletado de nombres de startups.
+
+Mantiene en memoria dos listas ordenadas de claves normalizadas (minúsculas y
+sin tildes), sobre las que cada prefijo se resuelve con ``bisect`` en
+O(log n + k) en lugar de un ``ILIKE '%q%' ORDER BY name`` por pulsación:
+
+- ``_names``: el nombre completo, para las startups cuyo nombre empieza por el
+  prefijo (se devuelven primero, en orden alfabético).
+- ``_words``: el resto del nombre a partir de cada palabra interna (y de cada
+  mayúscula dentro de una palabra: "EcoTech" también responde a "tech").
+
+Se carga de forma perezosa en la primera consulta y se actualiza desde
+``StartupService.create/update/delete``. Las respuestas de los prefijos
+recientes se guardan en un LRU que se vacía en cada escritura. Como el índice
+de búsqueda, cada worker tiene su propia copia: para ver las altas y cambios
+hechos por otros workers se recarga entera cada ``AUTOCOMPLETE_TTL_SECONDS``
+(la recarga la hace una sola petición; las demás siguen con la copia actual).
+"""
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.models.startup import Startup
+
+MIN_PREFIX_LEN = 2
+PREFIX_CACHE_SIZE = 2048
+
+# Inicio de palabra, o mayúscula precedida de minúscula (camelCase)
+_WORD_START_RE = re.compile(r"(?<![^\W_])\w|(?<=[a-záéíóúñü])[A-ZÁÉÍÓÚÑÜ]")
+
+
+def fold(text: str) -> str:
+    """Minúsculas, sin tildes ni diéresis y con los espacios colapsados."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.lower().split())
+
+
+def _word_keys(name: str) -> List[str]:
+    """Claves de ``_words``: el nombre desde cada inicio de palabra interno."""
+    collapsed = " ".join(name.split())
+    keys = []
+    for m in _WORD_START_RE.finditer(collapsed):
+        if m.start() > 0:
+            keys.append(fold(collapsed[m.start():]))
+    return list(dict.fromkeys(keys))
+
+
+class AutocompleteEngine:
+    def __init__(self, cache_size: int = PREFIX_CACHE_SIZE, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._reloading = threading.Lock()
+        self.loaded_at = 0.0
+        self._docs: Dict[int, Tuple[str, str]] = {}
+        self._names: List[Tuple[str, int]] = []
+        self._words: List[Tuple[str, int]] = []
+        self.cache = LRUCache(cache_size)
+        self.loaded = False
+
+    def build(self, db: Session) -> int:
+        """Carga (o recarga) el motor completo desde la tabla Startup."""
+        rows = db.execute(select(Startup.startup_id, Startup.name, Startup.description)).all()
+        self.load(rows)
+        return len(rows)
+
+    def load(self, rows: Iterable[Tuple[int, str, Optional[str]]]) -> None:
+        docs, names, words = {}, [], []
+        for startup_id, name, description in rows:
+            name = name or ""
+            docs[startup_id] = (name, description or "")
+            names.append((fold(name), startup_id))
+            words.extend((key, startup_id) for key in _word_keys(name))
+        names.sort()
+        words.sort()
+        with self._lock:
+            self._docs, self._names, self._words = docs, names, words
+            self.cache.clear()
+            self.loaded = True
+            self.loaded_at = time.monotonic()
+
+    def expired(self) -> bool:
+        return bool(self.ttl) and time.monotonic() - self.loaded_at > self.ttl
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self.loaded:
+            with self._lock:
+                if not self.loaded:
+                    self.build(db)
+            return
+        if self.expired() and self._reloading.acquire(blocking=False):
+            # La consulta a la base va fuera de _lock: las sugerencias no esperan la recarga
+            try:
+                if self.expired():
+                    self.build(db)
+            finally:
+                self._reloading.release()
+
+    def upsert(self, startup_id: int, name: str, description: Optional[str]) -> None:
+        if not self.loaded:
+            return
+        with self._lock:
+            self._remove(startup_id)
+            name = name or ""
+            self._docs[startup_id] = (name, description or "")
+            insort(self._names, (fold(name), startup_id))
+            for key in _word_keys(name):
+                insort(self._words, (key, startup_id))
+            self.cache.clear()
+
+    def remove(self, startup_id: int) -> None:
+        if not self.loaded:
+            return
+        with self._lock:
+            self._remove(startup_id)
+            self.cache.clear()
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        prefix = fold(query or "")
+        if len(prefix) < MIN_PREFIX_LEN:
+            return []
+        cache_key = (prefix, limit)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            ids = self._scan(self._names, prefix, limit, [])
+            if len(ids) < limit:
+                ids = self._scan(self._words, prefix, limit, ids)
+            results = [
+                {"startup_id": sid, "name": self._docs[sid][0], "description": self._docs[sid][1]}
+                for sid in ids
+            ]
+            # Dentro de _lock: un upsert/remove concurrente vacía la caché después, no antes
+            self.cache.set(cache_key, results)
+        return results
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @staticmethod
+    def _scan(entries: List[Tuple[str, int]], prefix: str, limit: int, ids: List[int]) -> List[int]:
+        position = bisect_left(entries, (prefix,))
+        while position < len(entries) and len(ids) < limit:
+            key, startup_id = entries[position]
+            if not key.startswith(prefix):
+                break
+            if startup_id not in ids:
+                ids.append(startup_id)
+            position += 1
+        return ids
+
+    def _remove(self, startup_id: int) -> None:
+        doc = self._docs.pop(startup_id, None)
+        if doc is None:
+            return
+        self._discard(self._names, (fold(doc[0]), startup_id))
+        for key in _word_keys(doc[0]):
+            self._discard(self._words, (key, startup_id))
+
+    @staticmethod
+    def _discard(entries: List[Tuple[str, int]], entry: Tuple[str, int]) -> None:
+        position = bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+
+@lru_cache
+def get_autocomplete_engine() -> AutocompleteEngine:
+    return AutocompleteEngine(ttl=get_settings().autocomplete_ttl_seconds)
@@ -0,0 +1,88 @@
+"""Catálogo de categorías en memoria.
+
+Category es una tabla pequeña y estática: la API no escribe en ella (se
+carga con ``Database/seeds``) y cada worker la carga al
+arrancar en una instantánea inmutable (id -> ``CategoryOut``) que sirven los
+endpoints de categorías y de la que ``StartupService`` toma ``category_name``
+sin unir Category en cada lectura de startups.
+
+La instantánea se recarga entera (nunca se modifica en sitio) cuando:
+
+- vence ``CATEGORY_CATALOG_TTL_SECONDS``, para ver cambios hechos
+  directamente en la base de datos;
+- se pide un id desconocido (a lo sumo una recarga por segundo).
+"""
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.http_cache import ResourceVersion, resource_version
+from app.models.category import Category
+from app.schemas.startup_crud import CategoryOut
+
+# Intervalo mínimo entre recargas provocadas por ids desconocidos
+MISS_RELOAD_INTERVAL = 1.0
+
+
+class CategorySnapshot:
+    """Contenido del catálogo en un momento dado; no cambia una vez creado."""
+
+    __slots__ = ("by_id", "ordered", "version", "loaded_at")
+
+    def __init__(self, categories, loaded_at: float):
+        ordered = tuple(sorted(categories, key=lambda c: c.category_id))
+        self.ordered: Tuple[CategoryOut, ...] = ordered
+        self.by_id: Mapping[int, CategoryOut] = MappingProxyType({c.category_id: c for c in ordered})
+        self.version: ResourceVersion = resource_version(
+            (c.category_id, c.name, c.description) for c in ordered
+        )
+        self.loaded_at = loaded_at
+
+
+class CategoryCatalog:
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self._snapshot: Optional[CategorySnapshot] = None
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def load(self, db: Session) -> CategorySnapshot:
+        """Lee Category y publica una instantánea nueva."""
+        rows = db.execute(select(Category)).scalars().all()
+        snapshot = CategorySnapshot([CategoryOut.model_validate(row) for row in rows], time.monotonic())
+        with self._lock:
+            self._snapshot = snapshot
+            self.reloads += 1
+        return snapshot
+
+    def snapshot(self, db: Session) -> CategorySnapshot:
+        snapshot = self._snapshot
+        if snapshot is None or (self.ttl and time.monotonic() - snapshot.loaded_at > self.ttl):
+            snapshot = self.load(db)
+        return snapshot
+
+    def all(self, db: Session) -> Tuple[CategoryOut, ...]:
+        return self.snapshot(db).ordered
+
+    def get(self, db: Session, category_id: int) -> Optional[CategoryOut]:
+        snapshot = self.snapshot(db)
+        category = snapshot.by_id.get(category_id)
+        if category is None and time.monotonic() - snapshot.loaded_at > MISS_RELOAD_INTERVAL:
+            # Categoría creada después de la última carga
+            category = self.load(db).by_id.get(category_id)
+        return category
+
+    def name(self, db: Session, category_id: int) -> Optional[str]:
+        category = self.get(db, category_id)
+        return category.name if category else None
+
+
+@lru_cache
+def get_category_catalog() -> CategoryCatalog:
+    return CategoryCatalog(ttl=get_settings().category_catalog_ttl_seconds)
@@ -1,75 +1,69 @@
 from sqlalchemy.orm import Session
-from app.repositories.comment_repository import CommentRepository
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.comment_repository import AsyncCommentRepository, CommentRepository
 from app.schemas.comment import CommentCreate, CommentUpdate
-from app.models.comment import Comment
+from app.repositories.entity_checks import foreign_keys_as_not_found
+from app.core.http_cache import ResourceVersion, resource_version
+from app.core.pagination import decode_cursor, encode_cursor
+from app.services.read_cache import invalidate_comments
+from datetime import datetime
+
+
+def _decode_after(cursor: str | None) -> tuple | None:
+    if not cursor:
+        return None
+    created_date, comment_id = decode_cursor(cursor, scope="comments", size=2)
+    try:
+        return datetime.fromisoformat(created_date), int(comment_id)
+    except (TypeError, ValueError):
+        raise ValueError("Cursor inválido")
+
+
+def _page(comments: list[dict], limit: int) -> tuple[list[dict], str | None]:
+    if len(comments) <= limit:
+        return comments, None
+    comments = comments[:limit]
+    last = comments[-1]
+    return comments, encode_cursor((last["created_date"], last["comment_id"]), scope="comments")
 
 
 class CommentService:
     def __init__(self, db: Session):
         self.repo = CommentRepository(db)
 
-    def _assert_entities(self, user_id: int, startup_id: int):
-        user_exists = self.repo.db.execute(text("SELECT 1 FROM `User` WHERE user_id=:uid"), {"uid": user_id}).fetchone()
-        startup_exists = self.repo.db.execute(text("SELECT 1 FROM Startup WHERE startup_id=:sid"), {"sid": startup_id}).fetchone()
-        if not user_exists:
-            raise ValueError("User not found")
-        if not startup_exists:
-            raise ValueError("Startup not found")
-
     def create(self, user_id: int, payload: CommentCreate) -> dict:  # MODIFICADO: retornar dict
-        self._assert_entities(user_id, payload.startup_id)
-        comment = self.repo.create(user_id=user_id, content=payload.content, startup_id=payload.startup_id)
-
-        # Obtener el nombre del usuario para el comentario creado
-        user = self.repo.db.execute(
-            text("SELECT first_name, last_name FROM `User` WHERE user_id=:uid"),
-            {"uid": user_id}
-        ).fetchone()
-
-        user_name = f"{user.first_name} {user.last_name}" if user else f"Usuario {user_id}"
-
-        return {
-            "comment_id": comment.comment_id,
-            "content": comment.content,
-            "created_date": comment.created_date,
-            "modified_date": comment.modified_date,
-            "user_id": comment.user_id,
-            "startup_id": comment.startup_id,
-            "user_name": user_name
-        }
-
-    def list(self, startup_id: int | None, *, skip: int = 0, limit: int = 50):
+        # Sin consultas previas: las FK de User/Startup validan la escritura
+        with foreign_keys_as_not_found(self.repo.db, user_id, payload.startup_id):
+            comment = self.repo.create(user_id=user_id, content=payload.content, startup_id=payload.startup_id)
+        invalidate_comments(payload.startup_id)
+        return comment
+
+    def list(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
         if startup_id is None:
-            return self.repo.list_all(skip=skip, limit=limit)
-        return self.repo.list_by_startup(startup_id, skip=skip, limit=limit)
+            return self.repo.list_all(skip=skip, limit=limit, after=after)
+        return self.repo.list_by_startup(startup_id, skip=skip, limit=limit, after=after)
+
+    def list_page(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, cursor: str | None = None):
+        """Página de comentarios y cursor de la siguiente (``None`` si no hay más).
+
+        Con ``cursor`` se ignora ``skip``. Lanza ``ValueError`` si el cursor no es válido.
+        """
+        # Una fila de más indica si existe página siguiente
+        comments = self.list(startup_id, skip=skip, limit=limit + 1, after=_decode_after(cursor))
+        return _page(comments, limit)
+
+    def list_version(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, cursor: str | None = None) -> ResourceVersion:
+        """Versión de la página que devolvería ``list_page`` (incluye la fila de más del cursor)."""
+        return resource_version(self.repo.version_rows(startup_id, skip=skip, limit=limit + 1, after=_decode_after(cursor)))
 
     def update(self, comment_id: int, user_id: int, payload: CommentUpdate) -> dict:  # MODIFICADO: retornar dict
-        comment = self.repo.get(comment_id)
+        # Una sola lectura: comentario y nombre del autor
+        comment = self.repo.get_with_author(comment_id)
         if not comment:
             raise ValueError("Comment not found")
-        if comment.user_id != user_id:
+        if comment["user_id"] != user_id:
             raise PermissionError("Cannot modify another user's comment")
-        self._assert_entities(user_id, comment.startup_id)
-        updated_comment = self.repo.update(comment, payload.content)
-
-        # Obtener el nombre del usuario
-        user = self.repo.db.execute(
-            text("SELECT first_name, last_name FROM `User` WHERE user_id=:uid"),
-            {"uid": user_id}
-        ).fetchone()
-
-        user_name = f"{user.first_name} {user.last_name}" if user else f"Usuario {user_id}"
-
-        return {
-            "comment_id": updated_comment.comment_id,
-            "content": updated_comment.content,
-            "created_date": updated_comment.created_date,
-            "modified_date": updated_comment.modified_date,
-            "user_id": updated_comment.user_id,
-            "startup_id": updated_comment.startup_id,
-            "user_name": user_name
-        }
+        return self.repo.update(comment, payload.content)
 
     def delete(self, comment_id: int, user_id: int) -> None:
         comment = self.repo.get(comment_id)
@@ -77,5 +71,27 @@ class CommentService:
             raise ValueError("Comment not found")
         if comment.user_id != user_id:
             raise PermissionError("Cannot delete another user's comment")
-        self._assert_entities(user_id, comment.startup_id)
-        self.repo.delete(comment)
\ No newline at end of file
+        startup_id = comment.startup_id
+        self.repo.delete(comment)
+        invalidate_comments(startup_id)
+
+
+class AsyncCommentService:
+    """Listado de comentarios sobre ``AsyncSession`` para los endpoints de lectura."""
+
+    def __init__(self, db: AsyncSession):
+        self.repo = AsyncCommentRepository(db)
+
+    async def list(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, after: tuple | None = None):
+        if startup_id is None:
+            return await self.repo.list_all(skip=skip, limit=limit, after=after)
+        return await self.repo.list_by_startup(startup_id, skip=skip, limit=limit, after=after)
+
+    async def list_page(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, cursor: str | None = None):
+        comments = await self.list(startup_id, skip=skip, limit=limit + 1, after=_decode_after(cursor))
+        return _page(comments, limit)
+
+    async def list_version(self, startup_id: int | None, *, skip: int = 0, limit: int = 50, cursor: str | None = None) -> ResourceVersion:
+        """Versión de la página que devolvería ``list_page`` (incluye la fila de más del cursor)."""
+        rows = await self.repo.version_rows(startup_id, skip=skip, limit=limit + 1, after=_decode_after(cursor))
+        return resource_version(rows)
@@ -0,0 +1,153 @@
+"""Tareas periódicas del worker (ranking trending, snapshot de votos).
+
+``PeriodicJob`` ejecuta ``task(db)`` en el threadpool al arrancar y luego cada
+``interval`` segundos, con su propia sesión; el ``lifespan`` de la app la
+arranca y la detiene. Un fallo se registra y se reintenta en el ciclo
+siguiente.
+
+Con varios workers, ``LeaderLock`` elige uno solo para ejecutar la tarea: en
+MySQL es un candado con nombre (``GET_LOCK``) sostenido por una conexión
+propia, que el servidor libera si el worker muere; los demás lo reintentan
+en cada ciclo y, si hay ``follower_task``, ejecutan esa en su lugar. Otros motores no tienen candados entre procesos y todo
+proceso se considera líder (SQLite se usa con un solo worker).
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLock:
+    """Candado entre workers: ``acquire()`` es True solo en el que lo tiene."""
+
+    def __init__(self, engine: Engine, name: str):
+        self.engine = engine
+        self.name = name
+        self._conn: Optional[Connection] = None
+
+    @property
+    def supported(self) -> bool:
+        return self.engine.dialect.name == "mysql"
+
+    @property
+    def held(self) -> bool:
+        return self._conn is not None or not self.supported
+
+    def _scalar(self, sql: str):
+        value = self._conn.execute(text(sql), {"name": self.name}).scalar()
+        # GET_LOCK no es transaccional: no dejar la transacción abierta
+        self._conn.commit()
+        return value
+
+    def acquire(self) -> bool:
+        if not self.supported:
+            return True
+        if self._conn is not None:
+            try:
+                # La conexión pudo cortarse (wait_timeout) y con ella el candado
+                if self._scalar("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"):
+                    return True
+            except Exception:
+                logger.warning("Se perdió la conexión del candado %s", self.name, exc_info=True)
+            self.release()
+        self._conn = self.engine.connect()
+        try:
+            if self._scalar("SELECT GET_LOCK(:name, 0)") == 1:
+                logger.info("Este worker es el líder de %s", self.name)
+                return True
+        except Exception:
+            self.release()
+            raise
+        self.release()
+        return False
+
+    def release(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+        except Exception:
+            # Al cerrar la conexión el servidor libera el candado igual
+            pass
+        finally:
+            conn.close()
+
+
+class PeriodicJob:
+    def __init__(self, name: str, session_factory: Callable[[], Session], task: Callable[[Session], Any], *,
+                 interval: float = 300, leader: Optional[LeaderLock] = None,
+                 follower_task: Optional[Callable[[Session], Any]] = None):
+        self.name = name
+        self.session_factory = session_factory
+        self.task = task
+        self.interval = interval
+        self.leader = leader
+        self.follower_task = follower_task
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+        self.runs = 0
+        self.failed_runs = 0
+        # Ciclos en que otro worker era el líder (con o sin follower_task)
+        self.skipped_runs = 0
+        self.last_result: Any = None
+        self.last_run_seconds = 0.0
+        self.last_run_at: Optional[datetime] = None
+
+    def run_once(self) -> Any:
+        task = self.task
+        if self.leader is not None and not self.leader.acquire():
+            self.skipped_runs += 1
+            if self.follower_task is None:
+                return None
+            task = self.follower_task
+        started = time.perf_counter()
+        with self.session_factory() as db:
+            self.last_result = task(db)
+        self.last_run_seconds = time.perf_counter() - started
+        self.last_run_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.runs += 1
+        return self.last_result
+
+    async def start(self) -> None:
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._stop.set()
+            await self._task
+            self._task = None
+        if self.leader is not None:
+            await asyncio.to_thread(self.leader.release)
+
+    async def _run(self) -> None:
+        # Primera ejecución al arrancar; luego cada intervalo
+        while not self._stop.is_set():
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception:
+                self.failed_runs += 1
+                logger.exception("Error en la tarea periódica %s; se reintenta en el próximo ciclo", self.name)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def metrics(self) -> dict:
+        return {
+            "runs": self.runs,
+            "failed_runs": self.failed_runs,
+            "skipped_runs": self.skipped_runs,
+            "leader": self.leader.held if self.leader is not None else True,
+            "last_result": self.last_result,
+            "last_run_ms": round(self.last_run_seconds * 1000, 2),
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
@@ -0,0 +1,53 @@
+"""Caché de lectura para el detalle de startups y los conteos de votos.
+
+``GET /startups/{id}``, ``/startups/{id}/with-stats`` y ``/votes/count/{id}``
+se sirven desde la caché (``CACHE_BACKEND``: memory | redis | none). Las
+escrituras que cambian esos datos invalidan sus claves explícitamente; el TTL
+(``CACHE_TTL_SECONDS``) acota lo que un worker puede servir desactualizado
+cuando la escritura ocurrió en otro worker con la caché en memoria.
+"""
+from functools import lru_cache
+
+from app.core.cache import CacheBackend, LRUCache, NullCache, RedisCache
+from app.core.config import get_settings
+
+
+def startup_key(startup_id: int) -> str:
+    return f"startup:{startup_id}"
+
+
+def startup_stats_key(startup_id: int) -> str:
+    return f"startup_stats:{startup_id}"
+
+
+def vote_count_key(startup_id: int) -> str:
+    return f"vote_count:{startup_id}"
+
+
+@lru_cache
+def get_read_cache() -> CacheBackend:
+    settings = get_settings()
+    if settings.cache_backend == "none" or not settings.cache_ttl_seconds:
+        return NullCache()
+    if settings.cache_backend == "redis":
+        import redis  # dependencia opcional: solo con CACHE_BACKEND=redis
+
+        return RedisCache(redis.Redis.from_url(settings.cache_url), ttl=settings.cache_ttl_seconds)
+    if settings.cache_backend != "memory":
+        raise ValueError(f"CACHE_BACKEND desconocido: {settings.cache_backend}")
+    return LRUCache(settings.cache_max_entries, ttl=settings.cache_ttl_seconds)
+
+
+def invalidate_startup(startup_id: int) -> None:
+    """Datos de la startup (nombre, categoría...) cambiaron o se borró."""
+    get_read_cache().delete(startup_key(startup_id), startup_stats_key(startup_id), vote_count_key(startup_id))
+
+
+def invalidate_votes(*startup_ids: int) -> None:
+    cache = get_read_cache()
+    for startup_id in startup_ids:
+        cache.delete(vote_count_key(startup_id), startup_stats_key(startup_id))
+
+
+def invalidate_comments(startup_id: int) -> None:
+    get_read_cache().delete(startup_stats_key(startup_id))
@@ -0,0 +1,248 @@
+"""Backends de búsqueda de texto para SearchService.
+
+Cada backend traduce el término del usuario a un filtro SQL sobre Startup:
+
+- ``mysql``: índice FULLTEXT con ``MATCH ... AGAINST`` en modo booleano.
+- ``sqlite``: tabla virtual FTS5 ``StartupFTS`` sincronizada por triggers.
+- ``like``: ``ILIKE '%term%'`` (comportamiento original, sin índice).
+
+``get_search_backend`` elige según el dialecto del engine y cae a ``like``
+si el índice todavía no fue creado por la migración. La elección se guarda por
+engine; ``like`` por falta de índice se vuelve a comprobar cada
+``FALLBACK_RECHECK_SECONDS`` (la migración corre en otro proceso) y
+``SQLiteFTS5Backend.install`` descarta la elección al instante.
+"""
+import re
+import time
+from abc import ABC, abstractmethod
+
+from sqlalchemy import and_, or_, select, text, literal, literal_column, table, column, case, func
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import get_settings
+from app.models.startup import Startup
+
+# Solo se conservan palabras: descarta los operadores de las sintaxis booleanas de MySQL y FTS5
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+startup_fts = table("StartupFTS", column("rowid"), column("name"), column("description"))
+
+
+def tokenize(term: str) -> list[str]:
+    return _TOKEN_RE.findall(term.lower())
+
+
+def _text_relevance(col, term: str):
+    """Puntaje 0..1 de ``term`` sobre una columna de texto, como expresión SQL.
+
+    Niveles (de mayor a menor): coincidencia exacta 1.0, inicio de palabra 0.9,
+    varias palabras 0.4-0.7 según cuántas aparecen, subcadena 0.3. Los
+    términos de 1-2 caracteres solo puntúan (0.8) al inicio de una palabra.
+    """
+    text_lower = func.lower(func.coalesce(col, ""))
+    word_start = or_(
+        text_lower.startswith(term, autoescape=True),
+        text_lower.contains(" " + term, autoescape=True),
+    )
+    if len(term) <= 2:
+        return case((word_start, 0.8), else_=0.0)
+
+    whens = [(text_lower == term, 1.0), (word_start, 0.9)]
+    search_words = term.split()
+    if len(search_words) > 1:
+        matches = sum(
+            (case((text_lower.contains(w, autoescape=True), 1), else_=0) for w in search_words),
+            literal(0),
+        )
+        whens.append((matches > 0, 0.4 + matches * (0.3 / len(search_words))))
+    whens.append((text_lower.contains(term, autoescape=True), 0.3))
+    return case(*whens, else_=0.0)
+
+
+class SearchBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    def match(self, term: str):
+        """Expresión booleana para ``WHERE`` que selecciona startups que coinciden."""
+
+    def condition(self, term: str):
+        """Filtro completo de la búsqueda: ``match`` y relevancia mayor que 0.
+
+        ``match`` con LIKE es un prefiltro grueso ("ro" coincide dentro de
+        "Agro"); los backends cuyo índice ya exige inicio de palabra lo
+        reemplazan por ``match`` solo.
+        """
+        return and_(self.match(term), self.relevance(term) > 0)
+
+    def relevance(self, term: str):
+        """Expresión SQL con el puntaje de relevancia (máximo entre nombre y descripción)."""
+        term = term.lower().strip()
+        name_score = _text_relevance(Startup.name, term)
+        description_score = _text_relevance(Startup.description, term)
+        return case((name_score >= description_score, name_score), else_=description_score)
+
+
+class LikeSearchBackend(SearchBackend):
+    name = "like"
+
+    def match(self, term: str):
+        if len(term) >= 2:
+            pattern = f"%{term}%"
+            return or_(Startup.name.ilike(pattern), Startup.description.ilike(pattern))
+        # Para 1 carácter, buscar solo al INICIO
+        return or_(Startup.name.ilike(term + "%"), Startup.description.ilike(term + "%"))
+
+
+class MySQLFullTextBackend(SearchBackend):
+    name = "mysql"
+
+    # innodb_ft_min_token_size por defecto: los tokens más cortos no se indexan
+    MIN_TOKEN_SIZE = 3
+
+    def __init__(self):
+        self._fallback = LikeSearchBackend()
+
+    def _uses_index(self, term: str) -> bool:
+        tokens = tokenize(term)
+        return bool(tokens) and min(len(t) for t in tokens) >= self.MIN_TOKEN_SIZE
+
+    def condition(self, term: str):
+        # MATCH con "+token*" ya exige inicio de palabra
+        return self.match(term) if self._uses_index(term) else self._fallback.condition(term)
+
+    def match(self, term: str):
+        if not self._uses_index(term):
+            return self._fallback.match(term)
+        tokens = tokenize(term)
+        against = " ".join(f"+{t}*" for t in tokens)
+        return match(Startup.name, Startup.description, against=against).in_boolean_mode()
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    name = "sqlite"
+
+    # Única copia del DDL: la usan la migración 20261018_000003, los tests y
+    # las bases SQLite locales creadas con Base.metadata.create_all.
+    DDL = (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS StartupFTS USING fts5("
+        "name, description, content='Startup', content_rowid='startup_id', "
+        "tokenize='unicode61 remove_diacritics 2')",
+        "CREATE TRIGGER IF NOT EXISTS startup_fts_ai AFTER INSERT ON Startup BEGIN "
+        "INSERT INTO StartupFTS(rowid, name, description) VALUES (new.startup_id, new.name, new.description); END",
+        "CREATE TRIGGER IF NOT EXISTS startup_fts_ad AFTER DELETE ON Startup BEGIN "
+        "INSERT INTO StartupFTS(StartupFTS, rowid, name, description) "
+        "VALUES ('delete', old.startup_id, old.name, old.description); END",
+        "CREATE TRIGGER IF NOT EXISTS startup_fts_au AFTER UPDATE ON Startup BEGIN "
+        "INSERT INTO StartupFTS(StartupFTS, rowid, name, description) "
+        "VALUES ('delete', old.startup_id, old.name, old.description); "
+        "INSERT INTO StartupFTS(rowid, name, description) VALUES (new.startup_id, new.name, new.description); END",
+        # Indexar las filas existentes
+        "INSERT INTO StartupFTS(StartupFTS) VALUES ('rebuild')",
+    )
+    DROP_DDL = (
+        "DROP TRIGGER IF EXISTS startup_fts_au",
+        "DROP TRIGGER IF EXISTS startup_fts_ad",
+        "DROP TRIGGER IF EXISTS startup_fts_ai",
+        "DROP TABLE IF EXISTS StartupFTS",
+    )
+
+    def __init__(self):
+        self._fallback = LikeSearchBackend()
+
+    @classmethod
+    def install(cls, conn) -> None:
+        for statement in cls.DDL:
+            conn.execute(text(statement))
+        reset_search_backends(conn.engine)
+
+    def condition(self, term: str):
+        # Prefijos de token: exigen inicio de palabra y pliegan acentos, que la
+        # relevancia en SQL no pliega ("analitica" encuentra "Analítica" con 0)
+        return self.match(term) if tokenize(term) else self._fallback.condition(term)
+
+    def match(self, term: str):
+        tokens = tokenize(term)
+        if not tokens:
+            return self._fallback.match(term)
+        # Cada token como prefijo entre comillas: "eco"* "tech"*
+        fts_query = " ".join(f'"{t}"*' for t in tokens)
+        matching_ids = select(startup_fts.c.rowid).where(
+            literal_column("StartupFTS").op("MATCH")(fts_query)
+        )
+        return Startup.startup_id.in_(matching_ids)
+
+
+def _has_mysql_fulltext(conn: Connection) -> bool:
+    return conn.execute(text(
+        "SELECT 1 FROM information_schema.STATISTICS "
+        "WHERE table_schema = DATABASE() AND table_name = 'Startup' AND index_type = 'FULLTEXT' LIMIT 1"
+    )).first() is not None
+
+
+def _has_sqlite_fts(conn: Connection) -> bool:
+    return conn.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'StartupFTS'"
+    )).first() is not None
+
+
+def _select_backend(conn: Connection, preferred: str) -> SearchBackend:
+    dialect = conn.dialect.name
+    if preferred in ("auto", "mysql") and dialect == "mysql" and _has_mysql_fulltext(conn):
+        return MySQLFullTextBackend()
+    if preferred in ("auto", "sqlite") and dialect == "sqlite" and _has_sqlite_fts(conn):
+        return SQLiteFTS5Backend()
+    return LikeSearchBackend()
+
+
+# Segundos tras los que se vuelve a buscar el índice cuando se eligió ``like`` por su ausencia
+FALLBACK_RECHECK_SECONDS = 60.0
+
+# (engine síncrono, SEARCH_BACKEND) -> (backend, instante de nueva comprobación o None)
+_backends: dict = {}
+
+
+def _remember(key, backend: SearchBackend, preferred: str) -> SearchBackend:
+    recheck_at = None
+    if isinstance(backend, LikeSearchBackend) and preferred != "like":
+        recheck_at = time.monotonic() + FALLBACK_RECHECK_SECONDS
+    _backends[key] = (backend, recheck_at)
+    return backend
+
+
+def _cached(key):
+    entry = _backends.get(key)
+    if entry is None or (entry[1] is not None and entry[1] <= time.monotonic()):
+        return None
+    return entry[0]
+
+
+def reset_search_backends(engine: Engine | None = None) -> None:
+    """Descarta la elección guardada (de ``engine`` o de todos) tras crear o borrar el índice."""
+    if engine is None:
+        _backends.clear()
+        return
+    for key in [key for key in _backends if key[0] is engine]:
+        del _backends[key]
+
+
+def get_search_backend(engine: Engine) -> SearchBackend:
+    """Backend para el engine dado (``SEARCH_BACKEND``: auto | mysql | sqlite | like)."""
+    key = (engine, get_settings().search_backend)
+    backend = _cached(key)
+    if backend is None:
+        with engine.connect() as conn:
+            backend = _remember(key, _select_backend(conn, key[1]), key[1])
+    return backend
+
+
+async def get_async_search_backend(engine: AsyncEngine) -> SearchBackend:
+    """Igual que ``get_search_backend`` para un ``AsyncEngine``."""
+    key = (engine.sync_engine, get_settings().search_backend)
+    backend = _cached(key)
+    if backend is None:
+        async with engine.connect() as conn:
+            backend = _remember(key, await conn.run_sync(_select_backend, key[1]), key[1])
+    return backend
@@ -0,0 +1,151 @@
+"""Índice invertido en memoria para la búsqueda de startups.
+
+Alternativa a FULLTEXT/FTS5 para despliegues que no pueden crear el índice
+en la base de datos (``SEARCH_INDEX_ENABLED=true``). Se construye al arrancar
+la aplicación desde la tabla Startup y se actualiza de forma incremental desde
+``StartupService.create/update/delete``.
+
+Cada proceso (worker de uvicorn) mantiene su propia copia: las escrituras
+hechas por otro worker no se ven hasta el siguiente arranque.
+"""
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.startup import Startup
+
+# Los prefijos de 1-2 caracteres se resuelven con una tabla precalculada
+# (los dos primeros niveles de un trie) en lugar de recorrer el vocabulario.
+SHORT_PREFIX_LEN = 2
+
+
+def score_text(text: str, term: str) -> float:
+    """Puntaje 0..1 de ``term`` (ya en minúsculas) sobre ``text``.
+
+    Mismos niveles que la expresión SQL de ``SearchBackend.relevance``.
+    """
+    if not term or not text:
+        return 0.0
+    text_lower = text.lower()
+    words = text_lower.split()
+
+    if len(term) <= SHORT_PREFIX_LEN:
+        return 0.8 if any(word.startswith(term) for word in words) else 0.0
+
+    if term == text_lower:
+        return 1.0
+    if any(word.startswith(term) for word in words):
+        return 0.9
+    search_words = term.split()
+    if len(search_words) > 1:
+        matches = sum(1 for s_word in search_words if s_word in text_lower)
+        if matches > 0:
+            return 0.4 + matches * (0.3 / len(search_words))
+    if term in text_lower:
+        return 0.3
+    return 0.0
+
+
+class StartupSearchIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs: Dict[int, tuple[str, str]] = {}
+        self._postings: Dict[str, set[int]] = defaultdict(set)
+        self._short_prefixes: Dict[str, set[int]] = defaultdict(set)
+        self.loaded = False
+
+    def build(self, db: Session) -> int:
+        """Carga (o recarga) el índice completo desde la tabla Startup."""
+        rows = db.execute(select(Startup.startup_id, Startup.name, Startup.description)).all()
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._short_prefixes.clear()
+            for startup_id, name, description in rows:
+                self._add(startup_id, name, description)
+            self.loaded = True
+        return len(rows)
+
+    def upsert(self, startup_id: int, name: str, description: Optional[str]) -> None:
+        if not self.loaded:
+            return
+        with self._lock:
+            self._remove(startup_id)
+            self._add(startup_id, name, description)
+
+    def remove(self, startup_id: int) -> None:
+        if not self.loaded:
+            return
+        with self._lock:
+            self._remove(startup_id)
+
+    def search(self, term: str) -> Dict[int, float]:
+        """Devuelve ``{startup_id: relevancia}`` para los documentos con puntaje > 0."""
+        term = term.lower().strip()
+        if not term:
+            return {}
+        with self._lock:
+            candidates = self._candidates(term)
+            scores = {}
+            for startup_id in candidates:
+                name, description = self._docs[startup_id]
+                score = max(score_text(name, term), score_text(description, term))
+                if score > 0:
+                    scores[startup_id] = score
+            return scores
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _candidates(self, term: str) -> set[int]:
+        if len(term) <= SHORT_PREFIX_LEN:
+            return set(self._short_prefixes.get(term, ()))
+        # Todo documento con puntaje > 0 contiene alguna palabra del término
+        # como subcadena de uno de sus tokens: se recorre el vocabulario, no
+        # los documentos.
+        candidates: set[int] = set()
+        search_words = term.split()
+        for token, ids in self._postings.items():
+            if any(s_word in token for s_word in search_words):
+                candidates |= ids
+        return candidates
+
+    def _tokens(self, *texts: Optional[str]) -> Iterable[str]:
+        tokens = set()
+        for text in texts:
+            if text:
+                tokens.update(text.lower().split())
+        return tokens
+
+    def _add(self, startup_id: int, name: str, description: Optional[str]) -> None:
+        self._docs[startup_id] = (name or "", description or "")
+        for token in self._tokens(name, description):
+            self._postings[token].add(startup_id)
+            for size in range(1, min(SHORT_PREFIX_LEN, len(token)) + 1):
+                self._short_prefixes[token[:size]].add(startup_id)
+
+    def _remove(self, startup_id: int) -> None:
+        doc = self._docs.pop(startup_id, None)
+        if doc is None:
+            return
+        for token in self._tokens(*doc):
+            ids = self._postings.get(token)
+            if ids is not None:
+                ids.discard(startup_id)
+                if not ids:
+                    del self._postings[token]
+            for size in range(1, min(SHORT_PREFIX_LEN, len(token)) + 1):
+                prefix_ids = self._short_prefixes.get(token[:size])
+                if prefix_ids is not None:
+                    prefix_ids.discard(startup_id)
+                    if not prefix_ids:
+                        del self._short_prefixes[token[:size]]
+
+
+@lru_cache
+def get_search_index() -> StartupSearchIndex:
+    return StartupSearchIndex()
@@ -1,210 +1,309 @@
+from bisect import bisect_right
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func, case
-from sqlalchemy.sql import expression
-from typing import List, Optional, Dict, Any
-import re
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, literal, null, select
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from app.core.pagination import decode_cursor, encode_cursor, keyset_after
 
 from app.models.startup import Startup
-from app.models.comment import Comment
-from app.models.vote import Vote
+from app.models.startup_stats import StartupStats
+from app.models.startup_trending import StartupTrending
 from app.schemas.search import StartupSearchRequest, StartupSearchResult, SearchSortBy
+from app.services.autocomplete import get_autocomplete_engine
+from app.services.search_backend import SearchBackend, get_search_backend
+from app.services.search_index import get_search_index
+
+# Tamaño de lote para consultar estadísticas de los candidatos del índice en memoria
+INDEX_STATS_CHUNK = 1000
+
+TOTAL_VOTOS = func.coalesce(StartupStats.total_votes, 0)
+TOTAL_COMENTARIOS = func.coalesce(StartupStats.total_comments, 0)
+# Fuera del ranking precalculado = 0
+TRENDING_SCORE = func.coalesce(StartupTrending.score, 0.0)
+
+# Columnas de Startup que usa StartupSearchResult: se seleccionan solas, sin cargar entidades
+RESULT_COLUMNS = (
+    Startup.startup_id,
+    Startup.name,
+    Startup.description,
+    Startup.owner_user_id,
+    Startup.category_id,
+)
+
+# Claves de orden por criterio, como (campo de StartupSearchResult, descendente).
+# Son también los valores que guarda el cursor; startup_id siempre desempata.
+SORT_KEYS = {
+    SearchSortBy.VOTOS_ASC: (("total_votos", False),),
+    SearchSortBy.VOTOS_DESC: (("total_votos", True),),
+    SearchSortBy.COMENTARIOS_ASC: (("total_comentarios", False),),
+    SearchSortBy.COMENTARIOS_DESC: (("total_comentarios", True),),
+    SearchSortBy.TRENDING: (("trending_score", True),),
+}
+# relevancia por defecto (sin término equivale a ordenar por votos)
+DEFAULT_SORT_KEYS = (("relevance_score", True), ("total_votos", True))
+
+# Los resultados se validan como lista en una sola llamada a pydantic-core
+RESULT_LIST = TypeAdapter(List[StartupSearchResult])
+
+
+class _SearchQueries:
+    """Consultas y armado de resultados compartidos por SearchService y AsyncSearchService.
+
+    Las subclases solo ejecutan las sentencias (``Session`` o ``AsyncSession``).
+    """
+
+    def _filter_conditions(self, search_request: StartupSearchRequest) -> list:
+        filters = search_request.filters
+        if not filters:
+            return []
+        conditions = []
+        if filters.categorias:
+            conditions.append(Startup.category_id.in_(filters.categorias))
+        if filters.min_votos is not None:
+            conditions.append(TOTAL_VOTOS >= filters.min_votos)
+        if filters.min_comentarios is not None:
+            conditions.append(TOTAL_COMENTARIOS >= filters.min_comentarios)
+        return conditions
+
+    def _page_info(self, search_request: StartupSearchRequest, total: int) -> Dict[str, Any]:
+        return {
+            "total": total,
+            "page": (search_request.skip // search_request.limit) + 1,
+            "total_pages": (total + search_request.limit - 1) // search_request.limit if search_request.limit > 0 else 1
+        }
+
+    def _sort_keys(self, search_request: StartupSearchRequest) -> Tuple[Tuple[str, bool], ...]:
+        return SORT_KEYS.get(search_request.sort_by, DEFAULT_SORT_KEYS) + (("startup_id", False),)
+
+    def _cursor_scope(self, search_request: StartupSearchRequest) -> str:
+        return f"search:{search_request.sort_by.value}"
+
+    def _decode_cursor(self, search_request: StartupSearchRequest, keys: Sequence[Tuple[str, bool]]) -> Optional[list]:
+        if not search_request.cursor:
+            return None
+        values = decode_cursor(search_request.cursor, scope=self._cursor_scope(search_request), size=len(keys))
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            raise ValueError("Cursor inválido")
+        return values
+
+    def _next_cursor(self, search_request: StartupSearchRequest, keys: Sequence[Tuple[str, bool]],
+                     results: List[StartupSearchResult]) -> Optional[str]:
+        """Cursor tras la última fila de la página si se obtuvo una fila de más."""
+        if len(results) <= search_request.limit:
+            return None
+        last = results[search_request.limit - 1]
+        return encode_cursor([getattr(last, name) for name, _ in keys], scope=self._cursor_scope(search_request))
+
+    def _response(self, search_request: StartupSearchRequest, keys, results: List[StartupSearchResult],
+                  total: int) -> Dict[str, Any]:
+        return {
+            "results": results[:search_request.limit],
+            **self._page_info(search_request, total),
+            "next_cursor": self._next_cursor(search_request, keys, results),
+        }
+
+    def _search_statements(self, search_request: StartupSearchRequest, search_term: str):
+        """Sentencias (página, total) de la búsqueda en SQL y las claves de orden."""
+        # Relevancia calculada en SQL: ordenar, filtrar y paginar en una sola consulta
+        relevance = self.backend.relevance(search_term) if search_term else literal(0.0)
+        stmt = select(
+            *RESULT_COLUMNS,
+            TOTAL_COMENTARIOS.label('total_comentarios'),
+            TOTAL_VOTOS.label('total_votos'),
+            relevance.label('relevance_score'),
+        ).outerjoin(
+            StartupStats, Startup.startup_id == StartupStats.startup_id
+        )
+        if search_request.sort_by == SearchSortBy.TRENDING:
+            stmt = stmt.add_columns(TRENDING_SCORE.label('trending_score')).outerjoin(
+                StartupTrending, Startup.startup_id == StartupTrending.startup_id
+            )
+
+        # Aplicar búsqueda de texto (FULLTEXT / FTS5 / LIKE según el backend; sin filas de relevancia 0)
+        if search_term:
+            stmt = stmt.where(self.backend.condition(search_term))
+
+        # Aplicar filtros
+        stmt = stmt.where(*self._filter_conditions(search_request))
+
+        # Total sobre el mismo filtro que las filas devueltas
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+
+        columns = {
+            "relevance_score": relevance,
+            "total_votos": TOTAL_VOTOS,
+            "total_comentarios": TOTAL_COMENTARIOS,
+            "trending_score": TRENDING_SCORE,
+            "startup_id": Startup.startup_id,
+        }
+        keys = self._sort_keys(search_request)
+        after = self._decode_cursor(search_request, keys)
+        stmt = stmt.order_by(*(columns[name].desc() if desc else columns[name].asc() for name, desc in keys))
+
+        # Con cursor se continúa desde la última fila en lugar de usar OFFSET
+        if after is not None:
+            stmt = stmt.where(keyset_after([(columns[name], desc) for name, desc in keys], after))
+        else:
+            stmt = stmt.offset(search_request.skip)
+        return stmt.limit(search_request.limit + 1), count_stmt, keys
+
+    def _results_from_rows(self, rows) -> List[StartupSearchResult]:
+        return RESULT_LIST.validate_python([
+            {
+                **row._mapping,
+                "description": row.description or "",
+                "relevance_score": float(row.relevance_score),
+            }
+            for row in rows
+        ])
+
+    def _index_stats_statements(self, search_request: StartupSearchRequest, candidate_ids: List[int]):
+        """Contadores (y puntaje trending si se ordena por él) de los candidatos del índice, por lotes."""
+        conditions = self._filter_conditions(search_request)
+        trending = search_request.sort_by == SearchSortBy.TRENDING
+        for i in range(0, len(candidate_ids), INDEX_STATS_CHUNK):
+            stmt = (
+                select(Startup.startup_id, TOTAL_VOTOS, TOTAL_COMENTARIOS, TRENDING_SCORE if trending else null())
+                .outerjoin(StartupStats, Startup.startup_id == StartupStats.startup_id)
+                .where(Startup.startup_id.in_(candidate_ids[i:i + INDEX_STATS_CHUNK]), *conditions)
+            )
+            if trending:
+                stmt = stmt.outerjoin(StartupTrending, Startup.startup_id == StartupTrending.startup_id)
+            yield stmt
+
+    def _index_page(self, search_request: StartupSearchRequest, scores: Dict[int, float], stats: Dict[int, tuple]):
+        """Ordena los candidatos en memoria; devuelve (ids ordenados, ids de la página, claves)."""
+        keys = self._sort_keys(search_request)
+        after = self._decode_cursor(search_request, keys)
+
+        def key_values(sid):
+            return {"relevance_score": scores[sid], "total_votos": stats[sid][0],
+                    "total_comentarios": stats[sid][1], "trending_score": stats[sid][2], "startup_id": sid}
+
+        def sort_key(values):
+            return tuple(-values[name] if desc else values[name] for name, desc in keys)
+
+        ordered = sorted(stats, key=lambda sid: sort_key(key_values(sid)))
+        if after is not None:
+            start = bisect_right(ordered, sort_key(dict(zip((name for name, _ in keys), after))),
+                                 key=lambda sid: sort_key(key_values(sid)))
+        else:
+            start = search_request.skip
+        return ordered, ordered[start:start + search_request.limit + 1], keys
 
-class SearchService:
+    def _index_results(self, page_ids: List[int], startups: Dict[int, Any], scores: Dict[int, float],
+                       stats: Dict[int, tuple]) -> List[StartupSearchResult]:
+        return RESULT_LIST.validate_python([
+            {
+                "startup_id": sid,
+                "name": startups[sid].name,
+                "description": startups[sid].description or "",
+                "owner_user_id": startups[sid].owner_user_id,
+                "category_id": startups[sid].category_id,
+                "total_votos": stats[sid][0],
+                "total_comentarios": stats[sid][1],
+                "relevance_score": scores[sid],
+                "trending_score": stats[sid][2],
+            }
+            for sid in page_ids if sid in startups
+        ])
+
+
+class SearchService(_SearchQueries):
     def __init__(self, db: Session):
         self.db = db
-
-    def _calculate_relevance(self, text: str, search_term: str) -> float:
-        """Calcula un puntaje de relevancia basado en coincidencias"""
-        if not search_term or not text:
-            return 0.0
-        
-        search_term = search_term.lower().strip()
-        text_lower = text.lower()
-        
-        # Si el término es muy corto (1-2 caracteres), solo coincidencia al INICIO de palabra
-        if len(search_term) <= 2:
-            words = text_lower.split()
-            # Solo dar puntaje si está al INICIO de una palabra
-            for word in words:
-                if word.startswith(search_term):
-                    return 0.8  # Buen score solo si inicia palabra
-            return 0.0  # Cero si no inicia palabra
-        
-        # PARA TÉRMINOS DE 3+ CARACTERES
-        
-        # 1. Coincidencia EXACTA (máxima prioridad)
-        if search_term == text_lower:
-            return 1.0
-        
-        # 2. Coincidencia al INICIO de palabra
-        words = text_lower.split()
-        for word in words:
-            if word.startswith(search_term):
-                return 0.9
-        
-        # 3. Coincidencia de PALABRA COMPLETA
-        if search_term in words:
-            return 0.8
-        
-        # 4. Coincidencia de MÚLTIPLES PALABRAS (si el search_term tiene espacios)
-        search_words = search_term.split()
-        if len(search_words) > 1:
-            matches = 0
-            for s_word in search_words:
-                if any(s_word in word for word in words):
-                    matches += 1
-            if matches > 0:
-                return 0.4 + (matches / len(search_words)) * 0.3
-        
-        # 5. Coincidencia de SUBCADENA (último recurso)
-        if search_term in text_lower:
-            return 0.3
-        
-        return 0.0
+        self.backend = get_search_backend(db.get_bind())
+        self.index = get_search_index()
 
     def _build_base_query(self):
-        """Construye query base con joins para estadísticas"""
-        # Subquery para contar comentarios por startup
-        comentarios_subq = self.db.query(
-            Comment.startup_id,
-            func.count(Comment.comment_id).label('total_comentarios')
-        ).group_by(Comment.startup_id).subquery()
-
-        # Subquery para contar votos por startup
-        votos_subq = self.db.query(
-            Vote.startup_id,
-            func.count(Vote.vote_id).label('total_votos')
-        ).group_by(Vote.startup_id).subquery()
-
-        # Query principal con joins
+        """Construye query base con las estadísticas desnormalizadas de StartupStats"""
         query = self.db.query(
-            Startup,
-            func.coalesce(comentarios_subq.c.total_comentarios, 0).label('total_comentarios'),
-            func.coalesce(votos_subq.c.total_votos, 0).label('total_votos')
-        ).outerjoin(
-            comentarios_subq, Startup.startup_id == comentarios_subq.c.startup_id
+            *RESULT_COLUMNS,
+            TOTAL_COMENTARIOS.label('total_comentarios'),
+            TOTAL_VOTOS.label('total_votos')
         ).outerjoin(
-            votos_subq, Startup.startup_id == votos_subq.c.startup_id
+            StartupStats, Startup.startup_id == StartupStats.startup_id
         )
 
         return query
 
     def search_startups(self, search_request: StartupSearchRequest) -> Dict[str, Any]:
         """Búsqueda principal con todos los filtros y ordenamientos"""
-        query = self._build_base_query()
-        
-        # Aplicar búsqueda de texto con fuzzy matching
-        if search_request.query and search_request.query.strip():
-            search_term = search_request.query.strip()
-            search_pattern = f"%{search_term}%"
-        
-            # Filtro básico con LIKE - pero SOLO para búsquedas de 2+ caracteres
-            if len(search_term) >= 2:
-                query = query.filter(
-                    or_(
-                        Startup.name.ilike(search_pattern),
-                        Startup.description.ilike(search_pattern)
-                    )
-                )
-            else:
-                # Para 1 carácter, buscar solo al INICIO de palabras
-                query = query.filter(
-                    or_(
-                        Startup.name.ilike(search_term + "%"),  # "f%" - solo inicio
-                        Startup.description.ilike(search_term + "%")
-                    )
-                )
-        
-        # Aplicar filtros
-        if search_request.filters:
-            filters = search_request.filters
-            
-            if filters.categorias:
-                query = query.filter(Startup.category_id.in_(filters.categorias))
-            
-            if filters.min_votos is not None:
-                query = query.filter(expression.column('total_votos') >= filters.min_votos)
-            
-            if filters.min_comentarios is not None:
-                query = query.filter(expression.column('total_comentarios') >= filters.min_comentarios)
-        
-        # Sort
-        sort_mappings = {
-            SearchSortBy.VOTOS_ASC: expression.column('total_votos').asc(),
-            SearchSortBy.VOTOS_DESC: expression.column('total_votos').desc(),
-            SearchSortBy.COMENTARIOS_ASC: expression.column('total_comentarios').asc(),
-            SearchSortBy.COMENTARIOS_DESC: expression.column('total_comentarios').desc(),
-        }
-    
-        # Aplicar sort
-        if search_request.sort_by in sort_mappings:
-            query = query.order_by(sort_mappings[search_request.sort_by])
-        else:  # relevancia por defecto
-            if search_request.query and search_request.query.strip():
-                search_term = search_request.query.strip()
-                search_pattern = f"%{search_term}%"
-                query = query.order_by(
-                Startup.name.ilike(search_pattern).desc(),
-                Startup.description.ilike(search_pattern).desc(),
-                expression.column('total_votos').desc()
-                )
-            else:
-                query = query.order_by(expression.column('total_votos').desc())
-        
-        # Obtener total para paginación
-        total = query.count()
-        
-        # Aplicar paginación
-        results = query.offset(search_request.skip).limit(search_request.limit).all()
-        
-        # Procesar resultados con relevancia 
-        processed_results = []
-        for startup, total_comentarios, total_votos in results:
-            relevance_score = 0.0
-            if search_request.query:
-                relevance_score = max(
-                    self._calculate_relevance(startup.name, search_request.query),
-                    self._calculate_relevance(startup.description or "", search_request.query)
-                )
-            
-            # SOLO agregar si tiene relevancia > 0 O si no hay query de búsqueda
-            if not search_request.query or relevance_score > 0:
-                processed_results.append(StartupSearchResult(
-                    startup_id=startup.startup_id,
-                    name=startup.name,
-                    description=startup.description or "",
-                    owner_user_id=startup.owner_user_id,
-                    category_id=startup.category_id,
-                    total_votos=total_votos,
-                    total_comentarios=total_comentarios,
-                    relevance_score=relevance_score
-                ))
-        
-        # ORDENAR por relevancia si es búsqueda con query
-        if search_request.query and search_request.sort_by == SearchSortBy.RELEVANCIA:
-            processed_results.sort(key=lambda x: x.relevance_score, reverse=True)
-        
-        return {
-            "results": processed_results,
-            "total": len(processed_results),  # Usar el count real después de filtrar por relevancia
-            "page": (search_request.skip // search_request.limit) + 1,
-            "total_pages": (len(processed_results) + search_request.limit - 1) // search_request.limit if search_request.limit > 0 else 1
-        }
+        search_term = (search_request.query or "").strip()
+        if search_term and self.index.loaded:
+            return self._search_with_index(search_request, search_term)
+
+        stmt, count_stmt, keys = self._search_statements(search_request, search_term)
+        total = self.db.execute(count_stmt).scalar_one()
+        results = self._results_from_rows(self.db.execute(stmt).all())
+        return self._response(search_request, keys, results, total)
+
+    def _search_with_index(self, search_request: StartupSearchRequest, search_term: str) -> Dict[str, Any]:
+        """Búsqueda con el índice invertido en memoria.
+
+        El índice da los candidatos y su relevancia; la base de datos solo
+        aporta contadores/filtros de esos candidatos (filas livianas) y las
+        columnas de resultado de la página pedida.
+        """
+        scores = self.index.search(search_term)
+        stats = {}
+        for stmt in self._index_stats_statements(search_request, list(scores)):
+            for startup_id, votos, comentarios, trending in self.db.execute(stmt):
+                stats[startup_id] = (votos, comentarios, trending)
+
+        ordered, page_ids, keys = self._index_page(search_request, scores, stats)
+        startups = {}
+        if page_ids:
+            startups = {
+                row.startup_id: row
+                for row in self.db.execute(select(*RESULT_COLUMNS).where(Startup.startup_id.in_(page_ids)))
+            }
+        results = self._index_results(page_ids, startups, scores, stats)
+        return self._response(search_request, keys, results, len(ordered))
 
     def autocomplete(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Autocompletado rápido de nombres de startups"""
+        """Autocompletado rápido de nombres de startups (motor en memoria)"""
         if not query or len(query.strip()) < 2:
             return []
-        
-        search_term = query.strip()
-        search_pattern = f"%{search_term}%"
-        
-        startups = self.db.query(Startup).filter(
-            Startup.name.ilike(search_pattern)
-        ).order_by(Startup.name).limit(limit).all()
-        
-        return [{
-            "startup_id": startup.startup_id,
-            "name": startup.name,
-            "description": startup.description or ""
-        } for startup in startups]
\ No newline at end of file
+
+        engine = get_autocomplete_engine()
+        engine.ensure_loaded(self.db)
+        return engine.suggest(query, limit)
+
+
+class AsyncSearchService(_SearchQueries):
+    """Búsqueda sobre ``AsyncSession``: mismas consultas que SearchService sin bloquear el worker."""
+
+    def __init__(self, db: AsyncSession, backend: SearchBackend):
+        self.db = db
+        self.backend = backend
+        self.index = get_search_index()
+
+    async def search_startups(self, search_request: StartupSearchRequest) -> Dict[str, Any]:
+        search_term = (search_request.query or "").strip()
+        if search_term and self.index.loaded:
+            return await self._search_with_index(search_request, search_term)
+
+        stmt, count_stmt, keys = self._search_statements(search_request, search_term)
+        total = (await self.db.execute(count_stmt)).scalar_one()
+        results = self._results_from_rows((await self.db.execute(stmt)).all())
+        return self._response(search_request, keys, results, total)
+
+    async def _search_with_index(self, search_request: StartupSearchRequest, search_term: str) -> Dict[str, Any]:
+        # Puntuar y ordenar candidatos es CPU: fuera del event loop
+        scores = await run_in_threadpool(self.index.search, search_term)
+        stats = {}
+        for stmt in self._index_stats_statements(search_request, list(scores)):
+            for startup_id, votos, comentarios, trending in await self.db.execute(stmt):
+                stats[startup_id] = (votos, comentarios, trending)
+
+        ordered, page_ids, keys = await run_in_threadpool(self._index_page, search_request, scores, stats)
+        startups = {}
+        if page_ids:
+            rows = await self.db.execute(select(*RESULT_COLUMNS).where(Startup.startup_id.in_(page_ids)))
+            startups = {row.startup_id: row for row in rows}
+        results = self._index_results(page_ids, startups, scores, stats)
+        return self._response(search_request, keys, results, len(ordered))
@@ -1,15 +1,37 @@
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.models.startup import Startup
-from app.models.category import Category
-from app.schemas.startup_crud import StartupCreate, StartupUpdate, StartupOut, StartupWithStats, CategoryOut
+from app.schemas.startup_crud import StartupCreate, StartupUpdate, StartupOut, StartupWithStats, CategoryOut, TrendingStartupOut
 from app.repositories.startup_repository import StartupRepository
+from app.core.http_cache import ResourceVersion, resource_version
+from app.core.pagination import decode_cursor, encode_cursor
+from app.services.autocomplete import get_autocomplete_engine
+from app.services.category_catalog import get_category_catalog
+from app.services.read_cache import get_read_cache, invalidate_startup, startup_key, startup_stats_key
+from app.services.search_index import get_search_index
+from app.services.user_names import get_user_name_resolver
+from app.services.vote_stats import get_vote_stats_snapshot
+
+# Los listados se validan de una vez (en pydantic-core) en lugar de fila a fila
+STARTUP_LIST = TypeAdapter(List[StartupOut])
+TRENDING_LIST = TypeAdapter(List[TrendingStartupOut])
+
+
+def _after_id(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    (after_id,) = decode_cursor(cursor, scope="startups", size=1)
+    if not isinstance(after_id, int):
+        raise ValueError("Cursor inválido")
+    return after_id
 
 
 class StartupService:
     def __init__(self, db: Session):
         self.repository = StartupRepository(db)
         self.db = db  # Guardar la sesión para métodos adicionales
+        self.categories = get_category_catalog()
 
     def create(self, user_id: int, payload: StartupCreate) -> StartupOut:
         startup_data = payload.model_dump()
@@ -17,15 +39,41 @@ class StartupService:
 
         startup = Startup(**startup_data)
         created_startup = self.repository.create(startup)
+        get_search_index().upsert(created_startup.startup_id, created_startup.name, created_startup.description)
+        get_autocomplete_engine().upsert(created_startup.startup_id, created_startup.name, created_startup.description)
+        get_vote_stats_snapshot().mark_dirty(created_startup.startup_id)
         return self._enrich_startup_out(created_startup)
 
-    def get(self, startup_id: int) -> Optional[StartupOut]:
+    def get(self, startup_id: int, version: Optional[ResourceVersion] = None) -> Optional[StartupOut]:
+        """Detalle de la startup desde la caché de lectura.
+
+        Cada entrada guarda el ETag con el que se cargó. Con ``version`` (la
+        del ETag que se va a responder) una entrada de otra versión, p. ej.
+        anterior a una escritura hecha en otro worker, se descarta y se relee.
+        """
+        cache, key = get_read_cache(), startup_key(startup_id)
+        entry = cache.get_or_set(key, lambda: self._get_entry(startup_id))
+        if entry is not None and version is not None and entry[0] != version.etag:
+            cache.delete(key)
+            entry = cache.get_or_set(key, lambda: self._get_entry(startup_id))
+        return entry[1] if entry else None
+
+    def _get_entry(self, startup_id: int) -> Optional[Tuple[str, StartupOut]]:
+        # La versión se lee antes que la fila: el cuerpo guardado nunca es más viejo que su ETag
+        version = self.version(startup_id)
+        startup = self._get(startup_id) if version else None
+        return (version.etag, startup) if startup else None
+
+    def _get(self, startup_id: int) -> Optional[StartupOut]:
         startup = self.repository.get_by_id(startup_id)
         if startup:
             return self._enrich_startup_out(startup)
         return None
 
     def get_with_stats(self, startup_id: int) -> Optional[StartupWithStats]:
+        return get_read_cache().get_or_set(startup_stats_key(startup_id), lambda: self._get_with_stats(startup_id))
+
+    def _get_with_stats(self, startup_id: int) -> Optional[StartupWithStats]:
         result = self.repository.get_with_stats(startup_id)
         if result:
             startup, total_comentarios, total_votos = result
@@ -33,13 +81,47 @@ class StartupService:
             return startup_out
         return None
 
-    def list(self, skip: int = 0, limit: int = 100) -> List[StartupOut]:
-        startups = self.repository.get_all(skip, limit)
-        return [self._enrich_startup_out(startup) for startup in startups]
+    def list(self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[StartupOut]:
+        rows = self.repository.get_all(skip, limit, after_id=after_id)
+        return STARTUP_LIST.validate_python([self._with_category_name(row) for row in rows])
+
+    def list_page(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[StartupOut], Optional[str]]:
+        """Página de startups (por startup_id) y cursor de la siguiente, o ``None``."""
+        startups = self.list(skip, limit + 1, after_id=_after_id(cursor))
+        if len(startups) <= limit:
+            return startups, None
+        startups = startups[:limit]
+        return startups, encode_cursor((startups[-1].startup_id,), scope="startups")
+
+    def list_trending(self, skip: int = 0, limit: int = 20) -> List[TrendingStartupOut]:
+        """Página ``skip``/``limit`` del ranking trending."""
+        rows = self.repository.get_trending(skip, limit)
+        return TRENDING_LIST.validate_python([self._with_category_name(row) for row in rows])
+
+    def version(self, startup_id: int) -> Optional[ResourceVersion]:
+        """Versión (ETag) de una startup sin cargarla; ``None`` si no existe."""
+        rows = self.repository.version_rows(startup_id=startup_id)
+        return self._named_version(rows) if rows else None
+
+    def list_version(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> ResourceVersion:
+        """Versión de la página que devolvería ``list_page`` (incluye la fila de más del cursor)."""
+        return self._named_version(self.repository.version_rows(skip=skip, limit=limit + 1, after_id=_after_id(cursor)))
+
+    def _named_version(self, rows) -> ResourceVersion:
+        """Versión que incluye owner_name y category_name tal como los devolvería la respuesta.
+
+        User y Category no tienen fecha de edición: sin los nombres en el ETag,
+        renombrar un usuario o una categoría seguiría respondiendo 304.
+        """
+        names = get_user_name_resolver().resolve_many(self.db, [row[2] for row in rows])
+        return resource_version(
+            (startup_id, modified, names[owner_id], self.categories.name(self.db, category_id))
+            for startup_id, modified, owner_id, category_id in rows
+        )
 
     def list_by_owner(self, owner_user_id: int) -> List[StartupOut]:
-        startups = self.repository.get_by_owner(owner_user_id)
-        return [self._enrich_startup_out(startup) for startup in startups]
+        rows = self.repository.get_by_owner(owner_user_id)
+        return STARTUP_LIST.validate_python([self._with_category_name(row) for row in rows])
 
     def update(self, startup_id: int, user_id: int, payload: StartupUpdate) -> StartupOut:
         startup = self.repository.get_by_id(startup_id)
@@ -53,6 +135,11 @@ class StartupService:
         updated_startup = self.repository.update(startup_id, update_data)
         if not updated_startup:
             raise ValueError("Error al actualizar la startup")
+        get_search_index().upsert(updated_startup.startup_id, updated_startup.name, updated_startup.description)
+        get_autocomplete_engine().upsert(updated_startup.startup_id, updated_startup.name, updated_startup.description)
+        invalidate_startup(startup_id)
+        # startup_name del snapshot de votos
+        get_vote_stats_snapshot().mark_dirty(startup_id)
 
         return self._enrich_startup_out(updated_startup)
 
@@ -66,19 +153,22 @@ class StartupService:
 
         if not self.repository.delete(startup_id):
             raise ValueError("Error al eliminar la startup")
+        get_search_index().remove(startup_id)
+        get_autocomplete_engine().remove(startup_id)
+        invalidate_startup(startup_id)
 
     # Nuevo método para listar categorías
     def list_categories(self) -> List[CategoryOut]:
-        categories = self.db.query(Category).all()
-        return [CategoryOut(
-            category_id=cat.category_id,
-            name=cat.name,
-            description=cat.description
-        ) for cat in categories]
+        return list(self.categories.all(self.db))
 
-    def _enrich_startup_out(self, startup: Startup) -> StartupOut:
-        """Enriquece el objeto Startup con category_name y owner_name antes de convertirlo a StartupOut"""
-        startup_dict = {
+    def _with_category_name(self, row: dict) -> dict:
+        """Fila de listado del repositorio (dict) con category_name del catálogo"""
+        row["category_name"] = self.categories.name(self.db, row["category_id"])
+        return row
+
+    def _startup_dict(self, startup: Startup) -> dict:
+        """Campos de StartupOut para ``startup``, con category_name y owner_name"""
+        return {
             "startup_id": startup.startup_id,
             "name": startup.name,
             "description": startup.description,
@@ -88,26 +178,19 @@ class StartupService:
             "email": startup.email,
             "website": startup.website,
             "social_media": startup.social_media,
-            "category_name": getattr(startup, 'category_name', None),
+            "category_name": self.categories.name(self.db, startup.category_id),
             "owner_name": getattr(startup, 'owner_name', f"Usuario {startup.owner_user_id}")
         }
-        return StartupOut(**startup_dict)
+
+    def _enrich_startup_out(self, startup: Startup) -> StartupOut:
+        """Enriquece el objeto Startup con category_name y owner_name antes de convertirlo a StartupOut"""
+        return StartupOut(**self._startup_dict(startup))
 
     def _enrich_startup_with_stats(self, startup: Startup, total_comentarios: int, total_votos: int) -> StartupWithStats:
         """Enriquece el objeto Startup con estadísticas, category_name y owner_name"""
         startup_dict = {
-            "startup_id": startup.startup_id,
-            "name": startup.name,
-            "description": startup.description,
-            "category_id": startup.category_id,
-            "owner_user_id": startup.owner_user_id,
-            "created_date": startup.created_date,
-            "email": startup.email,
-            "website": startup.website,
-            "social_media": startup.social_media,
-            "category_name": getattr(startup, 'category_name', None),
-            "owner_name": getattr(startup, 'owner_name', f"Usuario {startup.owner_user_id}"),
+            **self._startup_dict(startup),
             "total_comentarios": total_comentarios,
             "total_votos": total_votos
         }
-        return StartupWithStats(**startup_dict)
\ No newline at end of file
+        return StartupWithStats(**startup_dict)
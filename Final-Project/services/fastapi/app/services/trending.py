@@ -0,0 +1,115 @@
+"""Ranking "trending" de startups, precalculado.
+
+Cada voto y comentario pesa ``0.5 ** (edad / vida_media)`` según su
+``created_date`` (``TRENDING_HALF_LIFE_HOURS``). Con los votos ponderados se
+toma el límite inferior de Wilson de la proporción de upvotes, multiplicado
+por el volumen de votos: muchos votos recientes y mayoritariamente positivos
+puntúan alto, pocos votos o votos divididos puntúan poco. Los comentarios
+recientes suman ``COMMENT_WEIGHT`` cada uno.
+
+Una tarea de fondo arrancada en el ``lifespan`` recalcula el ranking cada
+``TRENDING_REFRESH_SECONDS`` y reemplaza StartupTrending (las
+``TRENDING_TOP_N`` mejores, con su posición). Solo la ejecuta el worker que
+tiene el ``LeaderLock`` ``starthub_trending``, y la edad de votos y
+comentarios se mide con el reloj de la base de datos, el mismo que llena
+``created_date``. ``/startups/trending`` y
+``sort_by=trending`` solo leen esa tabla.
+"""
+import math
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal, engine
+from app.models.comment import Comment
+from app.models.startup_trending import StartupTrending
+from app.models.vote import Vote, VoteType
+from app.services.periodic import LeaderLock, PeriodicJob
+
+# Peso de un comentario frente a un upvote
+COMMENT_WEIGHT = 0.5
+# z de la cota de Wilson (95 %)
+WILSON_Z = 1.96
+# Votos y comentarios más viejos que estas vidas medias pesan < 0.1 %: no se leen
+WINDOW_HALF_LIVES = 10
+# Filas por lote al recorrer votos y comentarios de la ventana
+SCAN_BATCH = 5000
+
+
+def wilson_lower_bound(positive: float, total: float, z: float = WILSON_Z) -> float:
+    """Cota inferior del intervalo de Wilson para la proporción ``positive / total``."""
+    if total <= 0:
+        return 0.0
+    phat = positive / total
+    z2 = z * z
+    centre = phat + z2 / (2 * total)
+    margin = z * math.sqrt((phat * (1 - phat) + z2 / (4 * total)) / total)
+    return max((centre - margin) / (1 + z2 / total), 0.0)
+
+
+def trending_score(upvotes: float, downvotes: float, comments: float) -> float:
+    """Puntaje a partir de votos y comentarios ya ponderados por antigüedad."""
+    total = upvotes + downvotes
+    return wilson_lower_bound(upvotes, total) * total + COMMENT_WEIGHT * comments
+
+
+def database_now(db: Session) -> datetime:
+    """Hora actual de la base de datos (``CURRENT_TIMESTAMP``, como ``created_date``)."""
+    return db.execute(select(func.now())).scalar_one()
+
+
+class TrendingRanker:
+    def __init__(self, *, half_life_hours: float = 48, top_n: int = 1000):
+        self.half_life = half_life_hours * 3600
+        self.top_n = top_n
+
+    def _weight(self, now: datetime, created: datetime) -> float:
+        return 0.5 ** (max((now - created).total_seconds(), 0.0) / self.half_life)
+
+    def compute(self, db: Session, now: Optional[datetime] = None) -> List[Tuple[int, float]]:
+        """(startup_id, puntaje) de mayor a menor, sin las startups con puntaje 0."""
+        now = now or database_now(db)
+        since = now - timedelta(seconds=self.half_life * WINDOW_HALF_LIVES)
+        # startup_id -> [upvotes, downvotes, comentarios] ponderados
+        totals: Dict[int, list] = {}
+
+        votes = select(Vote.startup_id, Vote.vote_type, Vote.created_date).where(Vote.created_date >= since)
+        for startup_id, vote_type, created in db.execute(votes.execution_options(yield_per=SCAN_BATCH)):
+            entry = totals.setdefault(startup_id, [0.0, 0.0, 0.0])
+            entry[0 if vote_type == VoteType.upvote else 1] += self._weight(now, created)
+
+        comments = select(Comment.startup_id, Comment.created_date).where(Comment.created_date >= since)
+        for startup_id, created in db.execute(comments.execution_options(yield_per=SCAN_BATCH)):
+            totals.setdefault(startup_id, [0.0, 0.0, 0.0])[2] += self._weight(now, created)
+
+        scores = [(sid, trending_score(*entry)) for sid, entry in totals.items()]
+        scores = [(sid, score) for sid, score in scores if score > 0]
+        scores.sort(key=lambda item: (-item[1], item[0]))
+        return scores[:self.top_n]
+
+    def refresh(self, db: Session, now: Optional[datetime] = None) -> int:
+        """Recalcula y reemplaza StartupTrending; devuelve cuántas startups quedaron en el ranking."""
+        now = now or database_now(db)
+        ranking = self.compute(db, now)
+        # Mismo commit para borrar e insertar: los lectores ven el ranking anterior o el nuevo
+        db.execute(delete(StartupTrending))
+        if ranking:
+            db.execute(insert(StartupTrending), [
+                {"startup_id": sid, "trending_rank": rank, "score": score, "computed_at": now}
+                for rank, (sid, score) in enumerate(ranking, start=1)
+            ])
+        db.commit()
+        return len(ranking)
+
+
+@lru_cache
+def get_trending_job() -> PeriodicJob:
+    settings = get_settings()
+    ranker = TrendingRanker(half_life_hours=settings.trending_half_life_hours, top_n=settings.trending_top_n)
+    # last_result: startups en el ranking tras el último recálculo
+    return PeriodicJob("trending", SessionLocal, ranker.refresh, interval=settings.trending_refresh_seconds,
+                       leader=LeaderLock(engine, "starthub_trending"))
@@ -0,0 +1,84 @@
+"""Nombres para mostrar de usuarios ("Nombre Apellido") con caché LRU.
+
+Los listados de comentarios y startups ya no unen User: piden los nombres
+de los autores/dueños de la página con ``resolve_many``, que solo consulta
+(con un único ``IN``) los ids que no están en caché.
+
+El servicio de autenticación (Spring) es quien edita los perfiles; al hacerlo
+llama a ``POST /api/v1/internal/users/{id}/invalidate``. La caché es de cada
+worker y esa llamada la atiende uno solo: el resto sigue sirviendo el nombre
+anterior hasta que vence ``USER_NAME_CACHE_TTL_SECONDS`` (300 s por defecto),
+que también cubre las notificaciones perdidas.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.models.user import User
+
+
+def display_name(first_name: Optional[str], last_name: Optional[str]) -> str:
+    return f"{first_name} {last_name}"
+
+
+def fallback_name(user_id: int) -> str:
+    """Nombre para un id sin fila en User (no debería ocurrir: las FK lo impiden)."""
+    return f"Usuario {user_id}"
+
+
+def names_statement(user_ids: Iterable[int]):
+    return select(User.user_id, User.first_name, User.last_name).where(User.user_id.in_(sorted(set(user_ids))))
+
+
+class UserNameResolver:
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = None):
+        self.cache = LRUCache(maxsize, ttl=ttl)
+
+    def _split(self, user_ids: Iterable[int]) -> tuple[Dict[int, str], list[int]]:
+        found, missing = {}, []
+        for user_id in dict.fromkeys(user_ids):
+            name = self.cache.get(user_id)
+            if name is None:
+                missing.append(user_id)
+            else:
+                found[user_id] = name
+        return found, missing
+
+    def _store(self, found: Dict[int, str], rows, missing: list[int]) -> Dict[int, str]:
+        for user_id, first_name, last_name in rows:
+            found[user_id] = display_name(first_name, last_name)
+            self.cache.set(user_id, found[user_id])
+        for user_id in missing:
+            found.setdefault(user_id, fallback_name(user_id))
+        return found
+
+    def resolve_many(self, db: Session, user_ids: Iterable[int]) -> Dict[int, str]:
+        """id -> nombre para todos los ids pedidos, con una consulta como mucho."""
+        found, missing = self._split(user_ids)
+        rows = db.execute(names_statement(missing)).all() if missing else []
+        return self._store(found, rows, missing)
+
+    async def resolve_many_async(self, db: AsyncSession, user_ids: Iterable[int]) -> Dict[int, str]:
+        found, missing = self._split(user_ids)
+        rows = (await db.execute(names_statement(missing))).all() if missing else []
+        return self._store(found, rows, missing)
+
+    def resolve(self, db: Session, user_id: int) -> str:
+        return self.resolve_many(db, [user_id])[user_id]
+
+    def invalidate(self, *user_ids: int) -> None:
+        self.cache.delete(*user_ids)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+@lru_cache
+def get_user_name_resolver() -> UserNameResolver:
+    settings = get_settings()
+    return UserNameResolver(settings.user_name_cache_size, ttl=settings.user_name_cache_ttl_seconds)
@@ -0,0 +1,234 @@
+"""Cola de escritura diferida (write-behind) para votos.
+
+Con ``VOTE_BUFFER_ENABLED=true`` ``POST /votes/`` no escribe en la base de
+datos: deja el voto en una cola en memoria del worker, que agrupa por
+(usuario, startup) quedándose con el último tipo de voto. Una tarea de fondo
+arrancada en el ``lifespan`` de la app la vacía cada ``VOTE_BUFFER_FLUSH_MS``
+(o antes, al llegar a ``VOTE_BUFFER_MAX_ITEMS``) con un único upsert
+multi-fila y recalcula los contadores de las startups afectadas.
+
+Si el volcado se atrasa (base de datos lenta o caída) y el voto más antiguo
+pendiente supera ``VOTE_BUFFER_MAX_LAG_MS``, quien encola vuelca él mismo la
+cola antes de responder: la cola nunca se retrasa mucho más que eso. Si ese
+volcado falla, el voto ya quedó encolado: el error se registra y el lote
+vuelve a la cola, sin fallar la petición.
+
+Durabilidad: la cola vive en la memoria del worker. Los votos aceptados con
+202 y aún no volcados se pierden si el proceso muere sin pasar por el apagado
+ordenado (``stop``), p. ej. un ``kill -9`` o un OOM.
+"""
+import asyncio
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.models.vote import VoteType
+from app.repositories.entity_checks import foreign_keys_as_not_found
+from app.repositories.vote_repository import VoteRepository
+from app.services.read_cache import invalidate_votes
+from app.services.vote_stats import get_vote_stats_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class VoteQueue:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        flush_ms: int = 200,
+        max_items: int = 500,
+        max_lag_ms: int = 2000,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_ms / 1000
+        self.max_items = max_items
+        self.max_lag = max_lag_ms / 1000
+        # (user_id, startup_id) -> (vote_type, instante del primer encolado pendiente)
+        self._pending: dict[tuple[int, int], tuple[VoteType, float]] = {}
+        self._lock = threading.Lock()
+        # Un solo volcado a la vez: dos lotes en paralelo podrían reordenar votos
+        self._flush_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+        self.reset_metrics()
+
+    def reset_metrics(self) -> None:
+        self.enqueued = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.flushed_items = 0
+        self.rejected = 0
+        self.failed_flushes = 0
+        self.lag_flushes = 0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self.total_flush_seconds = 0.0
+
+    # --- Encolado ---
+
+    def put(self, user_id: int, startup_id: int, vote_type: VoteType) -> None:
+        now = time.monotonic()
+        key = (user_id, startup_id)
+        with self._lock:
+            previous = self._pending.get(key)
+            # Gana la última escritura, pero el voto conserva su antigüedad en la cola
+            self._pending[key] = (vote_type, previous[1] if previous else now)
+            self.enqueued += 1
+            if previous:
+                self.coalesced += 1
+            depth = len(self._pending)
+            lagging = now - next(iter(self._pending.values()))[1] > self.max_lag
+            if lagging:
+                self.lag_flushes += 1
+        if lagging:
+            try:
+                self.flush()
+            except Exception:
+                # El lote volvió a la cola; el voto de esta petición ya está aceptado
+                logger.exception("Error en el volcado en línea de la cola de votos; se reintenta más tarde")
+        elif depth >= self.max_items:
+            self._wake_flusher()
+
+    def discard(self, user_id: int, startup_id: int) -> bool:
+        """Quita un voto pendiente (p. ej. al borrarlo antes de que se vuelque).
+
+        Espera a que termine un volcado en curso, para que el borrado posterior
+        en la base de datos no se adelante a un lote que incluya el voto.
+        """
+        with self._flush_lock, self._lock:
+            return self._pending.pop((user_id, startup_id), None) is not None
+
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def lag_seconds(self) -> float:
+        with self._lock:
+            if not self._pending:
+                return 0.0
+            return time.monotonic() - next(iter(self._pending.values()))[1]
+
+    # --- Volcado ---
+
+    def flush(self) -> int:
+        """Escribe los votos pendientes; devuelve cuántos se volcaron.
+
+        Si la escritura falla, los votos vuelven a la cola (salvo los que
+        llegaron más nuevos mientras tanto) y el error se propaga.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            started = time.perf_counter()
+            try:
+                self._write(batch)
+            except Exception:
+                self.failed_flushes += 1
+                self._requeue(batch)
+                raise
+            elapsed = time.perf_counter() - started
+            self.flushes += 1
+            self.flushed_items += len(batch)
+            self.last_flush_seconds = elapsed
+            self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+            self.total_flush_seconds += elapsed
+            return len(batch)
+
+    def _write(self, batch: dict) -> None:
+        votes = [(user_id, startup_id, vote_type) for (user_id, startup_id), (vote_type, _) in batch.items()]
+        with self.session_factory() as db:
+            repo = VoteRepository(db)
+            try:
+                repo.upsert_many(votes)
+            except IntegrityError:
+                db.rollback()
+                # Un usuario o startup inexistente tumba el lote entero: se reintenta
+                # voto a voto para descartar solo los inválidos.
+                for user_id, startup_id, vote_type in votes:
+                    try:
+                        with foreign_keys_as_not_found(db, user_id, startup_id):
+                            repo.upsert(user_id=user_id, startup_id=startup_id, vote_type=vote_type)
+                    except ValueError as e:
+                        self.rejected += 1
+                        logger.warning("Voto descartado (user_id=%s, startup_id=%s): %s", user_id, startup_id, e)
+        touched = {startup_id for _, startup_id, _ in votes}
+        invalidate_votes(*touched)
+        get_vote_stats_snapshot().mark_dirty(*touched)
+
+    def _requeue(self, batch: dict) -> None:
+        with self._lock:
+            for key, (vote_type, since) in self._pending.items():
+                batch[key] = (vote_type, batch[key][1]) if key in batch else (vote_type, since)
+            self._pending = batch
+
+    # --- Tarea de fondo ---
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Detiene la tarea de fondo y vuelca lo pendiente (apagado del worker)."""
+        self._stopping = True
+        if self._task is not None:
+            self._wake.set()
+            await self._task
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                logger.exception("Error volcando la cola de votos; se reintenta en el próximo ciclo")
+
+    def _wake_flusher(self) -> None:
+        # put() corre en el threadpool de FastAPI, fuera del event loop
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def metrics(self) -> dict:
+        return {
+            "depth": self.depth(),
+            "lag_ms": round(self.lag_seconds() * 1000, 1),
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "flushed_items": self.flushed_items,
+            "failed_flushes": self.failed_flushes,
+            "lag_flushes": self.lag_flushes,
+            "rejected": self.rejected,
+            "last_flush_ms": round(self.last_flush_seconds * 1000, 2),
+            "max_flush_ms": round(self.max_flush_seconds * 1000, 2),
+            "avg_flush_ms": round(self.total_flush_seconds * 1000 / self.flushes, 2) if self.flushes else 0.0,
+        }
+
+
+@lru_cache
+def get_vote_queue() -> VoteQueue:
+    settings = get_settings()
+    return VoteQueue(
+        SessionLocal,
+        flush_ms=settings.vote_buffer_flush_ms,
+        max_items=settings.vote_buffer_max_items,
+        max_lag_ms=settings.vote_buffer_max_lag_ms,
+    )
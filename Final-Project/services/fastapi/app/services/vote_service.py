@@ -1,35 +1,71 @@
+from typing import Optional
 from sqlalchemy.orm import Session
+from app.core.config import get_settings
 from app.repositories.vote_repository import VoteRepository
 from app.schemas.vote import VoteCreate, VoteCount
 from app.models.vote import Vote
-from sqlalchemy import text
+from app.repositories.entity_checks import foreign_keys_as_not_found, missing_entity
+from app.services.read_cache import get_read_cache, invalidate_votes, vote_count_key
+from app.services.vote_queue import VoteQueue
+from app.services.vote_stats import get_vote_stats_snapshot
 
 
 class VoteService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, queue: Optional[VoteQueue] = None):
         self.repo = VoteRepository(db)
+        self.queue = queue
 
-    def _assert_entities(self, user_id: int, startup_id: int):
-        # Validar que existan User y Startup (evita FK silenciosa o 500).
-        user_exists = self.repo.db.execute(text("SELECT 1 FROM `User` WHERE user_id=:uid"), {"uid": user_id}).fetchone()
-        startup_exists = self.repo.db.execute(text("SELECT 1 FROM Startup WHERE startup_id=:sid"), {"sid": startup_id}).fetchone()
-        if not user_exists:
-            raise ValueError("User not found")
-        if not startup_exists:
-            raise ValueError("Startup not found")
+    def upsert(self, user_id: int, payload: VoteCreate) -> tuple[Optional[Vote], bool]:
+        """Retorna (voto, creado_bool); con cola de votos, ``(None, False)``.
 
-    def upsert(self, user_id: int, payload: VoteCreate) -> tuple[Vote, bool]:
-        self._assert_entities(user_id, payload.startup_id)
-        return self.repo.upsert(user_id=user_id, startup_id=payload.startup_id, vote_type=payload.vote_type)
+        En modo diferido el voto se valida y escribe al volcar la cola, así que
+        no hay ``vote_id`` que devolver todavía.
+        """
+        if self.queue is not None:
+            self.queue.put(user_id, payload.startup_id, payload.vote_type)
+            return None, False
+        # Sin consultas previas: las FK de User/Startup validan la escritura
+        with foreign_keys_as_not_found(self.repo.db, user_id, payload.startup_id):
+            result = self.repo.upsert(user_id=user_id, startup_id=payload.startup_id, vote_type=payload.vote_type)
+        invalidate_votes(payload.startup_id)
+        get_vote_stats_snapshot().mark_dirty(payload.startup_id)
+        return result
 
     def count(self, startup_id: int) -> VoteCount:
-        up, down = self.repo.count_for_startup(startup_id)
+        return get_read_cache().get_or_set(vote_count_key(startup_id), lambda: self._count(startup_id))
+
+    def _count(self, startup_id: int) -> VoteCount:
+        if self._from_snapshot():
+            up, down = self.repo.snapshot_counts_for_startups([startup_id]).get(startup_id, (0, 0))
+        else:
+            up, down = self.repo.count_for_startup(startup_id)
         return VoteCount(startup_id=startup_id, upvotes=up, downvotes=down)
 
+    def count_many(self, startup_ids: list[int]) -> list[VoteCount]:
+        # Una sola consulta agrupada; las startups sin votos se devuelven en cero.
+        if self._from_snapshot():
+            counts = self.repo.snapshot_counts_for_startups(startup_ids)
+        else:
+            counts = self.repo.count_for_startups(startup_ids)
+        result = []
+        for sid in dict.fromkeys(startup_ids):
+            up, down = counts.get(sid, (0, 0))
+            result.append(VoteCount(startup_id=sid, upvotes=up, downvotes=down))
+        return result
+
     def delete(self, user_id: int, startup_id: int) -> None:
-        self._assert_entities(user_id, startup_id)
-        ok = self.repo.delete(user_id=user_id, startup_id=startup_id)
-        if not ok:
-            raise ValueError("Vote not found")
+        # Un voto aún en la cola no debe reaparecer tras borrarlo
+        queued = self.queue is not None and self.queue.discard(user_id, startup_id)
+        if not self.repo.delete(user_id=user_id, startup_id=startup_id) and not queued:
+            # Solo en el caso de fallo se averigua qué falta, para el mensaje de error
+            raise ValueError(missing_entity(self.repo.db, user_id, startup_id) or "Vote not found")
+        invalidate_votes(startup_id)
+        get_vote_stats_snapshot().mark_dirty(startup_id)
+
+    @staticmethod
+    def _from_snapshot() -> bool:
+        # VOTE_COUNTS_SOURCE=snapshot: conteos de StartupVoteStatsSnapshot, con el retraso del job
+        return get_settings().vote_counts_source == "snapshot"
+
     def get_user_votes(self, user_id: int) -> list[Vote]:
         return self.repo.get_by_user(user_id)
@@ -0,0 +1,146 @@
+"""Snapshot materializado de la vista StartupVoteStats.
+
+La vista de MySQL recalcula ``COUNT(CASE ...)`` sobre todos los votos en cada
+lectura. StartupVoteStatsSnapshot guarda el mismo resultado y una tarea
+periódica (``VOTE_STATS_REFRESH_SECONDS``) solo reprocesa las startups
+tocadas desde el refresco anterior:
+
+- las que este worker marcó como sucias al escribir votos (``mark_dirty``:
+  altas, cambios de tipo y borrados, que no dejan rastro en ``created_date``);
+- las que tienen votos con ``Vote.created_date`` posterior a la marca de agua
+  (altas hechas por otros workers o por cargas SQL).
+
+El primer refresco de cada worker reconstruye la tabla entera. Con
+``VOTE_COUNTS_SOURCE=snapshot`` ``VoteService.count``/``count_many`` leen de
+aquí en lugar de agregar Vote, a cambio de hasta un intervalo de retraso; con
+``live`` nadie lee el snapshot, la tarea no arranca y las escrituras no
+marcan startups sucias.
+
+Solo el worker líder (``LeaderLock`` ``starthub_vote_stats``) reconstruye la
+tabla y recorre la marca de agua. Los demás reprocesan en cada ciclo solo
+sus propias startups sucias, que el líder no puede ver.
+"""
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal, engine
+from app.models.startup import Startup
+from app.models.startup_vote_stats import StartupVoteStatsSnapshot
+from app.models.vote import Vote, VoteType
+from app.services.periodic import LeaderLock, PeriodicJob
+from app.services.read_cache import invalidate_votes
+
+# Startups por sentencia al reprocesar
+REFRESH_CHUNK = 1000
+# created_date tiene resolución de segundos: se relee el segundo de la marca de agua
+WATERMARK_OVERLAP = timedelta(seconds=1)
+
+SNAPSHOT_COLUMNS = ("startup_id", "startup_name", "upvotes", "downvotes", "total_votes", "net_votes", "refreshed_at")
+
+
+def view_statement(refreshed_at: datetime, startup_ids: Optional[list] = None):
+    """Mismo SELECT que la vista StartupVoteStats (más ``refreshed_at``)."""
+    upvotes = func.count(case((Vote.vote_type == VoteType.upvote, 1)))
+    downvotes = func.count(case((Vote.vote_type == VoteType.downvote, 1)))
+    stmt = (
+        select(
+            Startup.startup_id, Startup.name, upvotes, downvotes, func.count(Vote.vote_id),
+            upvotes - downvotes, literal(refreshed_at, StartupVoteStatsSnapshot.refreshed_at.type),
+        )
+        .outerjoin(Vote, Vote.startup_id == Startup.startup_id)
+        .group_by(Startup.startup_id, Startup.name)
+    )
+    return stmt.where(Startup.startup_id.in_(startup_ids)) if startup_ids is not None else stmt
+
+
+class VoteStatsSnapshot:
+    def __init__(self, *, track_dirty: bool = True):
+        # Sin tarea de refresco nadie vaciaría las marcas: no se anotan
+        self.track_dirty = track_dirty
+        self._dirty: set[int] = set()
+        self._lock = threading.Lock()
+        self.watermark: Optional[datetime] = None
+        self.full_refreshes = 0
+        self.incremental_refreshes = 0
+
+    def mark_dirty(self, *startup_ids: int) -> None:
+        if not self.track_dirty:
+            return
+        with self._lock:
+            self._dirty.update(startup_ids)
+
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    def refresh(self, db: Session, *, scan: bool = True) -> int:
+        """Pone el snapshot al día; devuelve cuántas startups se reprocesaron.
+
+        Con ``scan=False`` (workers que no son el líder) solo se reprocesan
+        las startups marcadas en este worker: ni reconstrucción ni marca de agua.
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        try:
+            # Reloj de la base de datos: el mismo que llena Vote.created_date
+            started_at = db.execute(select(func.now())).scalar_one()
+            if scan and self.watermark is None:
+                db.execute(delete(StartupVoteStatsSnapshot))
+                db.execute(insert(StartupVoteStatsSnapshot).from_select(SNAPSHOT_COLUMNS, view_statement(started_at)))
+                refreshed = None
+            else:
+                touched = self._touched_since(db, self.watermark) if scan else set()
+                refreshed = sorted(dirty | touched)
+                for i in range(0, len(refreshed), REFRESH_CHUNK):
+                    chunk = refreshed[i:i + REFRESH_CHUNK]
+                    db.execute(delete(StartupVoteStatsSnapshot).where(StartupVoteStatsSnapshot.startup_id.in_(chunk)))
+                    db.execute(insert(StartupVoteStatsSnapshot).from_select(
+                        SNAPSHOT_COLUMNS, view_statement(started_at, chunk)
+                    ))
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._dirty.update(dirty)
+            raise
+        if scan:
+            self.watermark = started_at
+        if refreshed is None:
+            self.full_refreshes += 1
+            return db.execute(select(func.count()).select_from(StartupVoteStatsSnapshot)).scalar_one()
+        self.incremental_refreshes += 1
+        # Los conteos cacheados de estas startups pueden venir del snapshot anterior
+        invalidate_votes(*refreshed)
+        return len(refreshed)
+
+    def _touched_since(self, db: Session, watermark: datetime) -> set[int]:
+        # Sin DISTINCT: con él SQLite recorre idx_vote_startup_type entero en lugar del rango de idx_vote_created
+        stmt = select(Vote.startup_id).where(Vote.created_date >= watermark - WATERMARK_OVERLAP)
+        return set(db.execute(stmt).scalars())
+
+
+@lru_cache
+def get_vote_stats_snapshot() -> VoteStatsSnapshot:
+    # Con VOTE_COUNTS_SOURCE=live la tarea no arranca: las escrituras no marcan startups
+    return VoteStatsSnapshot(track_dirty=vote_stats_job_enabled(get_settings()))
+
+
+def vote_stats_job_enabled(settings) -> bool:
+    """La tarea solo corre si hay intervalo y alguien lee el snapshot."""
+    return settings.vote_stats_refresh_seconds > 0 and settings.vote_counts_source == "snapshot"
+
+
+@lru_cache
+def get_vote_stats_job() -> PeriodicJob:
+    # last_result: startups reprocesadas en el último refresco
+    snapshot = get_vote_stats_snapshot()
+    return PeriodicJob(
+        "vote_stats", SessionLocal, snapshot.refresh, interval=get_settings().vote_stats_refresh_seconds,
+        leader=LeaderLock(engine, "starthub_vote_stats"),
+        follower_task=lambda db: snapshot.refresh(db, scan=False),
+    )
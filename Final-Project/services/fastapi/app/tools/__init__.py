@@ -0,0 +1 @@
+"""Herramientas de línea de comandos del backend (``python -m app.tools.<nombre>``)."""
@@ -0,0 +1,357 @@
+"""Genera y carga un conjunto de datos sintético para pruebas de escala.
+
+    python -m app.tools.gen_data --startups 100000 --votes 10000000
+    python -m app.tools.gen_data --database-url sqlite+pysqlite:///./escala.db --create-schema
+
+Usuarios, startups con nombres y descripciones en español, votos y comentarios
+con popularidad Zipf (``--zipf``): pocas startups concentran la mayor parte de
+la actividad. Cada usuario vota a lo sumo una vez por startup
+(``unique_vote_per_user_startup``), así que con pocos ``--users`` los votos de
+las startups más populares se recortan; el resumen muestra los cargados.
+
+La carga va por lotes de ``--chunk-size`` filas (``executemany``: los drivers de
+MySQL los envían como INSERT de varias filas) con un commit por lote y sin
+comprobar claves foráneas mientras dura. Los ids continúan los existentes, así
+que puede ejecutarse sobre una base con datos. Al terminar rellena StartupStats
+de las startups nuevas y reconstruye StartupVoteStatsSnapshot.
+"""
+import argparse
+import itertools
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401  (todas las tablas en Base.metadata)
+from app.core.config import get_settings
+from app.db.base import Base
+from app.models.category import Category
+from app.models.comment import Comment
+from app.models.startup import Startup
+from app.models.startup_stats import StartupStats
+from app.models.user import User
+from app.models.vote import Vote, VoteType
+from app.services.vote_stats import VoteStatsSnapshot
+
+CATEGORIES = [
+    "Tecnología", "Salud", "Educación", "Finanzas", "Sostenibilidad", "Agro",
+    "Movilidad", "Turismo", "Comercio", "Energía", "Logística", "Cultura",
+]
+FIRST_NAMES = [
+    "Ana", "Luis", "María", "José", "Camila", "Diego", "Valentina", "Matías", "Sofía", "Tomás",
+    "Isidora", "Benjamín", "Fernanda", "Joaquín", "Catalina", "Andrés", "Paula", "Ignacio",
+]
+LAST_NAMES = [
+    "Ruiz", "Mora", "González", "Muñoz", "Rojas", "Díaz", "Pérez", "Soto", "Contreras", "Silva",
+    "Martínez", "Sepúlveda", "Morales", "Núñez", "Fuentes", "Araya", "Espinoza", "Castillo",
+]
+NAME_PREFIXES = [
+    "Eco", "Agro", "Fin", "Salud", "Bio", "Edu", "Geo", "Aqua", "Sol", "Tierra",
+    "Ruta", "Mercado", "Pago", "Dato", "Nube", "Cosecha", "Árbol", "Café",
+]
+NAME_ROOTS = [
+    "Tech", "Lab", "Hub", "Red", "Viva", "Verde", "Andina", "Digital", "Móvil",
+    "Express", "Social", "Pro", "Data", "Link", "Smart", "Austral",
+]
+NAME_SUFFIXES = ["", "", "", " Solutions", " Labs", " Chile", " Latam", " Sur", " 360", " Coop"]
+PRODUCTS = ["Plataforma", "Aplicación", "Marketplace", "Servicio", "Red", "Sistema", "Herramienta", "Comunidad"]
+ADJECTIVES = ["digital", "colaborativa", "inteligente", "sostenible", "móvil", "abierta", "segura", "local"]
+AUDIENCES = [
+    "pequeños productores", "estudiantes universitarios", "pymes", "familias", "médicos rurales",
+    "emprendedores", "cooperativas", "municipios", "turistas", "repartidores",
+]
+GOALS = [
+    "que reduce los costos de operación", "que conecta oferta y demanda", "para medir el impacto ambiental",
+    "para gestionar pagos y cobros", "que automatiza tareas repetitivas", "para aprender a su propio ritmo",
+    "que mejora el acceso a la salud", "para vender en línea sin intermediarios",
+]
+PLACES = [
+    "en zonas rurales", "en toda la región", "en ciudades intermedias", "en Latinoamérica",
+    "desde el celular", "con datos abiertos",
+]
+COMMENTS = [
+    "¡Excelente idea! ¿Cuándo lanzan en mi ciudad?", "¿Tienen una API para integrar los datos?",
+    "Me encantaría probar la versión beta.", "¿Cuál es el modelo de negocio?",
+    "Buena propuesta, pero el precio me parece alto.", "Lo usamos en nuestra cooperativa y funciona muy bien.",
+    "¿Cómo protegen los datos personales de los usuarios?", "Falta una versión para Android.",
+    "¿Buscan socios o inversionistas?", "La interfaz es muy clara, felicitaciones al equipo.",
+]
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class DatasetGenerator:
+    """Filas sintéticas reproducibles (misma ``seed``, mismos datos)."""
+
+    def __init__(self, *, users: int, startups: int, votes: int, comments: int, zipf: float = 1.0,
+                 days: int = 365, seed: int = 42, now: Optional[datetime] = None):
+        self.users = users
+        self.startups = startups
+        self.votes = votes
+        self.comments = comments
+        self.zipf = zipf
+        self.days = days
+        self.rng = random.Random(seed)
+        self.now = (now or datetime.now(timezone.utc).replace(tzinfo=None)).replace(microsecond=0)
+        # startup_id -> [upvotes, downvotes, comentarios] de las filas generadas (para StartupStats)
+        self.stats: Dict[int, list] = {}
+        self._created: Dict[int, datetime] = {}
+
+    def _date_after(self, start: datetime) -> datetime:
+        # Segundos enteros: created_date se guarda sin microsegundos
+        span = int((self.now - start).total_seconds())
+        return start + timedelta(seconds=self.rng.randint(0, max(span, 0)))
+
+    def allocate(self, total: int, ids: List[int], cap: Optional[int] = None) -> Dict[int, int]:
+        """Reparte ``total`` entre ``ids`` según Zipf sobre un orden de popularidad al azar."""
+        ranked = ids[:]
+        self.rng.shuffle(ranked)
+        weights = [1.0 / rank ** self.zipf for rank in range(1, len(ranked) + 1)]
+        scale = total / sum(weights) if weights else 0.0
+        counts = {}
+        for startup_id, weight in zip(ranked, weights):
+            expected = weight * scale
+            # Redondeo estocástico: el total se conserva en promedio
+            count = int(expected) + (self.rng.random() < expected - int(expected))
+            counts[startup_id] = min(count, cap) if cap is not None else count
+        return counts
+
+    def user_rows(self, first_id: int) -> Iterator[dict]:
+        for user_id in range(first_id, first_id + self.users):
+            yield {
+                "user_id": user_id,
+                "email": f"usuario{user_id}@example.com",
+                "password_hash": "$2b$12$generado",
+                "first_name": self.rng.choice(FIRST_NAMES),
+                "last_name": f"{self.rng.choice(LAST_NAMES)} {self.rng.choice(LAST_NAMES)}",
+                "is_enabled": True,
+            }
+
+    def startup_name(self) -> str:
+        return f"{self.rng.choice(NAME_PREFIXES)}{self.rng.choice(NAME_ROOTS)}{self.rng.choice(NAME_SUFFIXES)}"
+
+    def startup_description(self) -> str:
+        product, adjective = self.rng.choice(PRODUCTS), self.rng.choice(ADJECTIVES)
+        return (
+            f"{product} {adjective} para {self.rng.choice(AUDIENCES)} {self.rng.choice(GOALS)} "
+            f"{self.rng.choice(PLACES)}."
+        )
+
+    def startup_rows(self, first_id: int, user_ids: range, category_ids: List[int]) -> Iterator[dict]:
+        oldest = self.now - timedelta(days=self.days)
+        for startup_id in range(first_id, first_id + self.startups):
+            name = self.startup_name()
+            slug = "".join(ch for ch in name.lower() if ch.isascii() and ch.isalnum())
+            created = self._date_after(oldest)
+            self._created[startup_id] = created
+            yield {
+                "startup_id": startup_id,
+                "name": name,
+                "description": self.startup_description(),
+                "email": f"contacto@{slug}{startup_id}.example",
+                "website": f"https://{slug}{startup_id}.example",
+                "social_media": f"@{slug}{startup_id}",
+                "created_date": created,
+                "owner_user_id": self.rng.choice(user_ids),
+                "category_id": self.rng.choice(category_ids),
+            }
+
+    def vote_rows(self, first_id: int, user_ids: range) -> Iterator[dict]:
+        """Votos de las startups generadas; cada una con su propia proporción de upvotes."""
+        counts = self.allocate(self.votes, list(self._created), cap=len(user_ids))
+        vote_id = first_id
+        for startup_id, count in counts.items():
+            approval = self.rng.betavariate(4, 2)
+            entry = self.stats.setdefault(startup_id, [0, 0, 0])
+            for user_id in self.rng.sample(user_ids, count):
+                upvote = self.rng.random() < approval
+                entry[0 if upvote else 1] += 1
+                yield {
+                    "vote_id": vote_id,
+                    "vote_type": VoteType.upvote if upvote else VoteType.downvote,
+                    "created_date": self._date_after(self._created[startup_id]),
+                    "user_id": user_id,
+                    "startup_id": startup_id,
+                }
+                vote_id += 1
+
+    def comment_rows(self, first_id: int, user_ids: range) -> Iterator[dict]:
+        counts = self.allocate(self.comments, list(self._created))
+        comment_id = first_id
+        for startup_id, count in counts.items():
+            self.stats.setdefault(startup_id, [0, 0, 0])[2] += count
+            for _ in range(count):
+                yield {
+                    "comment_id": comment_id,
+                    "content": self.rng.choice(COMMENTS),
+                    "created_date": self._date_after(self._created[startup_id]),
+                    "user_id": self.rng.choice(user_ids),
+                    "startup_id": startup_id,
+                }
+                comment_id += 1
+
+    def stats_rows(self) -> Iterator[dict]:
+        for startup_id in self._created:
+            upvotes, downvotes, comments = self.stats.get(startup_id, (0, 0, 0))
+            yield {
+                "startup_id": startup_id, "upvotes": upvotes, "downvotes": downvotes,
+                "total_votes": upvotes + downvotes, "total_comments": comments,
+            }
+
+
+@contextmanager
+def bulk_load_settings(conn: Connection):
+    """Sin comprobación de claves foráneas (ni de unicidad en MySQL) durante la carga."""
+    dialect = conn.dialect.name
+    if dialect == "mysql":
+        conn.exec_driver_sql("SET foreign_key_checks = 0")
+        conn.exec_driver_sql("SET unique_checks = 0")
+    elif dialect == "sqlite":
+        synchronous = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+        cache_size = conn.exec_driver_sql("PRAGMA cache_size").scalar()
+        foreign_keys = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+        conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+        conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        # Los índices de Vote se llenan en orden aleatorio: caché de páginas de ~256 MB
+        conn.exec_driver_sql("PRAGMA cache_size = -262144")
+    conn.commit()
+    try:
+        yield
+    finally:
+        if dialect == "mysql":
+            conn.exec_driver_sql("SET unique_checks = 1")
+            conn.exec_driver_sql("SET foreign_key_checks = 1")
+        elif dialect == "sqlite":
+            conn.exec_driver_sql(f"PRAGMA synchronous = {int(synchronous)}")
+            conn.exec_driver_sql(f"PRAGMA cache_size = {int(cache_size)}")
+            conn.exec_driver_sql(f"PRAGMA foreign_keys = {int(foreign_keys)}")
+        conn.commit()
+
+
+@contextmanager
+def deferred_indexes(conn: Connection, tables: Iterable[str]):
+    """SQLite: quita los índices secundarios de ``tables`` y los recrea al salir.
+
+    Votos y comentarios llegan en orden aleatorio respecto de sus índices;
+    construir cada índice de una vez al final es varias veces más rápido que
+    mantenerlo fila a fila. Los índices de UNIQUE (sin ``sql``) se conservan.
+    En MySQL no hace nada: InnoDB difiere los índices secundarios en su change buffer.
+    """
+    if conn.dialect.name != "sqlite":
+        yield
+        return
+    tables = list(tables)
+    placeholders = ", ".join("?" for _ in tables)
+    indexes = conn.exec_driver_sql(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})",
+        tuple(tables),
+    ).all()
+    for name, _ in indexes:
+        conn.exec_driver_sql(f'DROP INDEX "{name}"')
+    conn.commit()
+    try:
+        yield
+    finally:
+        for _, sql in indexes:
+            conn.exec_driver_sql(sql)
+        conn.commit()
+
+
+def insert_chunks(conn: Connection, table, rows: Iterable[dict], chunk_size: int) -> tuple[int, float]:
+    """Inserta ``rows`` en lotes (un commit por lote); devuelve (filas, segundos)."""
+    started = time.perf_counter()
+    count = 0
+    for chunk in _chunks(rows, chunk_size):
+        conn.execute(insert(table), chunk)
+        conn.commit()
+        count += len(chunk)
+    return count, time.perf_counter() - started
+
+
+def _next_id(conn: Connection, column) -> int:
+    return (conn.execute(select(func.max(column))).scalar() or 0) + 1
+
+
+def _category_ids(conn: Connection) -> List[int]:
+    ids = list(conn.execute(select(Category.category_id).order_by(Category.category_id)).scalars())
+    if not ids:
+        conn.execute(insert(Category), [{"name": name, "description": f"Startups de {name.lower()}"}
+                                        for name in CATEGORIES])
+        conn.commit()
+        ids = list(conn.execute(select(Category.category_id).order_by(Category.category_id)).scalars())
+    return ids
+
+
+def load(engine: Engine, generator: DatasetGenerator, *, chunk_size: int = 10_000) -> Dict[str, tuple]:
+    """Carga el conjunto de ``generator``; devuelve tabla -> (filas, segundos).
+
+    ``(índices)`` es la reconstrucción de los índices diferidos (filas ``None``).
+    """
+    summary = {}
+    with engine.connect() as conn:
+        with bulk_load_settings(conn):
+            category_ids = _category_ids(conn)
+            first_user = _next_id(conn, User.user_id)
+            user_ids = range(first_user, first_user + generator.users)
+            steps = (
+                (User, generator.user_rows(first_user)),
+                (Startup, generator.startup_rows(_next_id(conn, Startup.startup_id), user_ids, category_ids)),
+                (Vote, generator.vote_rows(_next_id(conn, Vote.vote_id), user_ids)),
+                (Comment, generator.comment_rows(_next_id(conn, Comment.comment_id), user_ids)),
+                (StartupStats, generator.stats_rows()),
+            )
+            with deferred_indexes(conn, (Vote.__tablename__, Comment.__tablename__)):
+                for model, rows in steps:
+                    summary[model.__tablename__] = insert_chunks(conn, model.__table__, rows, chunk_size)
+                started = time.perf_counter()
+            summary["(índices)"] = (None, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with Session(engine) as db:
+        # Primer refresco de un snapshot nuevo: reconstrucción completa
+        rows = VoteStatsSnapshot().refresh(db)
+    summary["StartupVoteStatsSnapshot"] = (rows, time.perf_counter() - started)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="por defecto, DATABASE_URL")
+    parser.add_argument("--create-schema", action="store_true", help="crea las tablas que falten (create_all)")
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--startups", type=int, default=10_000)
+    parser.add_argument("--votes", type=int, default=500_000)
+    parser.add_argument("--comments", type=int, default=100_000)
+    parser.add_argument("--zipf", type=float, default=1.0, help="exponente de la popularidad de las startups")
+    parser.add_argument("--days", type=int, default=365, help="antigüedad máxima de las startups")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url or get_settings().database_url)
+    if args.create_schema:
+        Base.metadata.create_all(engine)
+    generator = DatasetGenerator(
+        users=args.users, startups=args.startups, votes=args.votes, comments=args.comments,
+        zipf=args.zipf, days=args.days, seed=args.seed,
+    )
+    started = time.perf_counter()
+    for table, (rows, seconds) in load(engine, generator, chunk_size=args.chunk_size).items():
+        if rows is None:
+            print(f"{table:>25}: {'':>10}      en {seconds:7.1f} s")
+        else:
+            print(f"{table:>25}: {rows:>10} filas en {seconds:7.1f} s ({rows / max(seconds, 1e-9):,.0f} filas/s)")
+    print(f"{'total':>25}: {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
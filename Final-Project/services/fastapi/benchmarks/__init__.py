@@ -0,0 +1,5 @@
+"""Benchmarks del backend. Se ejecutan como módulos desde services/fastapi:
+
+    python -m benchmarks.autocomplete --startups 100000
+    python -m benchmarks.api --sizes 1000,10000 --output bench.json
+"""
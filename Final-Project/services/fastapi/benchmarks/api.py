@@ -0,0 +1,309 @@
+"""Benchmark repetible de la API, en proceso y sobre SQLite.
+
+    python -m benchmarks.api --sizes 1000,10000 --output bench.json
+    python -m benchmarks.api --sizes 1000,10000 --output nuevo.json --baseline bench.json
+    python -m benchmarks.api --compare bench.json nuevo.json
+
+Por cada tamaño (número de startups) genera una vez una base SQLite con
+``app.tools.gen_data`` (votos y comentarios por startup según
+``--votes-per-startup``/``--comments-per-startup``) y la guarda en
+``--data-dir``. Cada corrida trabaja sobre una copia: los upserts de votos no
+alteran la base original.
+
+Cada tamaño corre en un subproceso propio (el engine y las cachés de la app
+son globales al proceso). Las peticiones van por ``httpx.ASGITransport`` a
+``app.main.app``, con el ``lifespan`` activo. Los escenarios son búsqueda,
+autocompletado, listado de comentarios, upsert de votos y detalle de startup.
+Cada uno informa peticiones por segundo, latencias p50/p95/p99 y sentencias SQL
+por petición, tomadas de la cabecera ``Server-Timing``.
+
+Con ``--baseline`` (o ``--compare base.json nuevo.json``) se marca una regresión
+cuando p95 sube o el throughput baja más que ``--threshold``, o cuando suben
+las sentencias por petición. En ese caso termina con código 1.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+SCENARIOS = ("search", "autocomplete", "comments", "vote_upsert", "startup_detail")
+# Términos de búsqueda y prefijos tomados del vocabulario de gen_data
+SEARCH_TERMS = ["eco", "agro", "salud", "pagos", "plataforma digital", "cooperativas", "verde", "energía"]
+AUTOCOMPLETE_PREFIXES = ["ec", "agr", "sal", "fin", "bio", "edu", "mer", "caf", "sol", "tie"]
+STATEMENTS = re.compile(r'desc="(\d+) queries"')
+# Diferencia mínima de sentencias por petición que cuenta como regresión
+STATEMENTS_TOLERANCE = 0.5
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(int(round(q / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarize(latencies, statements, errors: int, elapsed: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "statements_mean": round(statistics.fmean(statements), 2) if statements else 0.0,
+        "statements_max": max(statements, default=0),
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Regresiones de ``current`` frente a ``baseline``: (tamaño, escenario, métrica, antes, ahora)."""
+    regressions = []
+    for size, scenarios in current["results"].items():
+        for scenario, now in scenarios.items():
+            before = baseline["results"].get(size, {}).get(scenario)
+            if before is None:
+                continue
+            if now["p95_ms"] > before["p95_ms"] * (1 + threshold):
+                regressions.append((size, scenario, "p95_ms", before["p95_ms"], now["p95_ms"]))
+            if now["rps"] < before["rps"] * (1 - threshold):
+                regressions.append((size, scenario, "rps", before["rps"], now["rps"]))
+            if now["statements_mean"] > before["statements_mean"] + STATEMENTS_TOLERANCE:
+                regressions.append(
+                    (size, scenario, "statements_mean", before["statements_mean"], now["statements_mean"])
+                )
+            if now["errors"] > before["errors"]:
+                regressions.append((size, scenario, "errors", before["errors"], now["errors"]))
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    print(f"{'tamaño':>8} {'escenario':>15} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'SQL/req':>8}")
+    for size, scenarios in results["results"].items():
+        for scenario, r in scenarios.items():
+            print(
+                f"{size:>8} {scenario:>15} {r['rps']:>9.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+                f"{r['p99_ms']:>8.2f} {r['statements_mean']:>8.1f}" + (f"  ({r['errors']} errores)" if r["errors"] else "")
+            )
+
+
+def report_regressions(baseline: dict, current: dict, threshold: float) -> int:
+    regressions = compare(baseline, current, threshold)
+    for size, scenario, metric, before, now in regressions:
+        print(f"REGRESIÓN {size}/{scenario}: {metric} {before} -> {now}")
+    if not regressions:
+        print(f"Sin regresiones (umbral {threshold:.0%})")
+    return 1 if regressions else 0
+
+
+# --- Subproceso: un tamaño de dataset ---------------------------------------
+
+def dataset_path(data_dir: Path, size: int, args) -> Path:
+    return data_dir / f"starthub_{size}_{args.votes_per_startup}v_{args.comments_per_startup}c_s{args.seed}.db"
+
+
+def _prepare_dataset(path: Path, size: int, args) -> dict:
+    """Crea la base del tamaño pedido si no existe; devuelve lo necesario para armar peticiones."""
+    from sqlalchemy import create_engine, func, select
+
+    from app.db.base import Base
+    from app.models.startup import Startup
+    from app.models.user import User
+    from app.services.search_backend import SQLiteFTS5Backend
+    from app.tools.gen_data import DatasetGenerator, load
+
+    url = f"sqlite+pysqlite:///{path}"
+    if not path.exists():
+        building = path.with_suffix(".tmp")
+        building.unlink(missing_ok=True)
+        engine = create_engine(f"sqlite+pysqlite:///{building}")
+        Base.metadata.create_all(engine)
+        generator = DatasetGenerator(
+            users=max(1000, size // 2), startups=size, votes=size * args.votes_per_startup,
+            comments=size * args.comments_per_startup, seed=args.seed,
+        )
+        load(engine, generator)
+        with engine.begin() as conn:
+            # Índice FTS5 de una vez, después de la carga
+            SQLiteFTS5Backend.install(conn)
+            conn.exec_driver_sql("ANALYZE")
+        engine.dispose()
+        building.rename(path)
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        info = {
+            "startups": conn.execute(select(func.max(Startup.startup_id))).scalar(),
+            "users": conn.execute(select(func.max(User.user_id))).scalar(),
+        }
+    engine.dispose()
+    return info
+
+
+def _requests_for(scenario: str, rng: random.Random, info: dict):
+    """(método, url, cuerpo JSON) de una petición del escenario."""
+    # Acceso sesgado: la mitad de las peticiones va al 1 % de startups con ids más bajos
+    hot = max(1, info["startups"] // 100)
+    startup_id = rng.randint(1, hot) if rng.random() < 0.5 else rng.randint(1, info["startups"])
+    if scenario == "search":
+        return "GET", f"/api/v1/search-exploration/search?q={rng.choice(SEARCH_TERMS)}&limit=20", None
+    if scenario == "autocomplete":
+        return "GET", f"/api/v1/search-exploration/autocomplete?q={rng.choice(AUTOCOMPLETE_PREFIXES)}", None
+    if scenario == "comments":
+        return "GET", f"/api/v1/comments/?startup_id={startup_id}&limit=50", None
+    if scenario == "vote_upsert":
+        body = {"startup_id": startup_id, "vote_type": rng.choice(("upvote", "downvote"))}
+        return "POST", f"/api/v1/votes/?user_id={rng.randint(1, info['users'])}", body
+    return "GET", f"/api/v1/startups/{startup_id}", None
+
+
+async def _run_scenarios(args, info: dict) -> dict:
+    import httpx
+
+    from app.main import app
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for scenario in args.scenarios:
+                rng = random.Random(f"{args.seed}-{scenario}")
+
+                async def call():
+                    method, url, body = _requests_for(scenario, rng, info)
+                    started = time.perf_counter()
+                    response = await client.request(method, url, json=body)
+                    elapsed = time.perf_counter() - started
+                    match = STATEMENTS.search(response.headers.get("server-timing", ""))
+                    return elapsed, int(match.group(1)) if match else 0, response.status_code >= 400
+
+                for _ in range(args.warmup):
+                    await call()
+                latencies, statements, errors = [], [], 0
+                started = time.perf_counter()
+                for _ in range(args.requests):
+                    elapsed, count, failed = await call()
+                    latencies.append(elapsed)
+                    statements.append(count)
+                    errors += failed
+                results[scenario] = summarize(latencies, statements, errors, time.perf_counter() - started)
+    return results
+
+
+def run_worker(args) -> None:
+    import asyncio
+
+    size = args.worker_size
+    data_dir = Path(args.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    # Copia de trabajo: los votos del benchmark no tocan la base generada.
+    # La URL se fija antes de importar app: el engine se crea al importarse.
+    work = Path(tempfile.mkdtemp(prefix="starthub-bench-")) / "bench.db"
+    os.environ["DATABASE_URL"] = f"sqlite+pysqlite:///{work}"
+    info = _prepare_dataset(dataset_path(data_dir, size, args), size, args)
+    shutil.copyfile(dataset_path(data_dir, size, args), work)
+    try:
+        results = asyncio.run(_run_scenarios(args, info))
+    finally:
+        shutil.rmtree(work.parent, ignore_errors=True)
+    Path(args.worker_output).write_text(json.dumps(results))
+
+
+# --- Proceso principal ------------------------------------------------------
+
+def run_sizes(args) -> dict:
+    results = {}
+    for size in args.sizes:
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+            output = handle.name
+        env = {
+            **os.environ,
+            # Sin tareas de fondo; por defecto tampoco caché de lectura
+            "CACHE_BACKEND": args.cache_backend,
+            "TRENDING_REFRESH_SECONDS": "0",
+            "VOTE_STATS_REFRESH_SECONDS": "0",
+            "APP_DEBUG": "false",
+        }
+        command = [
+            sys.executable, "-m", "benchmarks.api", "--worker-size", str(size), "--worker-output", output,
+            "--data-dir", args.data_dir, "--requests", str(args.requests), "--warmup", str(args.warmup),
+            "--votes-per-startup", str(args.votes_per_startup),
+            "--comments-per-startup", str(args.comments_per_startup), "--seed", str(args.seed),
+            "--scenarios", ",".join(args.scenarios),
+        ]
+        print(f"tamaño {size}...", file=sys.stderr)
+        # La salida de la app (prints de depuración) no se mezcla con el informe
+        subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+        results[str(size)] = json.loads(Path(output).read_text())
+        os.unlink(output)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "votes_per_startup": args.votes_per_startup,
+            "comments_per_startup": args.comments_per_startup,
+            "seed": args.seed,
+            "cache_backend": args.cache_backend,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=lambda v: [int(s) for s in v.split(",")], default=[1000, 10000])
+    parser.add_argument("--requests", type=int, default=300, help="peticiones medidas por escenario")
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--votes-per-startup", type=int, default=20)
+    parser.add_argument("--comments-per-startup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", type=lambda v: v.split(","), default=list(SCENARIOS))
+    parser.add_argument("--cache-backend", default="none", help="CACHE_BACKEND de la app (none mide la base)")
+    parser.add_argument("--data-dir", default=str(Path(tempfile.gettempdir()) / "starthub-bench"))
+    parser.add_argument("--output", help="archivo JSON de resultados")
+    parser.add_argument("--baseline", help="JSON de una corrida anterior con el que comparar")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NUEVO"), help="solo compara dos JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="variación tolerada de p95 y req/s")
+    parser.add_argument("--worker-size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"escenarios desconocidos: {', '.join(sorted(unknown))}")
+
+    if args.worker_size is not None:
+        if str(PROJECT_ROOT) not in sys.path:
+            sys.path.insert(0, str(PROJECT_ROOT))
+        run_worker(args)
+        return
+
+    if args.compare:
+        baseline, current = (json.loads(Path(p).read_text()) for p in args.compare)
+        print_results(current)
+        sys.exit(report_regressions(baseline, current, args.threshold))
+
+    current = run_sizes(args)
+    print_results(current)
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2))
+    if args.baseline:
+        sys.exit(report_regressions(json.loads(Path(args.baseline).read_text()), current, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
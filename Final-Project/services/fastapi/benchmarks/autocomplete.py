@@ -0,0 +1,91 @@
+"""Latencia del motor de autocompletado con un catálogo sintético.
+
+    python -m benchmarks.autocomplete --startups 100000 --queries 20000
+
+Mide por separado las consultas en frío (prefijo fuera del LRU) y en caliente
+(prefijo repetido), e informa p50/p95/p99 en microsegundos.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.autocomplete import AutocompleteEngine, fold  # noqa: E402
+
+PREFIXES = ["Eco", "Agro", "Fin", "Salud", "Bio", "Edu", "Mar", "Tec", "Árbol", "Energía", "Café", "Ñandú"]
+WORDS = [
+    "Solutions", "Andina", "Verde", "Digital", "Pagos", "Logística", "Tecnología", "Rural",
+    "Urbano", "Móvil", "Datos", "Social", "Labs", "Express", "Sostenible", "Creativa",
+]
+
+
+def synthetic_rows(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for startup_id in range(1, count + 1):
+        name = rng.choice(PREFIXES) + rng.choice(WORDS).lower()
+        name += " " + " ".join(rng.sample(WORDS, rng.randint(1, 3)))
+        yield startup_id, f"{name} {startup_id}", "Descripción de ejemplo"
+
+
+def percentiles(samples_us):
+    ordered = sorted(samples_us)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]  # noqa: E731
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "mean": statistics.fmean(ordered)}
+
+
+def run(startups: int, queries: int, limit: int) -> dict:
+    rows = list(synthetic_rows(startups))
+    engine = AutocompleteEngine()
+    started = time.perf_counter()
+    engine.load(rows)
+    load_s = time.perf_counter() - started
+
+    rng = random.Random(11)
+    names = [fold(name) for _, name, _ in rows]
+    words = [w for name in names[:5000] for w in name.split() if len(w) >= 2]
+    terms = []
+    for _ in range(queries):
+        source = rng.choice(names) if rng.random() < 0.5 else rng.choice(words)
+        terms.append(source[: rng.randint(2, min(8, len(source)))])
+
+    def measure(term_list):
+        samples = []
+        for term in term_list:
+            t0 = time.perf_counter_ns()
+            engine.suggest(term, limit)
+            samples.append((time.perf_counter_ns() - t0) / 1000)
+        return samples
+
+    engine.cache.maxsize = 0  # en frío: sin LRU
+    cold = measure(terms)
+    engine.cache.maxsize = 2048
+    measure(terms[:2048])
+    warm = measure(terms[:2048])
+    return {"load_s": load_s, "cold": percentiles(cold), "warm": percentiles(warm)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--startups", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    result = run(args.startups, args.queries, args.limit)
+    print(f"startups={args.startups} queries={args.queries} carga={result['load_s']:.2f}s")
+    for label in ("cold", "warm"):
+        stats = result[label]
+        print(
+            f"{label:>5}: p50={stats['p50']:.1f}us p95={stats['p95']:.1f}us "
+            f"p99={stats['p99']:.1f}us media={stats['mean']:.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Consultas, tamaño de fila y tiempo por página del listado de startups.
+
+    python -m benchmarks.list_queries --startups 20000 --limit 100
+
+Sobre una base SQLite en memoria compara la carga de entidades ``Startup``
+completas (como hacían ``get_all``/``get_by_owner``) con la proyección de
+columnas actual (``LIST_COLUMNS``). Informa sentencias por página, columnas y
+bytes aproximados por fila, y milisegundos por página.
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, event, insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.db.base import Base  # noqa: E402
+from app.models.category import Category  # noqa: E402
+from app.models.startup import Startup  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.startup_repository import LIST_COLUMNS  # noqa: E402
+
+
+def build_engine(startups: int):
+    engine = create_engine("sqlite+pysqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    now = datetime(2026, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [{"category_id": i, "name": f"Categoría {i}"} for i in range(1, 13)])
+        conn.execute(insert(User), [
+            {"user_id": i, "email": f"u{i}@example.com", "password_hash": "x",
+             "first_name": "Nombre", "last_name": f"Apellido {i}"}
+            for i in range(1, 501)
+        ])
+        conn.execute(insert(Startup), [
+            {"startup_id": i, "name": f"Startup {i}", "description": "Descripción de ejemplo " * 20,
+             "email": f"s{i}@example.com", "website": f"https://s{i}.example.com", "social_media": "@startup",
+             "created_date": now, "modified_date": now, "owner_user_id": i % 500 + 1, "category_id": i % 12 + 1}
+            for i in range(1, startups + 1)
+        ])
+    return engine
+
+
+def row_bytes(values) -> int:
+    return sum(len(v.encode()) if isinstance(v, str) else 8 for v in values if v is not None)
+
+
+def measure(engine, pages: int, limit: int, load_page):
+    statements = []
+    listener = lambda conn, cursor, stmt, *rest: statements.append(stmt)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    started = time.perf_counter()
+    columns = size = 0
+    for page in range(pages):
+        with Session(engine) as db:
+            columns, sizes = load_page(db, page * limit, limit)
+            size += sum(sizes) / max(len(sizes), 1)
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "before_cursor_execute", listener)
+    return {
+        "statements": len(statements) / pages,
+        "columns": columns,
+        "bytes": size / pages,
+        "ms": elapsed * 1000 / pages,
+    }
+
+
+def entities(db, skip, limit):
+    startups = db.query(Startup).order_by(Startup.startup_id).offset(skip).limit(limit).all()
+    columns = [c.key for c in Startup.__table__.columns]
+    return len(columns), [row_bytes(getattr(s, c) for c in columns) for s in startups]
+
+
+def projected(db, skip, limit):
+    rows = db.execute(select(*LIST_COLUMNS).order_by(Startup.startup_id).offset(skip).limit(limit)).all()
+    return len(LIST_COLUMNS), [row_bytes(row) for row in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--startups", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    engine = build_engine(args.startups)
+    pages = min(args.pages, args.startups // args.limit)
+    for label, load_page in (("entidades", entities), ("columnas", projected)):
+        measure(engine, 1, args.limit, load_page)  # calentamiento
+        r = measure(engine, pages, args.limit, load_page)
+        print(
+            f"{label:>9}: {r['statements']:.0f} sentencias/página, {r['columns']} columnas, "
+            f"~{r['bytes']:.0f} bytes/fila, {r['ms']:.2f} ms/página"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Filas por segundo al serializar un listado de startups.
+
+    python -m benchmarks.serialization --rows 100 --repeat 500
+
+Compara el camino anterior (``StartupOut(**fila)`` y ``response_model`` de
+FastAPI: revalidación + ``jsonable_encoder`` + ``json.dumps``) con el actual
+(``TypeAdapter`` sobre la lista completa + ``FastJSONResponse``/orjson) para
+páginas de ``--rows`` filas.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.core.responses import FastJSONResponse  # noqa: E402
+from app.schemas.startup_crud import StartupOut  # noqa: E402
+from app.services.startup_service import STARTUP_LIST  # noqa: E402
+
+
+def synthetic_rows(count: int) -> List[dict]:
+    base = datetime(2026, 1, 1, 12, 30)
+    return [
+        {
+            "startup_id": i,
+            "name": f"Startup {i}",
+            "description": "Plataforma de logística sostenible para productores rurales " * 2,
+            "category_id": i % 12 + 1,
+            "owner_user_id": i % 500 + 1,
+            "created_date": base + timedelta(minutes=i),
+            "email": f"contacto{i}@example.com",
+            "website": f"https://startup{i}.example.com",
+            "social_media": None,
+            "category_name": "Tecnología",
+            "owner_name": "Ana Ruiz",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def before(rows: List[dict], repeat: int) -> bytes:
+    field = create_response_field(name="Response_list_startups", type_=List[StartupOut])
+
+    async def loop():
+        body = b""
+        for _ in range(repeat):
+            models = [StartupOut(**row) for row in rows]
+            content = await serialize_response(field=field, response_content=models)
+            body = JSONResponse(content).body
+        return body
+
+    return asyncio.run(loop())
+
+
+def after(rows: List[dict], repeat: int) -> bytes:
+    body = b""
+    for _ in range(repeat):
+        models = STARTUP_LIST.validate_python(rows)
+        body = FastJSONResponse(models).body
+    return body
+
+
+def run(rows: int, repeat: int) -> dict:
+    data = synthetic_rows(rows)
+    result = {}
+    for label, path in (("antes", before), ("ahora", after)):
+        path(data, 1)  # calentamiento (esquemas de validación, field de FastAPI)
+        started = time.perf_counter()
+        path(data, repeat)
+        result[label] = rows * repeat / (time.perf_counter() - started)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100, help="filas por página")
+    parser.add_argument("--repeat", type=int, default=500, help="páginas serializadas por camino")
+    args = parser.parse_args(argv)
+
+    result = run(args.rows, args.repeat)
+    for label, rate in result.items():
+        print(f"{label}: {rate:,.0f} filas/s")
+    print(f"mejora: x{result['ahora'] / result['antes']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.db.base import Base  # noqa: E402
+from app import models  # noqa: F401,E402
+from app.db.session import enable_sqlite_foreign_keys  # noqa: E402
+from app.services.category_catalog import get_category_catalog  # noqa: E402
+from app.services.read_cache import get_read_cache  # noqa: E402
+from app.services.user_names import get_user_name_resolver  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    # Cachés globales al proceso: los ids se repiten entre tests con bases distintas
+    get_read_cache().clear()
+    get_read_cache().reset_stats()
+    get_category_catalog.cache_clear()
+    get_user_name_resolver().clear()
+    yield
+    get_read_cache().clear()
+    get_read_cache().reset_stats()
+    get_category_catalog.cache_clear()
+    get_user_name_resolver().clear()
+
+
+@pytest.fixture
+def engine():
+    # SQLite en memoria compartido por todas las conexiones del test
+    engine = create_engine(
+        "sqlite+pysqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    enable_sqlite_foreign_keys(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def seed(engine):
+    """Dos usuarios, una categoría y una startup base (id=1)."""
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO `User` (user_id, email, first_name, last_name) "
+            "VALUES (1, 'ana@example.com', 'Ana', 'Ruiz'), (2, 'luis@example.com', 'Luis', 'Mora')"
+        ))
+        conn.execute(text("INSERT INTO Category (category_id, name) VALUES (1, 'Tecnología')"))
+        conn.execute(text(
+            "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+            "VALUES (1, 'EcoTech Solutions', 'Tecnología sostenible', 1, 1)"
+        ))
+    return engine
+
+
+@pytest.fixture
+def statements(seed):
+    """Sentencias SQL ejecutadas sobre el engine del test, en orden (vaciable con ``clear()``)."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(seed, "before_cursor_execute", capture)
+    yield captured
+    event.remove(seed, "before_cursor_execute", capture)
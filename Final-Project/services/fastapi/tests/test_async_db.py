@@ -0,0 +1,201 @@
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import comments, search
+from app.core.config import get_settings
+from app.db import session as db_session
+from app.db.base import Base
+from app.db.session import async_database_url, async_db_enabled
+from app.schemas.search import StartupSearchRequest, SearchSortBy
+from app.services.comment_service import AsyncCommentService, CommentService
+from app.services.search_backend import SQLiteFTS5Backend, get_async_search_backend
+from app.services.search_index import StartupSearchIndex
+from app.services.search_service import AsyncSearchService, SearchService
+from app.services.user_names import get_user_name_resolver
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Base SQLite en archivo, compartida por el engine sync y el asíncrono."""
+    path = tmp_path / "starthub.db"
+    engine = create_engine(f"sqlite+pysqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        SQLiteFTS5Backend.install(conn)
+        conn.execute(text(
+            "INSERT INTO `User` (user_id, email, first_name, last_name) "
+            "VALUES (1, 'ana@example.com', 'Ana', 'Ruiz'), (2, 'luis@example.com', 'Luis', 'Mora')"
+        ))
+        conn.execute(text("INSERT INTO Category (category_id, name) VALUES (1, 'Tecnología')"))
+        conn.execute(
+            text(
+                "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+                "VALUES (:sid, :name, :desc, 1, 1)"
+            ),
+            [
+                {"sid": 1, "name": "EcoTech Solutions", "desc": "Tecnología sostenible"},
+                {"sid": 2, "name": "FinPay", "desc": "Pagos móviles"},
+                {"sid": 3, "name": "Pagos Andinos", "desc": "Pagos para pymes"},
+            ],
+        )
+        conn.execute(
+            text("INSERT INTO StartupStats (startup_id, total_votes, total_comments) VALUES (:sid, :v, :c)"),
+            [{"sid": 1, "v": 1, "c": 4}, {"sid": 2, "v": 5, "c": 0}, {"sid": 3, "v": 2, "c": 0}],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO Comment (comment_id, content, created_date, user_id, startup_id) "
+                "VALUES (:cid, 'Muy bien', :created, :uid, 1)"
+            ),
+            [{"cid": i, "created": f"2026-10-0{i} 10:00:00", "uid": 1 + i % 2} for i in range(1, 5)],
+        )
+    engine.dispose()
+    return path
+
+
+def _run_async(db_path, work):
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                return await work(engine, session)
+        finally:
+            await engine.dispose()
+    return asyncio.run(main())
+
+
+def test_async_url_swaps_driver():
+    settings = get_settings()
+    mysql = settings.model_copy(update={"database_url": "mysql+mysqlconnector://u:p@db:3306/starthub"})
+    sqlite = settings.model_copy(update={"database_url": "sqlite+pysqlite:///./starthub.db"})
+    explicit = mysql.model_copy(update={"async_database_url": "mysql+asyncmy://u:p@db:3306/starthub"})
+
+    assert async_database_url(mysql).render_as_string(hide_password=False) == "mysql+aiomysql://u:p@db:3306/starthub"
+    assert async_database_url(sqlite).drivername == "sqlite+aiosqlite"
+    assert async_database_url(explicit).drivername == "mysql+asyncmy"
+
+    with pytest.raises(ValueError):
+        async_database_url(settings.model_copy(update={"database_url": "postgresql://u:p@db/starthub"}))
+    # Una base en memoria por engine: el asíncrono no vería las escrituras del síncrono
+    for memory in ("sqlite+pysqlite:///:memory:", "sqlite+pysqlite://"):
+        with pytest.raises(ValueError):
+            async_database_url(settings.model_copy(update={"database_url": memory}))
+
+
+@pytest.mark.parametrize("query,sort_by", [
+    ("pagos", SearchSortBy.RELEVANCIA),
+    ("pagos", SearchSortBy.VOTOS_ASC),
+    (None, SearchSortBy.COMENTARIOS_DESC),
+])
+def test_async_search_matches_sync_search(db_path, query, sort_by):
+    request = StartupSearchRequest(query=query, sort_by=sort_by, limit=2)
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+    with sessionmaker(bind=engine)() as session:
+        expected = SearchService(session).search_startups(request)
+    engine.dispose()
+
+    async def work(async_engine, session):
+        backend = await get_async_search_backend(async_engine)
+        assert isinstance(backend, SQLiteFTS5Backend)
+        return await AsyncSearchService(session, backend).search_startups(request)
+
+    assert _run_async(db_path, work) == expected
+
+
+
+def test_async_index_search_runs_off_the_event_loop(db_path, monkeypatch):
+    request = StartupSearchRequest(query="pagos", limit=2)
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+    index = StartupSearchIndex()
+    with sessionmaker(bind=engine)() as session:
+        expected = SearchService(session).search_startups(request)
+        index.build(session)
+    engine.dispose()
+    threads = []
+    search = index.search
+    monkeypatch.setattr(index, "search", lambda term: threads.append(threading.get_ident()) or search(term))
+    monkeypatch.setattr("app.services.search_service.get_search_index", lambda: index)
+
+    async def work(async_engine, session):
+        backend = await get_async_search_backend(async_engine)
+        return await AsyncSearchService(session, backend).search_startups(request)
+
+    assert _run_async(db_path, work) == expected
+    assert threads and threads[0] != threading.get_ident()
+
+def test_async_comment_listing_matches_sync(db_path):
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+    with sessionmaker(bind=engine)() as session:
+        expected = CommentService(session).list_page(1, limit=3)
+    engine.dispose()
+
+    async def work(async_engine, session):
+        service = AsyncCommentService(session)
+        first = await service.list_page(1, limit=3)
+        rest = await service.list_page(1, limit=3, cursor=first[1])
+        return first, rest
+
+    first, rest = _run_async(db_path, work)
+    assert first == expected
+    assert [c["comment_id"] for c in first[0] + rest[0]] == [4, 3, 2, 1]
+    assert rest[1] is None
+
+
+def test_async_comment_version_tracks_the_page(db_path):
+    async def versions(engine, session):
+        service = AsyncCommentService(session)
+        return await service.list_version(1, limit=2), await service.list_version(1, limit=2, skip=2)
+
+    first, second = _run_async(db_path, versions)
+    assert first != second
+    assert first.last_modified == datetime(2026, 10, 4, 10, 0)
+
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE Comment SET content = 'Editado', modified_date = '2026-10-10 09:00:00' WHERE comment_id = 1"))
+    engine.dispose()
+
+    first_after, second_after = _run_async(db_path, versions)
+    assert first_after == first
+    assert second_after != second
+    assert second_after.last_modified == datetime(2026, 10, 10, 9, 0)
+
+    # Renombrar al autor cambia la versión aunque los comentarios no cambien
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE `User` SET first_name = 'Luisa' WHERE user_id = 2"))
+    engine.dispose()
+    get_user_name_resolver().invalidate(2)
+    assert _run_async(db_path, versions)[0] != first_after
+
+
+def test_async_routes_fall_back_to_sync_on_in_memory_sqlite(seed, engine, monkeypatch):
+    settings = get_settings().model_copy(update={"database_url": "sqlite+pysqlite:///:memory:"})
+    assert not async_db_enabled(settings)
+    # La sesión síncrona del worker, sobre la base en memoria del test
+    monkeypatch.setattr(db_session, "settings", settings)
+    monkeypatch.setattr(db_session, "engine", engine)
+    monkeypatch.setattr(db_session, "SessionLocal", sessionmaker(bind=engine, future=True))
+    with seed.begin() as conn:
+        conn.execute(text("INSERT INTO Comment (content, user_id, startup_id) VALUES ('Hola', 2, 1)"))
+
+    app = FastAPI()
+    app.include_router(comments.router, prefix="/comments")
+    app.include_router(search.router, prefix="/search-exploration")
+    client = TestClient(app)
+
+    listed = client.get("/comments/", params={"startup_id": 1})
+    assert listed.status_code == 200 and [c["user_name"] for c in listed.json()] == ["Luis Mora"]
+    assert client.get("/comments/", params={"startup_id": 1},
+                      headers={"If-None-Match": listed.headers["ETag"]}).status_code == 304
+    found = client.get("/search-exploration/search", params={"q": "eco"})
+    assert found.status_code == 200 and [r["startup_id"] for r in found.json()["results"]] == [1]
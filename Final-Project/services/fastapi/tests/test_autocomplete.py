@@ -0,0 +1,135 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app.schemas.startup_crud import StartupCreate, StartupUpdate
+from app.services.autocomplete import AutocompleteEngine, fold, get_autocomplete_engine
+from app.services.search_service import SearchService
+from app.services.startup_service import StartupService
+
+
+@pytest.fixture
+def catalog(seed):
+    with seed.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+                "VALUES (:sid, :name, :desc, 1, 1)"
+            ),
+            [
+                {"sid": 2, "name": "Árbol Urbano", "desc": "Reforestación de ciudades"},
+                {"sid": 3, "name": "Arepa Express", "desc": None},
+                {"sid": 4, "name": "Energía  Solar Andina", "desc": "Paneles"},
+                {"sid": 5, "name": "Mercado Árabe", "desc": "Importaciones"},
+            ],
+        )
+    return seed
+
+
+@pytest.fixture
+def fresh_engine():
+    get_autocomplete_engine.cache_clear()
+    yield
+    get_autocomplete_engine.cache_clear()
+
+
+def _names(results):
+    return [r["name"] for r in results]
+
+
+def test_fold_strips_accents_and_case():
+    assert fold("  Energía  SOLAR Ñandú ") == "energia solar nandu"
+
+
+def test_name_prefix_matches_come_first_then_inner_words(catalog, db):
+    engine = AutocompleteEngine()
+    engine.build(db)
+
+    # "ar" es inicio del nombre en Árbol/Arepa y de una palabra interna en Mercado Árabe
+    assert _names(engine.suggest("ar")) == ["Árbol Urbano", "Arepa Express", "Mercado Árabe"]
+    assert _names(engine.suggest("ÁR", limit=1)) == ["Árbol Urbano"]
+    assert _names(engine.suggest("solar an")) == ["Energía  Solar Andina"]
+    assert _names(engine.suggest("tech")) == ["EcoTech Solutions"]
+    assert engine.suggest("a") == []
+    assert engine.suggest("zz") == []
+
+
+def test_results_include_description(catalog, db):
+    engine = AutocompleteEngine()
+    engine.build(db)
+
+    assert engine.suggest("arepa") == [{"startup_id": 3, "name": "Arepa Express", "description": ""}]
+
+
+def test_prefix_cache_is_invalidated_on_writes(catalog, db):
+    engine = AutocompleteEngine()
+    engine.build(db)
+
+    assert _names(engine.suggest("ener")) == ["Energía  Solar Andina"]
+    assert _names(engine.suggest("ener")) == ["Energía  Solar Andina"]
+    assert engine.cache.hits == 1
+
+    engine.upsert(6, "Energética", "Baterías")
+    assert _names(engine.suggest("ener")) == ["Energética", "Energía  Solar Andina"]
+
+    engine.remove(4)
+    assert _names(engine.suggest("ener")) == ["Energética"]
+    assert engine.suggest("solar") == []
+
+
+def test_service_loads_lazily_and_follows_startup_writes(catalog, db, fresh_engine):
+    search = SearchService(db)
+    engine = get_autocomplete_engine()
+    assert not engine.loaded
+
+    assert _names(search.autocomplete("eco")) == ["EcoTech Solutions"]
+    assert engine.loaded
+
+    service = StartupService(db)
+    created = service.create(1, StartupCreate(
+        name="Ecológica Café", description="Café de origen", category_id=1, owner_user_id=1,
+    ))
+    assert _names(search.autocomplete("eco")) == ["Ecológica Café", "EcoTech Solutions"]
+
+    service.update(created.startup_id, 1, StartupUpdate(name="Tostadora Andina"))
+    assert _names(search.autocomplete("eco")) == ["EcoTech Solutions"]
+    assert _names(search.autocomplete("tosta")) == ["Tostadora Andina"]
+
+    service.delete(created.startup_id, 1)
+    assert _names(search.autocomplete("tosta")) == []
+
+
+def test_write_during_suggest_is_not_hidden_by_the_prefix_cache(catalog, db):
+    engine = AutocompleteEngine()
+    engine.build(db)
+    scan, writers = engine._scan, []
+
+    def scan_while_writing(*args):
+        # Escritura concurrente: espera a que suggest suelte el lock
+        if not writers:
+            writers.append(threading.Thread(target=engine.upsert, args=(6, "Energética", None)))
+            writers[0].start()
+        return scan(*args)
+
+    engine._scan = scan_while_writing
+    assert _names(engine.suggest("ener")) == ["Energía  Solar Andina"]
+    writers[0].join()
+    assert _names(engine.suggest("ener")) == ["Energética", "Energía  Solar Andina"]
+
+
+def test_reloads_after_ttl_to_see_other_workers_writes(catalog, db):
+    engine = AutocompleteEngine(ttl=60)
+    engine.ensure_loaded(db)
+    # Alta hecha por otro worker: este motor no recibe el upsert
+    with catalog.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+            "VALUES (6, 'Energética', NULL, 1, 1)"
+        ))
+    engine.ensure_loaded(db)
+    assert _names(engine.suggest("ener")) == ["Energía  Solar Andina"]
+
+    engine.loaded_at -= 61
+    engine.ensure_loaded(db)
+    assert _names(engine.suggest("ener")) == ["Energética", "Energía  Solar Andina"]
@@ -0,0 +1,63 @@
+import pytest
+
+from benchmarks.api import STATEMENTS_TOLERANCE, compare, percentile, report_regressions, summarize
+
+
+def _result(**overrides):
+    result = {"requests": 100, "errors": 0, "rps": 200.0, "p95_ms": 10.0, "statements_mean": 3.0}
+    result.update(overrides)
+    return result
+
+
+def _run(**scenarios):
+    return {"results": {"1000": scenarios}}
+
+
+def test_percentile_picks_the_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile(values, 100) == 5
+    assert percentile([], 95) == 0.0
+    assert percentile([7], 99) == 7
+
+
+def test_summarize_reports_ms_and_statements():
+    summary = summarize([0.001, 0.002, 0.003, 0.004], [2, 2, 3, 5], errors=1, elapsed=2.0)
+    assert summary["requests"] == 4 and summary["errors"] == 1
+    assert summary["rps"] == 2.0
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (3.0, 4.0, 4.0)
+    assert summary["statements_mean"] == 3.0 and summary["statements_max"] == 5
+    assert summarize([], [], errors=0, elapsed=0)["rps"] == 0.0
+
+
+@pytest.mark.parametrize("current, metric", [
+    (_result(p95_ms=12.5), "p95_ms"),
+    (_result(rps=150.0), "rps"),
+    (_result(statements_mean=3.0 + STATEMENTS_TOLERANCE + 0.1), "statements_mean"),
+    (_result(errors=1), "errors"),
+])
+def test_each_rule_flags_its_regression(current, metric):
+    regressions = compare(_run(search=_result()), _run(search=current), threshold=0.2)
+    assert [r[:3] for r in regressions] == [("1000", "search", metric)]
+
+
+def test_changes_within_the_threshold_are_not_regressions(capsys):
+    current = _result(p95_ms=11.9, rps=161.0, statements_mean=3.0 + STATEMENTS_TOLERANCE)
+    assert compare(_run(search=_result()), _run(search=current), threshold=0.2) == []
+    assert report_regressions(_run(search=_result()), _run(search=current), threshold=0.2) == 0
+    assert "Sin regresiones" in capsys.readouterr().out
+
+
+def test_sizes_and_scenarios_missing_from_the_baseline_are_skipped(capsys):
+    baseline = _run(search=_result())
+    current = {"results": {
+        "1000": {"search": _result(), "comments": _result(p95_ms=99.0)},
+        "10000": {"search": _result(p95_ms=99.0, errors=3)},
+    }}
+    assert compare(baseline, current, threshold=0.2) == []
+
+    current["results"]["1000"]["search"] = _result(errors=2)
+    assert report_regressions(baseline, current, threshold=0.2) == 1
+    assert "REGRESIÓN 1000/search: errors 0 -> 2" in capsys.readouterr().out
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import text
+
+from app.services import category_catalog
+from app.services.category_catalog import CategoryCatalog
+from app.services.startup_service import StartupService
+
+
+def test_snapshot_is_immutable_and_reused(seed, db, statements):
+    catalog = CategoryCatalog(ttl=60)
+    snapshot = catalog.snapshot(db)
+    assert [c.name for c in catalog.all(db)] == ["Tecnología"]
+    assert catalog.name(db, 1) == "Tecnología"
+    assert catalog.snapshot(db) is snapshot
+    assert len(statements) == 1
+    with pytest.raises(TypeError):
+        snapshot.by_id[2] = None
+
+
+def test_ttl_and_unknown_ids_reload(seed, db, monkeypatch):
+    catalog = CategoryCatalog(ttl=60)
+    first = catalog.snapshot(db)
+    with seed.begin() as conn:
+        conn.execute(text("INSERT INTO Category (category_id, name) VALUES (2, 'Salud')"))
+
+    # Id desconocido: recarga (el intervalo mínimo entre recargas se anula en el test)
+    monkeypatch.setattr(category_catalog, "MISS_RELOAD_INTERVAL", 0)
+    assert catalog.name(db, 2) == "Salud"
+    assert catalog.snapshot(db).version != first.version
+
+    with seed.begin() as conn:
+        conn.execute(text("UPDATE Category SET name = 'Salud digital' WHERE category_id = 2"))
+    assert catalog.name(db, 2) == "Salud"
+    catalog.ttl = 0.000001
+    assert catalog.name(db, 2) == "Salud digital"
+    assert catalog.reloads == 3
+
+
+def test_startup_reads_take_category_name_from_catalog(seed, db, statements):
+    service = StartupService(db)
+    service.list_categories()
+    statements.clear()
+
+    startup = service.get(1)
+    assert startup.category_name == "Tecnología"
+    assert service.get_with_stats(1).category_name == "Tecnología"
+    assert not [s for s in statements if "Category" in s]
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import get_settings
+from sqlalchemy.pool import QueuePool
+
+from app.db.session import PoolMetrics, engine_options
+
+
+def test_pool_options_only_for_server_databases():
+    settings = get_settings().model_copy(update={"pool_size": 7, "max_overflow": 3, "pool_recycle": 600})
+
+    sqlite_options = engine_options(settings.model_copy(update={"database_url": "sqlite+pysqlite:///:memory:"}))
+    assert "pool_size" not in sqlite_options
+
+    mysql_options = engine_options(
+        settings.model_copy(update={"database_url": "mysql+mysqlconnector://u:p@db:3306/starthub"})
+    )
+    assert "poolclass" not in mysql_options
+    assert mysql_options["pool_size"] == 7
+    assert mysql_options["max_overflow"] == 3
+    assert mysql_options["pool_recycle"] == 600
+    assert mysql_options["pool_pre_ping"] is True
+
+
+def test_metrics_report_checkouts_and_saturation(tmp_path):
+    engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'pool.db'}",
+        poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05,
+    )
+    metrics, other = PoolMetrics(max_overflow=0), PoolMetrics(max_overflow=0)
+    metrics.attach(engine.pool)
+
+    with metrics.timed_checkout(engine.pool):
+        held = engine.connect()
+    status = metrics.snapshot(engine.pool)
+    assert status["checked_out"] == 1
+    assert status["size"] == 1
+    assert status["max_overflow"] == 0
+    assert metrics.waits == 0
+
+    # Pool lleno: la segunda conexión espera pool_timeout y falla
+    with pytest.raises(PoolTimeoutError):
+        with metrics.timed_checkout(engine.pool):
+            engine.connect()
+    assert metrics.waits == 1
+    assert metrics.timeouts == 1
+    assert metrics.max_wait_seconds >= 0.05
+    # Cada engine tiene su propio objeto de métricas
+    assert other.waits == 0
+
+    held.close()
+    with metrics.timed_checkout(engine.pool), engine.connect():
+        pass
+    assert metrics.waits == 1
+    status = metrics.snapshot(engine.pool)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 2
+    assert status["checkins"] == 2
+    assert status["peak_checked_out"] == 1
+    assert status["connects"] == 1
+    engine.dispose()
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from sqlalchemy import func, select, text
+
+from app.models.startup_stats import StartupStats
+from app.models.startup_vote_stats import StartupVoteStatsSnapshot
+from app.models.vote import Vote
+from app.tools.gen_data import DatasetGenerator, load
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+def _generator(**overrides):
+    options = dict(users=40, startups=30, votes=400, comments=120, seed=3, now=NOW)
+    return DatasetGenerator(**{**options, **overrides})
+
+
+def test_loads_after_existing_rows_with_consistent_stats(seed, db):
+    summary = load(seed, _generator(), chunk_size=50)
+
+    assert summary["User"][0] == 40 and summary["Startup"][0] == 30
+    assert summary["StartupVoteStatsSnapshot"][0] == 31
+    # Los ids continúan los del seed y los votos respetan un voto por usuario y startup
+    assert db.execute(text("SELECT MIN(startup_id) FROM Startup WHERE startup_id > 1")).scalar() == 2
+    assert db.execute(text("SELECT COUNT(*) FROM Vote")).scalar() == summary["Vote"][0]
+    assert not db.execute(text("SELECT user_id, startup_id FROM Vote GROUP BY 1, 2 HAVING COUNT(*) > 1")).all()
+    assert db.execute(text("SELECT COUNT(*) FROM Vote WHERE created_date > :now"), {"now": NOW}).scalar() == 0
+
+    live = dict(db.execute(select(Vote.startup_id, func.count()).group_by(Vote.startup_id)).all())
+    stats = dict(db.execute(select(StartupStats.startup_id, StartupStats.total_votes)).all())
+    snapshot = dict(db.execute(select(StartupVoteStatsSnapshot.startup_id, StartupVoteStatsSnapshot.total_votes)).all())
+    assert {sid: total for sid, total in stats.items() if total} == live
+    assert {sid: total for sid, total in snapshot.items() if total} == live
+    # Índices diferidos recreados y claves foráneas activas de nuevo
+    assert db.execute(text("SELECT COUNT(*) FROM sqlite_master WHERE name = 'idx_vote_startup_type'")).scalar() == 1
+    assert db.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def test_zipf_allocation_is_skewed_capped_and_reproducible():
+    ids = list(range(1, 1001))
+    counts = _generator().allocate(100_000, ids, cap=5_000)
+    ranked = sorted(counts.values(), reverse=True)
+    assert ranked[0] == 5_000
+    assert sum(ranked[:10]) > sum(ranked[500:])
+    assert counts == _generator().allocate(100_000, ids, cap=5_000)
+
+    rows = list(_generator().startup_rows(1, range(1, 41), [1, 2]))
+    assert rows == list(_generator().startup_rows(1, range(1, 41), [1, 2]))
+    assert all(row["created_date"] <= NOW and row["description"].endswith(".") for row in rows)
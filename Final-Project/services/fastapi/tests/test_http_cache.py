@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from fastapi import Request, Response
+from sqlalchemy import text
+
+from app.core.http_cache import conditional_get, resource_version
+from app.schemas.startup_crud import StartupUpdate
+from app.services.category_catalog import get_category_catalog
+from app.services.startup_service import StartupService
+from app.services.user_names import get_user_name_resolver
+
+
+def _request(**headers):
+    raw = [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_conditional_get_honors_if_none_match_and_if_modified_since():
+    version = resource_version([(1, datetime(2026, 10, 18, 12, 0, 0, 500000)), (2, datetime(2026, 10, 1))])
+    response = Response()
+    assert conditional_get(_request(), response, version) is None
+    assert response.headers["etag"] == version.etag
+    assert response.headers["last-modified"] == "Sun, 18 Oct 2026 12:00:00 GMT"
+
+    not_modified = conditional_get(_request(if_none_match=f'"other", {version.etag.removeprefix("W/")}'), Response(), version)
+    assert not_modified.status_code == 304 and not_modified.body == b""
+    assert not_modified.headers["etag"] == version.etag
+    assert conditional_get(_request(if_none_match='W/"other"'), Response(), version) is None
+
+    assert conditional_get(_request(if_modified_since="Sun, 18 Oct 2026 12:00:00 GMT"), Response(), version).status_code == 304
+    assert conditional_get(_request(if_modified_since="Sun, 18 Oct 2026 11:59:59 GMT"), Response(), version) is None
+    # If-None-Match manda sobre If-Modified-Since
+    assert conditional_get(
+        _request(if_none_match='"other"', if_modified_since="Sun, 18 Oct 2026 12:00:00 GMT"), Response(), version
+    ) is None
+
+
+def test_startup_versions_change_with_edits_and_page_contents(seed, db):
+    service = StartupService(db)
+    detail, page = service.version(1), service.list_version(limit=10)
+    assert service.version(99) is None
+    assert service.version(1) == detail
+
+    service.update(1, 1, StartupUpdate(description="Otra descripción"))
+    edited = service.version(1)
+    assert edited.etag != detail.etag
+    assert edited.last_modified is not None
+    assert service.list_version(limit=10).etag != page.etag
+    # Otra página no cambia por editar una startup fuera de ella
+    assert service.list_version(skip=1, limit=10) == resource_version([])
+
+
+def test_startup_versions_change_when_owner_or_category_is_renamed(seed, db):
+    service = StartupService(db)
+    detail, page = service.version(1), service.list_version(limit=10)
+
+    with seed.begin() as conn:
+        conn.execute(text("UPDATE `User` SET first_name = 'Anabel' WHERE user_id = 1"))
+    get_user_name_resolver().invalidate(1)
+    renamed_owner = service.version(1)
+    assert renamed_owner != detail
+    assert service.list_version(limit=10) != page
+
+    with seed.begin() as conn:
+        conn.execute(text("UPDATE Category SET name = 'Tecnología verde' WHERE category_id = 1"))
+    get_category_catalog().load(db)
+    assert service.version(1) != renamed_owner
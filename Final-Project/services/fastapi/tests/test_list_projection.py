@@ -0,0 +1,17 @@
+from app.schemas.search import StartupSearchRequest
+from app.services.search_service import SearchService
+from app.services.startup_service import StartupService
+
+
+def test_list_views_select_columns_without_loading_entities(seed, db, statements):
+    startups = StartupService(db).list()
+    owned = StartupService(db).list_by_owner(1)
+    found = SearchService(db).search_startups(StartupSearchRequest(query="eco"))
+
+    assert [s.owner_name for s in startups] == ["Ana Ruiz"] == [s.owner_name for s in owned]
+    assert startups[0].category_name == "Tecnología"
+    assert [r.name for r in found["results"]] == ["EcoTech Solutions"]
+    # Ni entidades en la sesión ni columnas que la respuesta no usa
+    assert len(db.identity_map) == 0
+    startup_selects = [s for s in statements if 'FROM "Startup"' in s]
+    assert startup_selects and not [s for s in startup_selects if "modified_date" in s]
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.schemas.search import StartupSearchRequest, SearchSortBy
+from app.services.comment_service import CommentService
+from app.services.search_index import StartupSearchIndex
+from app.services.search_service import SearchService
+from app.services.startup_service import StartupService
+
+
+@pytest.fixture
+def comments(seed):
+    base = datetime(2026, 10, 1, 12, 0, 0)
+    rows = [
+        {
+            "cid": i,
+            "content": f"Comentario {i}",
+            # Varios comentarios comparten fecha: el comment_id desempata
+            "created": base + timedelta(minutes=i // 3),
+            "uid": 1 + i % 2,
+        }
+        for i in range(1, 24)
+    ]
+    with seed.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO Comment (comment_id, content, created_date, user_id, startup_id) "
+                "VALUES (:cid, :content, :created, :uid, 1)"
+            ),
+            rows,
+        )
+    return seed
+
+
+@pytest.fixture
+def startups(seed):
+    with seed.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+                "VALUES (:sid, :name, 'Pagos y datos', 1, 1)"
+            ),
+            [{"sid": sid, "name": f"Pagos {sid}"} for sid in range(2, 16)],
+        )
+        conn.execute(
+            text("INSERT INTO StartupStats (startup_id, total_votes, total_comments) VALUES (:sid, :v, :c)"),
+            [{"sid": sid, "v": sid % 4, "c": sid % 3} for sid in range(1, 16)],
+        )
+    return seed
+
+
+def _walk(fetch_page):
+    """Recorre todas las páginas siguiendo el cursor y devuelve los ids en orden."""
+    ids, cursor, pages = [], None, 0
+    while True:
+        items, cursor = fetch_page(cursor)
+        ids.extend(items)
+        pages += 1
+        if cursor is None:
+            return ids, pages
+
+
+def test_cursor_roundtrip_and_scope():
+    token = encode_cursor([datetime(2026, 1, 2, 3, 4, 5), 7], scope="comments")
+    assert decode_cursor(token, scope="comments", size=2) == ["2026-01-02T03:04:05", 7]
+
+    with pytest.raises(ValueError):
+        decode_cursor(token, scope="startups")
+    with pytest.raises(ValueError):
+        decode_cursor(token, scope="comments", size=3)
+    with pytest.raises(ValueError):
+        decode_cursor("no-es-un-cursor", scope="comments")
+
+
+@pytest.mark.parametrize("startup_id", [1, None])
+def test_comment_cursor_pages_match_offset_order(comments, db, startup_id):
+    service = CommentService(db)
+    expected = [c["comment_id"] for c in service.list(startup_id, limit=100)]
+
+    def fetch(cursor):
+        page, next_cursor = service.list_page(startup_id, limit=5, cursor=cursor)
+        return [c["comment_id"] for c in page], next_cursor
+
+    ids, pages = _walk(fetch)
+    assert ids == expected == sorted(expected, reverse=True)
+    assert pages == 5
+
+
+def test_startup_cursor_pages(startups, db):
+    service = StartupService(db)
+
+    def fetch(cursor):
+        page, next_cursor = service.list_page(limit=4, cursor=cursor)
+        return [s.startup_id for s in page], next_cursor
+
+    ids, pages = _walk(fetch)
+    assert ids == list(range(1, 16))
+    assert pages == 4
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+@pytest.mark.parametrize("sort_by", [SearchSortBy.RELEVANCIA, SearchSortBy.VOTOS_DESC, SearchSortBy.COMENTARIOS_ASC])
+def test_search_cursor_pages_match_offset_pages(startups, db, use_index, sort_by):
+    service = SearchService(db)
+    if use_index:
+        service.index = StartupSearchIndex()
+        service.index.build(db)
+
+    full = service.search_startups(StartupSearchRequest(query="pagos", sort_by=sort_by, limit=100))
+    expected = [r.startup_id for r in full["results"]]
+    assert full["next_cursor"] is None
+
+    def fetch(cursor):
+        result = service.search_startups(
+            StartupSearchRequest(query="pagos", sort_by=sort_by, limit=4, cursor=cursor)
+        )
+        assert result["total"] == len(expected)
+        return [r.startup_id for r in result["results"]], result["next_cursor"]
+
+    ids, _ = _walk(fetch)
+    assert ids == expected
+
+
+def test_search_rejects_cursor_from_another_sort(startups, db):
+    service = SearchService(db)
+    first = service.search_startups(StartupSearchRequest(sort_by=SearchSortBy.VOTOS_DESC, limit=2))
+
+    with pytest.raises(ValueError):
+        service.search_startups(
+            StartupSearchRequest(sort_by=SearchSortBy.VOTOS_ASC, limit=2, cursor=first["next_cursor"])
+        )
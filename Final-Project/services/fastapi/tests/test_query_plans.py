@@ -0,0 +1,81 @@
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, text
+
+from app.models.vote import VoteType
+from app.repositories.comment_repository import CommentRepository
+from app.repositories.startup_repository import StartupRepository
+from app.repositories.startup_stats_repository import StartupStatsRepository
+from app.repositories.vote_repository import VoteRepository
+from app.services.trending import TrendingRanker
+from app.services.vote_stats import VoteStatsSnapshot
+
+# Recorrido completo de una tabla (sin índice) u ordenación en memoria
+FULL_SCAN = re.compile(r"SCAN (TABLE )?\w+")
+TEMP_SORT = "TEMP B-TREE"
+
+
+def _incremental_snapshot(db):
+    snapshot = VoteStatsSnapshot()
+    snapshot.watermark = datetime(2026, 10, 18)
+    snapshot.mark_dirty(1)
+    snapshot.refresh(db)
+
+
+# Rutas calientes: cada sentencia que ejecutan debe resolverse por índice
+HOT_PATHS = {
+    "comentarios de una startup": lambda db: CommentRepository(db).list_by_startup(1),
+    "comentarios de una startup, cursor": lambda db: CommentRepository(db).list_by_startup(
+        1, after=(datetime(2026, 10, 18), 10)
+    ),
+    "comentarios recientes": lambda db: CommentRepository(db).list_all(),
+    "comentarios recientes, cursor": lambda db: CommentRepository(db).list_all(after=(datetime(2026, 10, 18), 10)),
+    "conteo de votos": lambda db: VoteRepository(db).count_for_startup(1),
+    "conteo de votos agrupado": lambda db: VoteRepository(db).count_for_startups([1, 2, 3]),
+    "votos de un usuario": lambda db: VoteRepository(db).get_by_user(1),
+    "upsert de voto": lambda db: VoteRepository(db).upsert(user_id=1, startup_id=1, vote_type=VoteType.upvote),
+    "borrado de voto": lambda db: VoteRepository(db).delete(user_id=1, startup_id=1),
+    "recalculo de StartupStats": lambda db: StartupStatsRepository(db).refresh_many([1]),
+    "startups de un dueño": lambda db: StartupRepository(db).get_by_owner(1),
+    "listado de startups, cursor": lambda db: StartupRepository(db).get_all(after_id=0),
+    "detalle con estadísticas": lambda db: StartupRepository(db).get_with_stats(1),
+    "ranking trending": lambda db: StartupRepository(db).get_trending(),
+    "ventana de trending": lambda db: TrendingRanker().compute(db),
+    "snapshot de votos incremental": _incremental_snapshot,
+}
+
+
+@pytest.fixture
+def query_plans(seed):
+    """(sentencia, detalles de EXPLAIN QUERY PLAN) de cada sentencia ejecutada en el test."""
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            rows = cursor.connection.execute("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+            plans.append((statement, [row[3] for row in rows]))
+
+    event.listen(seed, "after_cursor_execute", explain)
+    yield plans
+    event.remove(seed, "after_cursor_execute", explain)
+
+
+@pytest.mark.parametrize("path", HOT_PATHS)
+def test_hot_queries_use_indexes(db, query_plans, path):
+    HOT_PATHS[path](db)
+    assert query_plans
+    for statement, details in query_plans:
+        for detail in details:
+            assert not FULL_SCAN.fullmatch(detail) and TEMP_SORT not in detail, (
+                f"{path}: {detail}\n{statement}"
+            )
+
+
+def test_detects_a_full_scan(db, query_plans):
+    # El propio chequeo: un filtro sin índice sí se marca
+    db.execute(text("SELECT comment_id FROM Comment WHERE content = 'x' ORDER BY modified_date"))
+    details = [detail for _, plan in query_plans for detail in plan]
+    assert any(FULL_SCAN.fullmatch(detail) for detail in details)
+    assert any(TEMP_SORT in detail for detail in details)
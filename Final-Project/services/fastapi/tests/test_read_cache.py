@@ -0,0 +1,113 @@
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.core.cache import CacheBackend, LRUCache, NullCache
+from app.models.vote import VoteType
+from app.schemas.comment import CommentCreate
+from app.schemas.startup_crud import StartupUpdate
+from app.schemas.vote import VoteCreate
+from app.services.comment_service import CommentService
+from app.services.read_cache import get_read_cache, startup_key
+from app.services.startup_service import StartupService
+from app.services.vote_service import VoteService
+
+
+def test_lru_cache_expires_entries_and_counts_lookups():
+    cache = LRUCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    loads = []
+    assert cache.get_or_set("c", lambda: loads.append(1) or 3) == 3
+    assert cache.get_or_set("c", lambda: loads.append(1) or 3) == 3
+    assert cache.get_or_set("missing", lambda: None) is None
+    assert "missing" not in cache._data
+    assert len(loads) == 1
+    assert (cache.hits, cache.misses) == (3, 3)
+    cache.clear()
+    assert (cache.hits, cache.misses) == (3, 3)
+    cache.reset_stats()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_load_that_raced_an_invalidation_is_not_cached():
+    cache = LRUCache(maxsize=10)
+
+    def stale_load():
+        # Una escritura invalida la clave mientras se leía el valor anterior
+        cache.delete("startup:1")
+        return "viejo"
+
+    assert cache.get_or_set("startup:1", stale_load) == "viejo"
+    assert cache.get("startup:1") is None
+    assert cache.get_or_set("startup:1", lambda: "nuevo") == "nuevo"
+    assert cache.get("startup:1") == "nuevo"
+
+    # clear() también invalida las cargas en vuelo
+    assert cache.get_or_set("startup:2", lambda: cache.clear() or "viejo") == "viejo"
+    assert cache.get("startup:2") is None
+
+
+def test_cache_backends_are_abstract():
+    class Incomplete(CacheBackend):
+        def get(self, key, default=None):
+            return default
+
+    with pytest.raises(TypeError):
+        Incomplete()
+    assert NullCache().get_or_set("k", lambda: 1) == 1
+
+
+def test_startup_reads_are_served_from_cache_until_updated(seed, db, statements):
+    service = StartupService(db)
+
+    assert service.get(1).name == "EcoTech Solutions"
+    assert service.get_with_stats(1).total_votos == 0
+    reads = len(statements)
+    assert service.get(1).name == "EcoTech Solutions"
+    assert service.get_with_stats(1).total_votos == 0
+    assert len(statements) == reads
+
+    service.update(1, 1, StartupUpdate(name="EcoTech"))
+    assert service.get(1).name == "EcoTech"
+    assert get_read_cache().hits == 2
+
+
+def test_detail_entry_from_an_older_version_is_reloaded(seed, db):
+    service = StartupService(db)
+    assert service.get(1, service.version(1)).name == "EcoTech Solutions"
+
+    # Edición hecha por otro worker: la caché de este no se invalidó
+    with seed.begin() as conn:
+        conn.execute(text(
+            "UPDATE Startup SET name = 'EcoTech', modified_date = '2030-01-01 00:00:00' WHERE startup_id = 1"
+        ))
+    assert service.get(1).name == "EcoTech Solutions"
+    version = service.version(1)
+    assert service.get(1, version).name == "EcoTech"
+    assert get_read_cache().get(startup_key(1))[0] == version.etag
+
+
+def test_vote_and_comment_writes_invalidate_counts(seed, db):
+    startups, votes = StartupService(db), VoteService(db)
+    assert votes.count(1).upvotes == 0
+    assert startups.get_with_stats(1).total_comentarios == 0
+
+    votes.upsert(2, VoteCreate(startup_id=1, vote_type=VoteType.upvote))
+    assert votes.count(1).upvotes == 1
+    assert startups.get_with_stats(1).total_votos == 1
+
+    CommentService(db).create(2, CommentCreate(startup_id=1, content="Hola"))
+    assert startups.get_with_stats(1).total_comentarios == 1
+
+    votes.delete(2, 1)
+    assert votes.count(1).upvotes == 0
+
+    startups.delete(1, 1)
+    assert startups.get(1) is None
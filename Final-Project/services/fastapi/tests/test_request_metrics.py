@@ -0,0 +1,62 @@
+import logging
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.request_metrics import QueryMetricsMiddleware, RouteMetrics, attach_query_hooks, route_metrics
+
+
+def _app(engine, **middleware_options):
+    app = FastAPI()
+    app.add_middleware(QueryMetricsMiddleware, **middleware_options)
+
+    def connection():
+        with engine.connect() as conn:
+            yield conn
+
+    @app.get("/startups/{startup_id}/names")
+    def names(startup_id: int, conn=Depends(connection)):
+        # Una consulta por fila: el patrón N+1 que se quiere detectar
+        return [conn.execute(text("SELECT name FROM Startup WHERE startup_id = :id"), {"id": i}).scalar()
+                for i in range(startup_id)]
+
+    return app
+
+
+def test_counts_statements_per_request_and_route(seed):
+    attach_query_hooks(seed)
+    route_metrics.reset()
+    client = TestClient(_app(seed))
+
+    response = client.get("/startups/3/names")
+    assert response.json() == ["EcoTech Solutions" if i == 1 else None for i in range(3)]
+    assert response.headers["server-timing"].startswith('db;dur=')
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+    client.get("/startups/1/names")
+    client.get("/missing")
+
+    entry = route_metrics.routes[("GET", "/startups/{startup_id}/names")]
+    assert entry[0] == 2 and entry[2] == 4 and entry[4] == 3
+    assert route_metrics.routes[("GET", "<unmatched>")][2] == 0
+    # Fuera de una petición no se cuenta nada
+    with seed.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert route_metrics.routes[("GET", "/startups/{startup_id}/names")][2] == 4
+
+
+def test_prometheus_text_and_n_plus_one_warning(seed, caplog):
+    attach_query_hooks(seed)
+    client = TestClient(_app(seed, warn_threshold=2, debug=True))
+    with caplog.at_level(logging.WARNING, logger="app.core.request_metrics"):
+        client.get("/startups/2/names")
+        assert not caplog.records
+        client.get("/startups/3/names")
+    assert "Posible N+1: GET /startups/3/names ejecutó 3 sentencias" in caplog.text
+
+    metrics = RouteMetrics()
+    metrics.routes[("GET", 'a"b')] = [2, 0.5, 7, 0.25, 4, 0.125]
+    text_format = metrics.render_prometheus()
+    assert "# TYPE starthub_db_statements_total counter" in text_format
+    assert 'starthub_db_statements_total{method="GET",route="a\\"b"} 7' in text_format
+    assert 'starthub_db_slowest_statement_seconds{method="GET",route="a\\"b"} 0.125' in text_format
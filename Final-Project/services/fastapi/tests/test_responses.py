@@ -0,0 +1,39 @@
+import json
+from typing import List
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from app.api.routes.startups import list_startups
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import FastJSONResponse
+from app.schemas.search import SearchResponse, StartupSearchRequest
+from app.schemas.startup_crud import StartupCreate, StartupOut
+from app.services.search_service import SearchService
+from app.services.startup_service import StartupService
+
+
+def _request():
+    return Request({"type": "http", "method": "GET", "headers": []})
+
+
+def test_body_matches_response_model_serialization(seed, db):
+    service = StartupService(db)
+    service.create(2, StartupCreate(name="AgroData", description="Datos del campo", category_id=1, email="hola@agro.co", owner_user_id=2))
+    startups = service.list()
+    assert json.loads(FastJSONResponse(startups).body) == TypeAdapter(List[StartupOut]).dump_python(startups, mode="json")
+
+    found = SearchService(db).search_startups(StartupSearchRequest(limit=1))
+    assert json.loads(FastJSONResponse(found).body) == SearchResponse(**found).model_dump(mode="json")
+    assert found["next_cursor"] is not None
+
+
+def test_list_route_keeps_etag_and_cursor_headers(seed, db):
+    service = StartupService(db)
+    service.create(2, StartupCreate(name="AgroData", description="Datos del campo", category_id=1, owner_user_id=2))
+
+    result = list_startups(_request(), Response(), skip=0, limit=1, cursor=None, service=service)
+    assert isinstance(result, FastJSONResponse)
+    assert result.headers["etag"].startswith('W/"')
+    assert result.headers[NEXT_CURSOR_HEADER]
+    assert [s["name"] for s in json.loads(result.body)] == ["EcoTech Solutions"]
@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+
+from app.schemas.search import StartupSearchRequest
+from app.services import search_backend
+from app.services.search_backend import (
+    LikeSearchBackend,
+    MySQLFullTextBackend,
+    SearchBackend,
+    SQLiteFTS5Backend,
+    get_search_backend,
+)
+from app.services.search_service import SearchService
+
+
+def _names(result):
+    return sorted(r.name for r in result["results"])
+
+
+def test_sqlite_uses_like_until_fts_is_installed(seed):
+    assert isinstance(get_search_backend(seed), LikeSearchBackend)
+
+
+def test_fts5_search_matches_prefixes_and_folds_accents(seed, db):
+    with seed.begin() as conn:
+        SQLiteFTS5Backend.install(conn)
+        conn.execute(text(
+            "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) VALUES "
+            "(2, 'FinPay', 'Pagos móviles para comercios', 1, 1), "
+            "(3, 'AgroData', 'Analítica para el campo', 2, 1)"
+        ))
+    service = SearchService(db)
+    assert isinstance(service.backend, SQLiteFTS5Backend)
+
+    assert _names(service.search_startups(StartupSearchRequest(query="eco"))) == ["EcoTech Solutions"]
+    assert _names(service.search_startups(StartupSearchRequest(query="Analítica"))) == ["AgroData"]
+    assert _names(service.search_startups(StartupSearchRequest(query="analitica"))) == ["AgroData"]
+    assert _names(service.search_startups(StartupSearchRequest(query="pagos móviles"))) == ["FinPay"]
+
+
+def test_fts5_index_follows_updates_and_deletes(seed, db):
+    with seed.begin() as conn:
+        SQLiteFTS5Backend.install(conn)
+        conn.execute(text("UPDATE Startup SET name = 'GreenGrid' WHERE startup_id = 1"))
+    service = SearchService(db)
+
+    assert _names(service.search_startups(StartupSearchRequest(query="greengrid"))) == ["GreenGrid"]
+    assert service.search_startups(StartupSearchRequest(query="ecotech"))["results"] == []
+
+    with seed.begin() as conn:
+        conn.execute(text("DELETE FROM Startup WHERE startup_id = 1"))
+    assert service.search_startups(StartupSearchRequest(query="greengrid"))["results"] == []
+
+
+def test_mysql_backend_builds_boolean_match():
+    clause = MySQLFullTextBackend().match("eco (tech)")
+    sql = str(clause.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "MATCH (`Startup`.name, `Startup`.description) AGAINST ('+eco* +tech*' IN BOOLEAN MODE)" in sql
+
+
+def test_mysql_backend_drops_zero_relevance_only_on_the_like_fallback():
+    backend = MySQLFullTextBackend()
+    compile_sql = lambda clause: str(clause.compile(dialect=mysql.dialect()))  # noqa: E731
+    assert "CASE" not in compile_sql(backend.condition("agro"))
+    assert "MATCH" not in compile_sql(backend.condition("ro")) and "CASE" in compile_sql(backend.condition("ro"))
+
+
+def test_install_resets_the_cached_backend(seed):
+    assert isinstance(get_search_backend(seed), LikeSearchBackend)
+    with seed.begin() as conn:
+        SQLiteFTS5Backend.install(conn)
+    assert isinstance(get_search_backend(seed), SQLiteFTS5Backend)
+
+
+def test_like_fallback_is_rechecked_once_the_index_exists(seed, monkeypatch):
+    monkeypatch.setattr(search_backend, "FALLBACK_RECHECK_SECONDS", 0.0)
+    assert isinstance(get_search_backend(seed), LikeSearchBackend)
+    # Índice creado desde otro proceso (la migración), sin pasar por install()
+    with seed.begin() as conn:
+        for statement in SQLiteFTS5Backend.DDL:
+            conn.execute(text(statement))
+    assert isinstance(get_search_backend(seed), SQLiteFTS5Backend)
+
+
+def test_incomplete_backend_fails_on_creation():
+    class NoMatch(SearchBackend):
+        name = "broken"
+
+    with pytest.raises(TypeError):
+        NoMatch()
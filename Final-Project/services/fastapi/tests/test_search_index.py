@@ -0,0 +1,92 @@
+import pytest
+from sqlalchemy import text
+
+from app.schemas.search import StartupSearchFilters, StartupSearchRequest, SearchSortBy
+from app.schemas.startup_crud import StartupCreate, StartupUpdate
+from app.services.search_index import StartupSearchIndex, get_search_index
+from app.services.search_service import SearchService
+from app.services.startup_service import StartupService
+
+
+@pytest.fixture
+def catalog(seed):
+    with seed.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+                "VALUES (:sid, :name, :desc, 1, 1)"
+            ),
+            [
+                {"sid": 2, "name": "FinPay", "desc": "Pagos móviles para comercios"},
+                {"sid": 3, "name": "AgroData", "desc": "Analítica para el campo"},
+                {"sid": 4, "name": "Fintech Andina", "desc": "Créditos y pagos para pymes"},
+                {"sid": 5, "name": "Salud Viva", "desc": "Telemedicina rural"},
+            ],
+        )
+        conn.execute(
+            text("INSERT INTO StartupStats (startup_id, total_votes, total_comments) VALUES (:sid, :v, :c)"),
+            [{"sid": 1, "v": 3, "c": 0}, {"sid": 2, "v": 7, "c": 1}, {"sid": 4, "v": 2, "c": 5}],
+        )
+    return seed
+
+
+@pytest.fixture
+def fresh_index():
+    get_search_index.cache_clear()
+    yield
+    get_search_index.cache_clear()
+
+
+@pytest.mark.parametrize("query", ["f", "fi", "fin", "pagos", "tech", "pagos campo", "zzz", "ViVa"])
+@pytest.mark.parametrize(
+    "sort_by", [SearchSortBy.RELEVANCIA, SearchSortBy.VOTOS_DESC, SearchSortBy.COMENTARIOS_ASC, SearchSortBy.TRENDING]
+)
+def test_index_results_match_sql_search(catalog, db, query, sort_by):
+    request = StartupSearchRequest(query=query, sort_by=sort_by)
+    sql_service = SearchService(db)
+    indexed_service = SearchService(db)
+    indexed_service.index = StartupSearchIndex()
+    indexed_service.index.build(db)
+
+    expected = sql_service.search_startups(request)
+    actual = indexed_service.search_startups(request)
+
+    # El backend LIKE filtra por la frase completa; el índice admite cualquier
+    # palabra con puntaje > 0, así que se compara sobre los resultados con puntaje.
+    expected_rows = [(r.startup_id, r.relevance_score) for r in expected["results"] if r.relevance_score > 0]
+    actual_rows = [(r.startup_id, pytest.approx(r.relevance_score)) for r in actual["results"]]
+    if " " not in query:
+        assert actual_rows == expected_rows
+    else:
+        assert set(r[0] for r in expected_rows) <= set(r[0] for r in actual_rows)
+
+
+def test_index_applies_filters_and_paginates(catalog, db):
+    service = SearchService(db)
+    service.index = StartupSearchIndex()
+    service.index.build(db)
+
+    result = service.search_startups(StartupSearchRequest(
+        query="pagos", filters=StartupSearchFilters(min_comentarios=1), skip=1, limit=1,
+    ))
+
+    assert result["total"] == 2
+    assert [r.name for r in result["results"]] == ["Fintech Andina"]
+
+
+def test_startup_writes_update_index_incrementally(catalog, db, fresh_index):
+    index = get_search_index()
+    index.build(db)
+    service = StartupService(db)
+
+    created = service.create(1, StartupCreate(
+        name="Robótica Escolar", description="Kits educativos", category_id=1, owner_user_id=1,
+    ))
+    assert created.startup_id in index.search("robótica")
+
+    service.update(created.startup_id, 1, StartupUpdate(name="Aula Maker"))
+    assert index.search("robótica") == {}
+    assert created.startup_id in index.search("maker")
+
+    service.delete(created.startup_id, 1)
+    assert index.search("maker") == {}
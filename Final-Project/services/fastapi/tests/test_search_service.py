@@ -0,0 +1,78 @@
+from sqlalchemy import text
+
+from app.schemas.search import StartupSearchFilters, StartupSearchRequest, SearchSortBy
+from app.services.search_service import SearchService
+
+
+def _load_startups(engine):
+    """30 startups: 'Agro 00'..'Agro 19' (nombre) y 10 con 'agro' solo en la descripción."""
+    rows = [
+        {"sid": 100 + i, "name": f"Agro {i:02d}", "desc": "Campo y cosecha", "votes": i}
+        for i in range(20)
+    ] + [
+        {"sid": 200 + i, "name": f"Mercado {i:02d}", "desc": "Red de bioagronegocios", "votes": 100 + i}
+        for i in range(10)
+    ]
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+                "VALUES (:sid, :name, :desc, 1, 1)"
+            ),
+            rows,
+        )
+        conn.execute(
+            text("INSERT INTO StartupStats (startup_id, upvotes, total_votes) VALUES (:sid, :votes, :votes)"),
+            rows,
+        )
+
+
+def test_search_total_counts_every_match_not_only_the_page(seed, db):
+    _load_startups(seed)
+
+    page = SearchService(db).search_startups(StartupSearchRequest(query="agro", skip=0, limit=5))
+
+    assert page["total"] == 30
+    assert page["total_pages"] == 6
+    assert len(page["results"]) == 5
+
+
+def test_search_relevance_orders_across_pages(seed, db):
+    _load_startups(seed)
+    service = SearchService(db)
+
+    first = service.search_startups(StartupSearchRequest(query="agro", skip=0, limit=20))["results"]
+    second = service.search_startups(StartupSearchRequest(query="agro", skip=20, limit=20))["results"]
+
+    # Inicio de palabra en el nombre (0.9) antes que subcadena en la descripción (0.3),
+    # aunque las segundas tengan más votos; dentro del nivel, por votos.
+    assert [r.relevance_score for r in first] == [0.9] * 20
+    assert [r.total_votos for r in first] == list(range(19, -1, -1))
+    assert [r.relevance_score for r in second] == [0.3] * 10
+
+
+def test_short_substrings_inside_words_are_not_results(seed, db):
+    _load_startups(seed)
+    service = SearchService(db)
+
+    # "ro" pasa el prefiltro LIKE (Agro, Mercado) pero no empieza ninguna palabra
+    page = service.search_startups(StartupSearchRequest(query="ro"))
+    assert page["results"] == [] and page["total"] == 0
+
+    page = service.search_startups(StartupSearchRequest(query="ag", limit=50))
+    assert page["total"] == 20 and {r.relevance_score for r in page["results"]} == {0.8}
+
+
+def test_search_filters_and_sort_are_applied_in_sql(seed, db):
+    _load_startups(seed)
+    request = StartupSearchRequest(
+        query="agro",
+        filters=StartupSearchFilters(min_votos=105),
+        sort_by=SearchSortBy.VOTOS_ASC,
+        limit=3,
+    )
+
+    result = SearchService(db).search_startups(request)
+
+    assert result["total"] == 5
+    assert [r.name for r in result["results"]] == ["Mercado 05", "Mercado 06", "Mercado 07"]
@@ -0,0 +1,116 @@
+from sqlalchemy import text
+
+from app.models.startup_stats import StartupStats
+from app.models.vote import VoteType
+from app.repositories.comment_repository import CommentRepository
+from app.repositories.startup_repository import StartupRepository
+from app.repositories.startup_stats_repository import StartupStatsRepository
+from app.repositories.vote_repository import VoteRepository
+
+N_USERS = 300
+N_COMMENTS = 400
+
+
+def _load_popular_startup(engine):
+    """Startup 1 con N_COMMENTS comentarios y N_USERS votos (2/3 upvotes)."""
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO `User` (user_id, first_name, last_name) VALUES (:uid, 'U', :ln)"),
+            [{"uid": uid, "ln": str(uid)} for uid in range(10, 10 + N_USERS)],
+        )
+        conn.execute(
+            text("INSERT INTO Vote (user_id, startup_id, vote_type) VALUES (:uid, 1, :vt)"),
+            [
+                {"uid": uid, "vt": "downvote" if uid % 3 == 0 else "upvote"}
+                for uid in range(10, 10 + N_USERS)
+            ],
+        )
+        conn.execute(
+            text("INSERT INTO Comment (user_id, startup_id, content) VALUES (:uid, 1, 'comentario')"),
+            [{"uid": 10 + i % N_USERS} for i in range(N_COMMENTS)],
+        )
+
+
+def _vm_steps(engine, fn):
+    """Cuenta bloques de instrucciones de la VM de SQLite ejecutados por fn().
+
+    Es una medida de las filas recorridas: un producto comments x votes
+    dispara el contador en varios órdenes de magnitud.
+    """
+    raw = engine.raw_connection()
+    steps = {"n": 0}
+
+    def handler():
+        steps["n"] += 1
+        return 0
+
+    raw.driver_connection.set_progress_handler(handler, 100)
+    try:
+        result = fn()
+    finally:
+        raw.driver_connection.set_progress_handler(None, 0)
+        raw.close()
+    return result, steps["n"]
+
+
+def test_get_with_stats_counts_from_stats_row(seed, db):
+    _load_popular_startup(seed)
+    db.add(StartupStats(startup_id=1, upvotes=200, downvotes=100, total_votes=N_USERS, total_comments=N_COMMENTS))
+    db.commit()
+
+    startup, total_comentarios, total_votos = StartupRepository(db).get_with_stats(1)
+
+    assert startup.startup_id == 1
+    assert startup.owner_name == "Ana Ruiz"
+    assert (total_comentarios, total_votos) == (N_COMMENTS, N_USERS)
+
+
+def test_get_with_stats_without_stats_row_does_not_fan_out(seed, db):
+    _load_popular_startup(seed)
+    repo = StartupRepository(db)
+
+    result, steps = _vm_steps(seed, lambda: repo.get_with_stats(1))
+
+    _, total_comentarios, total_votos = result
+    assert (total_comentarios, total_votos) == (N_COMMENTS, N_USERS)
+    # Recorrer comentarios y votos por separado es lineal (~700 filas); el join
+    # anterior materializaba 400 x 300 = 120k filas.
+    assert steps < (N_COMMENTS + N_USERS) * 2
+
+
+def _counters(db):
+    stats = db.get(StartupStats, 1, populate_existing=True)
+    return stats.upvotes, stats.downvotes, stats.total_votes, stats.total_comments
+
+
+def test_vote_and_comment_writes_maintain_the_stats_row(seed, db):
+    votes, comments = VoteRepository(db), CommentRepository(db)
+
+    # Sin fila de contadores: el primer voto la crea desde las tablas
+    votes.upsert(user_id=1, startup_id=1, vote_type=VoteType.upvote)
+    assert _counters(db) == (1, 0, 1, 0)
+    votes.upsert(user_id=2, startup_id=1, vote_type=VoteType.upvote)
+    votes.upsert(user_id=2, startup_id=1, vote_type=VoteType.downvote)
+    assert _counters(db) == (1, 1, 2, 0)
+    votes.upsert(user_id=2, startup_id=1, vote_type=VoteType.downvote)
+    assert _counters(db) == (1, 1, 2, 0)
+    votes.delete(user_id=1, startup_id=1)
+    assert _counters(db) == (0, 1, 1, 0)
+
+    created = comments.create(user_id=1, content="Hola", startup_id=1)
+    comments.create(user_id=2, content="Buen proyecto", startup_id=1)
+    assert _counters(db) == (0, 1, 1, 2)
+    comments.delete(comments.get(created["comment_id"]))
+    assert _counters(db) == (0, 1, 1, 1)
+
+
+def test_refresh_upserts_over_a_concurrently_created_row(seed, db):
+    # Otra transacción creó la fila después de que esta la buscara: se sobrescribe
+    with seed.begin() as conn:
+        conn.execute(text("INSERT INTO Vote (user_id, startup_id, vote_type) VALUES (1, 1, 'upvote')"))
+        conn.execute(text("INSERT INTO StartupStats (startup_id, upvotes) VALUES (1, 7)"))
+    repo = StartupStatsRepository(db)
+    assert repo.refresh(1).upvotes == 1
+    repo.refresh_many([1, 1])
+    db.commit()
+    assert _counters(db) == (1, 0, 1, 0)
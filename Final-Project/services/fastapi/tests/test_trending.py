@@ -0,0 +1,164 @@
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select, text
+
+from app.models.startup_trending import StartupTrending
+from app.schemas.search import SearchSortBy, StartupSearchRequest
+from app.services.search_index import StartupSearchIndex
+from app.services.search_service import SearchService
+from app.services.startup_service import StartupService
+from app.services.periodic import LeaderLock, PeriodicJob
+from app.services.trending import TrendingRanker, database_now, trending_score, wilson_lower_bound
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+@pytest.fixture
+def activity(seed):
+    """Startup 2 con upvotes recientes, 1 con upvotes viejos, 3 con downvotes y un comentario, 4 sin actividad."""
+    with seed.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+                "VALUES (:sid, :name, 'Plataforma', 2, 1)"
+            ),
+            [{"sid": 2, "name": "AgroData"}, {"sid": 3, "name": "FinPay"}, {"sid": 4, "name": "Salud Viva"}],
+        )
+        votes = [
+            (1, 1, "upvote", NOW - timedelta(days=6)), (2, 1, "upvote", NOW - timedelta(days=6)),
+            (1, 2, "upvote", NOW - timedelta(hours=2)), (2, 2, "upvote", NOW - timedelta(hours=1)),
+            (1, 3, "downvote", NOW - timedelta(hours=1)), (2, 3, "downvote", NOW - timedelta(hours=1)),
+        ]
+        conn.execute(
+            text("INSERT INTO Vote (user_id, startup_id, vote_type, created_date) VALUES (:u, :s, :t, :d)"),
+            [{"u": u, "s": s, "t": t, "d": d} for u, s, t, d in votes],
+        )
+        conn.execute(
+            text("INSERT INTO Comment (user_id, startup_id, content, created_date) VALUES (1, 3, 'Hola', :d)"),
+            {"d": NOW - timedelta(hours=3)},
+        )
+    return seed
+
+
+def test_score_rewards_recent_agreement():
+    assert wilson_lower_bound(0, 0) == 0.0
+    assert wilson_lower_bound(10, 10) > wilson_lower_bound(1, 1) > 0
+    assert wilson_lower_bound(5, 10) < wilson_lower_bound(9, 10)
+    assert trending_score(0, 3, 0) == 0.0
+    assert trending_score(2, 0, 1) > trending_score(2, 0, 0)
+
+
+def test_refresh_ranks_by_decayed_activity(activity, db):
+    ranker = TrendingRanker(half_life_hours=24, top_n=2)
+    assert ranker.refresh(db, now=NOW) == 2
+    rows = db.execute(select(StartupTrending.startup_id, StartupTrending.trending_rank)
+                      .order_by(StartupTrending.trending_rank)).all()
+    # Los votos de hace 6 días de la startup 1 casi no pesan; top_n recorta el resto
+    assert [tuple(r) for r in rows] == [(2, 1), (3, 2)]
+
+    ranker.top_n = 10
+    ranker.refresh(db, now=NOW)
+    page = StartupService(db).list_trending(skip=1, limit=5)
+    assert [(s.startup_id, s.trending_rank) for s in page] == [(3, 2), (1, 3)]
+    assert page[0].owner_name == "Luis Mora" and page[0].category_name == "Tecnología"
+    assert page[0].trending_score > page[1].trending_score > 0
+
+
+def test_search_sorts_by_trending_with_cursor(activity, db):
+    TrendingRanker(half_life_hours=24).refresh(db, now=NOW)
+    service = SearchService(db)
+    request = StartupSearchRequest(sort_by=SearchSortBy.TRENDING, limit=2)
+    first = service.search_startups(request)
+    second = service.search_startups(request.model_copy(update={"cursor": first["next_cursor"]}))
+    assert [r.startup_id for r in first["results"] + second["results"]] == [2, 3, 1, 4]
+    assert second["results"][-1].trending_score == 0.0
+
+    indexed = SearchService(db)
+    indexed.index = StartupSearchIndex()
+    indexed.index.build(db)
+    found = indexed.search_startups(StartupSearchRequest(query="plataforma", sort_by=SearchSortBy.TRENDING))
+    assert [r.startup_id for r in found["results"]] == [2, 3, 4]
+
+
+def test_trending_pages_by_offset_across_rank_gaps(activity, db):
+    TrendingRanker(half_life_hours=24).refresh(db, now=NOW)
+    with activity.begin() as conn:
+        # El borrado en cascada deja un hueco en trending_rank hasta el próximo recálculo
+        conn.execute(text("DELETE FROM Startup WHERE startup_id = 2"))
+    service = StartupService(db)
+    assert [s.startup_id for s in service.list_trending(skip=0, limit=1)] == [3]
+    assert [s.startup_id for s in service.list_trending(skip=1, limit=5)] == [1]
+
+
+def test_refresh_without_now_uses_the_database_clock(activity, db):
+    before = database_now(db)
+    TrendingRanker(half_life_hours=24).refresh(db)
+    computed_at = db.execute(select(StartupTrending.computed_at).limit(1)).scalar_one()
+    assert before <= computed_at <= database_now(db)
+
+
+class FakeLockServer:
+    """Imita GET_LOCK/IS_USED_LOCK/RELEASE_LOCK de MySQL para un único nombre."""
+
+    def __init__(self):
+        self.dialect = SimpleNamespace(name="mysql")
+        self.holder = None
+
+    def connect(self):
+        server = self
+
+        class Conn:
+            def execute(self, statement, params):
+                sql = str(statement)
+                if "GET_LOCK" in sql:
+                    if server.holder is None:
+                        server.holder = self
+                    value = int(server.holder is self)
+                elif "IS_USED_LOCK" in sql:
+                    value = int(server.holder is self)
+                else:
+                    if server.holder is self:
+                        server.holder = None
+                    value = 1
+                return SimpleNamespace(scalar=lambda: value)
+
+            def commit(self):
+                pass
+
+            def close(self):
+                # El servidor libera los candados de una conexión cerrada
+                if server.holder is self:
+                    server.holder = None
+
+        return Conn()
+
+
+def test_leader_lock_runs_the_job_in_one_worker():
+    server = FakeLockServer()
+    runs = []
+
+    def job():
+        task = lambda db: runs.append(db) or len(runs)  # noqa: E731
+        return PeriodicJob("trending", nullcontext, task, leader=LeaderLock(server, "starthub_trending"))
+
+    first, second = job(), job()
+    assert first.run_once() == 1 and first.run_once() == 2
+    assert second.run_once() is None and second.skipped_runs == 1
+    assert first.metrics()["leader"] is True and second.metrics()["leader"] is False
+
+    # El líder perdió su conexión: el siguiente ciclo de otro worker toma el candado
+    server.holder = None
+    assert second.run_once() == 3
+    assert first.run_once() is None and first.skipped_runs == 1 and not first.leader.held
+
+    second.leader.release()
+    assert server.holder is None
+
+
+def test_leader_lock_is_a_no_op_without_mysql(engine):
+    lock = LeaderLock(engine, "starthub_trending")
+    assert lock.acquire() and lock.held
+    lock.release()
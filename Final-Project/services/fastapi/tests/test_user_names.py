@@ -0,0 +1,61 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.api.routes.internal import invalidate_user, require_internal_token
+from app.core.config import get_settings
+from app.services.comment_service import CommentService
+from app.services.startup_service import StartupService
+from app.services.user_names import UserNameResolver, get_user_name_resolver
+from app.schemas.comment import CommentCreate
+
+
+def test_resolve_many_queries_only_missing_ids_once(seed, db, statements):
+    resolver = UserNameResolver(maxsize=10)
+    assert resolver.resolve_many(db, [1, 2, 1, 99]) == {1: "Ana Ruiz", 2: "Luis Mora", 99: "Usuario 99"}
+    assert len(statements) == 1 and " IN " in statements[0]
+
+    statements.clear()
+    assert resolver.resolve_many(db, [2, 1]) == {2: "Luis Mora", 1: "Ana Ruiz"}
+    assert statements == []
+
+    with seed.begin() as conn:
+        conn.execute(text("UPDATE `User` SET first_name = 'Luisa' WHERE user_id = 2"))
+    resolver.invalidate(2)
+    assert resolver.resolve_many(db, [1, 2]) == {1: "Ana Ruiz", 2: "Luisa Mora"}
+    assert len(statements) == 2
+
+
+def test_listings_no_longer_join_user(seed, db, statements):
+    comments = CommentService(db)
+    comments.create(2, CommentCreate(startup_id=1, content="Uno"))
+    comments.create(1, CommentCreate(startup_id=1, content="Dos"))
+    StartupService(db).list()
+    statements.clear()
+
+    assert [c["user_name"] for c in comments.list(1)] == ["Ana Ruiz", "Luis Mora"]
+    assert StartupService(db).list()[0].owner_name == "Ana Ruiz"
+    assert not [s for s in statements if '"User"' in s]
+
+
+def test_internal_invalidation_requires_the_shared_token(seed, db, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "internal_api_token", "")
+    with pytest.raises(HTTPException) as disabled:
+        require_internal_token("anything")
+    assert disabled.value.status_code == 404
+
+    monkeypatch.setattr(settings, "internal_api_token", "s3cret")
+    with pytest.raises(HTTPException) as forbidden:
+        require_internal_token("wrong")
+    assert forbidden.value.status_code == 403
+    require_internal_token("s3cret")
+
+    service = StartupService(db)
+    assert service.get(1).owner_name == "Ana Ruiz"
+    with seed.begin() as conn:
+        conn.execute(text("UPDATE `User` SET last_name = 'Ríos' WHERE user_id = 1"))
+    invalidate_user(1, db)
+    assert get_user_name_resolver().resolve(db, 1) == "Ana Ríos"
+    # El detalle cacheado de sus startups también se descarta
+    assert service.get(1).owner_name == "Ana Ríos"
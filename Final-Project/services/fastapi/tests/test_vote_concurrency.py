@@ -0,0 +1,71 @@
+import threading
+
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.session import enable_sqlite_foreign_keys
+from app.models.startup_stats import StartupStats
+from app.models.vote import Vote, VoteType
+from app.repositories.startup_stats_repository import StartupStatsRepository
+from app.schemas.vote import VoteCreate
+from app.services.vote_service import VoteService
+
+THREADS = 16
+ROUNDS = 25
+
+
+def test_concurrent_upserts_keep_one_vote_and_exact_counters(tmp_path):
+    # Archivo (no memoria): cada hilo usa su propia conexión, como los workers reales
+    engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'votes.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    enable_sqlite_foreign_keys(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO `User` (user_id, email, first_name, last_name) VALUES (1, 'ana@example.com', 'Ana', 'Ruiz')"
+        ))
+        conn.execute(text("INSERT INTO Category (category_id, name) VALUES (1, 'Tecnología')"))
+        conn.execute(text(
+            "INSERT INTO Startup (startup_id, name, owner_user_id, category_id) VALUES (1, 'EcoTech', 1, 1)"
+        ))
+        conn.execute(text("INSERT INTO StartupStats (startup_id) VALUES (1)"))
+
+    Session = sessionmaker(bind=engine)
+    barrier = threading.Barrier(THREADS)
+    errors = []
+    created_count = []
+
+    def hammer(worker: int):
+        barrier.wait()
+        for i in range(ROUNDS):
+            vote_type = VoteType.upvote if (worker + i) % 2 else VoteType.downvote
+            try:
+                with Session() as db:
+                    _, created = VoteService(db).upsert(1, VoteCreate(startup_id=1, vote_type=vote_type))
+                    if created:
+                        created_count.append(worker)
+            except Exception as e:  # pragma: no cover - el test falla con el detalle
+                errors.append(repr(e))
+
+    threads = [threading.Thread(target=hammer, args=(w,)) for w in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(created_count) == 1
+
+    with Session() as db:
+        votes = db.execute(select(Vote).where(Vote.user_id == 1, Vote.startup_id == 1)).scalars().all()
+        assert len(votes) == 1
+
+        stats = db.get(StartupStats, 1)
+        counters = (stats.upvotes, stats.downvotes, stats.total_votes)
+        expected = StartupStatsRepository(db).refresh(1)
+        assert counters == (expected.upvotes, expected.downvotes, expected.total_votes)
+        assert stats.total_votes == 1
+    engine.dispose()
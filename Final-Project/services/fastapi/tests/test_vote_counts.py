@@ -0,0 +1,46 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.api.routes import votes
+from app.db.session import get_db
+from app.repositories.vote_repository import VoteRepository
+
+
+def _client(db):
+    app = FastAPI()
+    app.include_router(votes.router, prefix="/votes")
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def test_bulk_counts_cover_every_requested_id(seed, db):
+    with seed.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+            "VALUES (2, 'AgroData', 'Datos para el campo', 2, 1)"
+        ))
+        conn.execute(text(
+            "INSERT INTO Vote (user_id, startup_id, vote_type) "
+            "VALUES (1, 1, 'upvote'), (2, 1, 'downvote'), (1, 2, 'upvote')"
+        ))
+    client = _client(db)
+
+    response = client.get("/votes/counts", params={"ids": "2, 1,99,1"})
+    assert response.status_code == 200
+    # Un elemento por id distinto, en el orden pedido; sin votos se devuelve en cero
+    assert response.json() == [
+        {"startup_id": 2, "upvotes": 1, "downvotes": 0},
+        {"startup_id": 1, "upvotes": 1, "downvotes": 1},
+        {"startup_id": 99, "upvotes": 0, "downvotes": 0},
+    ]
+
+
+def test_bulk_counts_empty_and_invalid_lists(seed, db):
+    assert VoteRepository(db).count_for_startups([]) == {}
+    client = _client(db)
+    assert client.get("/votes/counts", params={"ids": ""}).json() == []
+    assert client.get("/votes/counts", params={"ids": " , "}).json() == []
+    assert client.get("/votes/counts", params={"ids": "1,x"}).status_code == 400
+    too_many = ",".join(str(i) for i in range(votes.MAX_BULK_COUNT_IDS + 1))
+    assert client.get("/votes/counts", params={"ids": too_many}).status_code == 400
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.startup_stats import StartupStats
+from app.models.vote import Vote, VoteType
+from app.schemas.vote import VoteCreate
+from app.services.vote_queue import VoteQueue
+from app.services.vote_service import VoteService
+
+
+@pytest.fixture
+def queue(seed):
+    with seed.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO Startup (startup_id, name, owner_user_id, category_id) VALUES (2, 'FinPay', 2, 1)"
+        ))
+    return VoteQueue(sessionmaker(bind=seed), flush_ms=10, max_items=100, max_lag_ms=60_000)
+
+
+def _votes(db):
+    return sorted(db.execute(select(Vote.user_id, Vote.startup_id, Vote.vote_type)).all())
+
+
+def test_queue_coalesces_per_pair_and_flushes_in_one_upsert(queue, seed, db, statements):
+    service = VoteService(db, queue=queue)
+    assert service.upsert(1, VoteCreate(startup_id=1, vote_type=VoteType.upvote)) == (None, False)
+    service.upsert(1, VoteCreate(startup_id=1, vote_type=VoteType.downvote))
+    service.upsert(2, VoteCreate(startup_id=1, vote_type=VoteType.upvote))
+    service.upsert(2, VoteCreate(startup_id=2, vote_type=VoteType.upvote))
+    assert queue.depth() == 3
+    assert _votes(db) == []
+
+    statements.clear()
+    assert queue.flush() == 3
+    assert len([s for s in statements if s.startswith('INSERT INTO "Vote"')]) == 1
+
+    assert _votes(db) == [(1, 1, VoteType.downvote), (2, 1, VoteType.upvote), (2, 2, VoteType.upvote)]
+    stats = {s.startup_id: (s.upvotes, s.downvotes, s.total_votes) for s in db.execute(select(StartupStats)).scalars()}
+    assert stats == {1: (1, 1, 2), 2: (1, 0, 1)}
+
+    # Un segundo lote actualiza los votos existentes y recalcula contadores
+    service.upsert(1, VoteCreate(startup_id=1, vote_type=VoteType.upvote))
+    queue.flush()
+    db.expire_all()
+    assert db.get(StartupStats, 1).upvotes == 2
+    metrics = queue.metrics()
+    assert (metrics["depth"], metrics["flushes"], metrics["flushed_items"], metrics["coalesced"]) == (0, 2, 4, 1)
+
+
+def test_invalid_votes_are_dropped_without_losing_the_batch(queue, db):
+    queue.put(1, 1, VoteType.upvote)
+    queue.put(99, 1, VoteType.upvote)
+    queue.put(2, 99, VoteType.downvote)
+    queue.flush()
+
+    assert _votes(db) == [(1, 1, VoteType.upvote)]
+    assert queue.metrics()["rejected"] == 2
+
+
+def test_delete_discards_a_queued_vote(queue, db):
+    service = VoteService(db, queue=queue)
+    service.upsert(2, VoteCreate(startup_id=1, vote_type=VoteType.upvote))
+    service.delete(2, 1)
+    queue.flush()
+    assert _votes(db) == []
+    with pytest.raises(ValueError, match="Vote not found"):
+        service.delete(2, 1)
+
+
+def test_failed_flush_requeues_without_overwriting_newer_votes(queue, monkeypatch):
+    queue.put(1, 1, VoteType.upvote)
+
+    def boom(batch):
+        # Llega un voto más nuevo mientras el lote fallido estaba en vuelo
+        queue.put(1, 1, VoteType.downvote)
+        raise RuntimeError("db caída")
+
+    monkeypatch.setattr(queue, "_write", boom)
+    with pytest.raises(RuntimeError):
+        queue.flush()
+    assert queue._pending[(1, 1)][0] == VoteType.downvote
+    assert queue.metrics()["failed_flushes"] == 1
+
+
+def test_lagging_queue_is_flushed_by_the_caller(queue, db):
+    queue.max_lag = 0
+    queue.put(1, 1, VoteType.upvote)
+    queue.put(2, 1, VoteType.upvote)
+    assert queue.depth() == 0
+    assert len(_votes(db)) == 2
+    assert queue.metrics()["lag_flushes"] == 1
+
+
+def test_background_task_flushes_and_drains_on_stop(queue, db):
+    async def main():
+        await queue.start()
+        queue.put(1, 1, VoteType.upvote)
+        for _ in range(100):
+            if queue.depth() == 0:
+                break
+            await asyncio.sleep(0.01)
+        flushed_by_timer = queue.depth() == 0
+        queue.put(2, 1, VoteType.downvote)
+        queue.flush_interval = 60
+        await queue.stop()
+        return flushed_by_timer
+
+    assert asyncio.run(main())
+    assert _votes(db) == [(1, 1, VoteType.upvote), (2, 1, VoteType.downvote)]
+
+
+def test_failed_inline_flush_keeps_votes_queued_and_the_request_succeeds(queue, monkeypatch):
+    queue.max_lag = 0
+    queue.put(1, 1, VoteType.upvote)
+
+    def boom(batch):
+        raise RuntimeError("db caída")
+
+    monkeypatch.setattr(queue, "_write", boom)
+    queue.put(2, 1, VoteType.downvote)
+    assert queue.depth() == 2
+    assert queue.metrics()["failed_flushes"] == 1
+    assert queue.metrics()["lag_flushes"] == 1
@@ -0,0 +1,133 @@
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select, text
+
+from app.core.config import get_settings
+from app.models.startup_vote_stats import StartupVoteStatsSnapshot
+from app.models.vote import VoteType
+from app.schemas.vote import VoteCreate
+from app.services.vote_service import VoteService
+from app.services.periodic import PeriodicJob
+from app.services.vote_stats import get_vote_stats_snapshot, vote_stats_job_enabled
+
+
+@pytest.fixture
+def snapshot(monkeypatch):
+    # Las marcas de las escrituras solo se anotan con la tarea de refresco habilitada
+    monkeypatch.setattr(get_settings(), "vote_counts_source", "snapshot")
+    monkeypatch.setattr(get_settings(), "vote_stats_refresh_seconds", 60)
+    get_vote_stats_snapshot.cache_clear()
+    yield get_vote_stats_snapshot()
+    get_vote_stats_snapshot.cache_clear()
+
+
+@pytest.fixture
+def startups(seed):
+    with seed.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO Startup (startup_id, name, description, owner_user_id, category_id) "
+            "VALUES (2, 'AgroData', 'Plataforma', 2, 1)"
+        ))
+        conn.execute(text(
+            "INSERT INTO Vote (user_id, startup_id, vote_type) VALUES (1, 1, 'upvote'), (2, 1, 'downvote')"
+        ))
+    return seed
+
+
+def _rows(db):
+    stmt = select(
+        StartupVoteStatsSnapshot.startup_id, StartupVoteStatsSnapshot.startup_name, StartupVoteStatsSnapshot.upvotes,
+        StartupVoteStatsSnapshot.downvotes, StartupVoteStatsSnapshot.total_votes, StartupVoteStatsSnapshot.net_votes,
+    ).order_by(StartupVoteStatsSnapshot.startup_id)
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def test_first_refresh_rebuilds_then_only_touched_startups(startups, db, snapshot):
+    assert snapshot.refresh(db) == 2
+    assert _rows(db) == [(1, "EcoTech Solutions", 1, 1, 2, 0), (2, "AgroData", 0, 0, 0, 0)]
+    assert snapshot.full_refreshes == 1
+
+    # Nada nuevo desde la marca de agua salvo los votos del mismo segundo (que se releen)
+    db.execute(text("UPDATE Vote SET created_date = '2020-01-01 00:00:00'"))
+    db.commit()
+    assert snapshot.refresh(db) == 0
+
+    # Alta hecha fuera de este worker: la detecta Vote.created_date
+    db.execute(text("INSERT INTO Vote (user_id, startup_id, vote_type) VALUES (1, 2, 'upvote')"))
+    db.commit()
+    assert snapshot.refresh(db) == 1
+    assert _rows(db)[1] == (2, "AgroData", 1, 0, 1, 1)
+    assert snapshot.incremental_refreshes == 2
+
+
+def test_vote_writes_mark_startups_dirty(startups, db, snapshot):
+    snapshot.refresh(db)
+    db.execute(text("UPDATE Vote SET created_date = '2020-01-01 00:00:00'"))
+    db.commit()
+
+    # Cambio de tipo y borrado no mueven created_date: los marca el servicio
+    service = VoteService(db)
+    service.upsert(2, VoteCreate(startup_id=1, vote_type=VoteType.upvote))
+    service.delete(1, 1)
+    assert snapshot.pending() == 1
+    assert snapshot.refresh(db) == 1
+    assert snapshot.pending() == 0
+    assert _rows(db)[0] == (1, "EcoTech Solutions", 1, 0, 1, 1)
+
+
+def test_counts_switch_reads_the_snapshot(startups, db, snapshot, monkeypatch):
+    snapshot.refresh(db)
+    db.execute(text("INSERT INTO Vote (user_id, startup_id, vote_type) VALUES (1, 2, 'downvote')"))
+    db.commit()
+    service = VoteService(db)
+    monkeypatch.setattr(get_settings(), "vote_counts_source", "snapshot")
+
+    # Hasta el próximo refresco el snapshot no ve el voto nuevo
+    assert [(c.upvotes, c.downvotes) for c in service.count_many([1, 2, 99])] == [(1, 1), (0, 0), (0, 0)]
+    assert service.count(2).downvotes == 0
+    snapshot.refresh(db)
+    assert service.count(2).downvotes == 1
+
+    monkeypatch.setattr(get_settings(), "vote_counts_source", "live")
+    assert [(c.upvotes, c.downvotes) for c in service.count_many([1, 2])] == [(1, 1), (0, 1)]
+
+
+def test_followers_refresh_only_their_own_writes(startups, db, snapshot):
+    # Un worker que no es el líder: ni reconstruye ni recorre la marca de agua
+    db.execute(text("INSERT INTO Vote (user_id, startup_id, vote_type) VALUES (1, 2, 'upvote')"))
+    db.commit()
+    snapshot.mark_dirty(2)
+    job = PeriodicJob("vote_stats", lambda: nullcontext(db), snapshot.refresh,
+                      leader=SimpleNamespace(acquire=lambda: False, held=False),
+                      follower_task=lambda session: snapshot.refresh(session, scan=False))
+    assert job.run_once() == 1
+    assert _rows(db) == [(2, "AgroData", 1, 0, 1, 1)]
+    assert snapshot.watermark is None and snapshot.full_refreshes == 0
+    assert job.skipped_runs == 1 and job.metrics()["leader"] is False
+
+    # Si pasa a ser el líder, su primer refresco reconstruye la tabla
+    assert snapshot.refresh(db) == 2 and snapshot.full_refreshes == 1
+
+
+def test_job_only_runs_when_counts_read_the_snapshot(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "vote_stats_refresh_seconds", 60)
+    monkeypatch.setattr(settings, "vote_counts_source", "live")
+    assert not vote_stats_job_enabled(settings)
+    monkeypatch.setattr(settings, "vote_counts_source", "snapshot")
+    assert vote_stats_job_enabled(settings)
+    monkeypatch.setattr(settings, "vote_stats_refresh_seconds", 0)
+    assert not vote_stats_job_enabled(settings)
+
+
+def test_live_counts_do_not_accumulate_dirty_marks(startups, db):
+    get_vote_stats_snapshot.cache_clear()
+    try:
+        snapshot = get_vote_stats_snapshot()
+        assert get_settings().vote_counts_source == "live" and not snapshot.track_dirty
+        VoteService(db).upsert(2, VoteCreate(startup_id=1, vote_type=VoteType.upvote))
+        assert snapshot.pending() == 0
+    finally:
+        get_vote_stats_snapshot.cache_clear()
@@ -0,0 +1,90 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, text
+
+from app.models.vote import VoteType
+from app.schemas.comment import CommentCreate, CommentUpdate
+from app.schemas.vote import VoteCreate
+from app.services.comment_service import CommentService
+from app.services.vote_service import VoteService
+
+
+@pytest.fixture
+def stats_row(seed):
+    with seed.begin() as conn:
+        conn.execute(text("INSERT INTO StartupStats (startup_id) VALUES (1)"))
+    return seed
+
+
+@contextmanager
+def count_statements(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_vote_upsert_skips_existence_queries(stats_row, db):
+    service = VoteService(db)
+
+    with count_statements(stats_row) as statements:
+        vote, created = service.upsert(2, VoteCreate(startup_id=1, vote_type=VoteType.upvote))
+        # El voto devuelto no necesita releerse tras el commit
+        assert (vote.vote_id, vote.user_id, vote.vote_type) == (1, 2, VoteType.upvote)
+        assert vote.created_date is not None
+    # INSERT ... ON CONFLICT ... RETURNING y UPDATE de StartupStats
+    assert len(statements) == 2
+    assert created
+
+
+@pytest.mark.parametrize("user_id,startup_id,message", [
+    (99, 1, "User not found"),
+    (1, 99, "Startup not found"),
+])
+def test_vote_foreign_key_errors_map_to_not_found(stats_row, db, user_id, startup_id, message):
+    service = VoteService(db)
+    with pytest.raises(ValueError, match=message):
+        service.upsert(user_id, VoteCreate(startup_id=startup_id, vote_type=VoteType.downvote))
+    with pytest.raises(ValueError, match=message):
+        service.delete(user_id, startup_id)
+
+
+def test_vote_delete_reports_missing_vote(stats_row, db):
+    with pytest.raises(ValueError, match="Vote not found"):
+        VoteService(db).delete(1, 1)
+
+
+def test_comment_create_and_update_return_author_without_extra_queries(stats_row, db):
+    service = CommentService(db)
+
+    with count_statements(stats_row) as statements:
+        created = service.create(2, CommentCreate(startup_id=1, content="Muy buena idea"))
+    # INSERT ... RETURNING, UPDATE de StartupStats y nombre del autor (caché de nombres fría)
+    assert len(statements) == 3
+    assert created["user_name"] == "Luis Mora"
+    assert created["created_date"] is not None
+
+    with count_statements(stats_row) as statements:
+        updated = service.update(created["comment_id"], 2, CommentUpdate(content="Editado"))
+    # Lectura del comentario (autor ya en caché) y UPDATE
+    assert len(statements) == 2
+    assert updated["content"] == "Editado"
+    assert updated["user_name"] == "Luis Mora"
+    assert updated["modified_date"] is not None
+    assert CommentService(db).list(1)[0]["content"] == "Editado"
+
+
+@pytest.mark.parametrize("user_id,startup_id,message", [
+    (99, 1, "User not found"),
+    (1, 99, "Startup not found"),
+])
+def test_comment_foreign_key_errors_map_to_not_found(stats_row, db, user_id, startup_id, message):
+    with pytest.raises(ValueError, match=message):
+        CommentService(db).create(user_id, CommentCreate(startup_id=startup_id, content="Hola"))
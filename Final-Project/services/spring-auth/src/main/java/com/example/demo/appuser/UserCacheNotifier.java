@@ -0,0 +1,59 @@
+package com.example.demo.appuser;
+
+import java.net.URI;
+import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.time.Duration;
+
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.stereotype.Component;
+
+/**
+ * Avisa al backend FastAPI de que cambió el perfil de un usuario, para que
+ * olvide su nombre en caché. Es asíncrono y no falla la petición del usuario:
+ * si el aviso se pierde, la caché de FastAPI expira sola por TTL.
+ */
+@Component
+public class UserCacheNotifier {
+
+    private final static Logger LOGGER = LoggerFactory
+            .getLogger(UserCacheNotifier.class);
+
+    private final HttpClient httpClient = HttpClient.newBuilder()
+            .connectTimeout(Duration.ofSeconds(2))
+            .build();
+    private final String baseUrl;
+    private final String token;
+
+    public UserCacheNotifier(
+            @Value("${fastapi.internal-url:}") String baseUrl,
+            @Value("${fastapi.internal-token:}") String token) {
+        this.baseUrl = baseUrl.endsWith("/") ? baseUrl.substring(0, baseUrl.length() - 1) : baseUrl;
+        this.token = token;
+    }
+
+    public void userUpdated(Integer userId) {
+        if (baseUrl.isBlank() || token.isBlank()) {
+            return;
+        }
+        HttpRequest request = HttpRequest.newBuilder(
+                        URI.create(baseUrl + "/api/v1/internal/users/" + userId + "/invalidate"))
+                .timeout(Duration.ofSeconds(2))
+                .header("X-Internal-Token", token)
+                .POST(HttpRequest.BodyPublishers.noBody())
+                .build();
+        httpClient.sendAsync(request, HttpResponse.BodyHandlers.discarding())
+                .thenAccept(response -> {
+                    if (response.statusCode() != 204) {
+                        LOGGER.warn("FastAPI respondió {} al invalidar el usuario {}", response.statusCode(), userId);
+                    }
+                })
+                .exceptionally(e -> {
+                    LOGGER.warn("No se pudo invalidar el usuario {} en FastAPI: {}", userId, e.getMessage());
+                    return null;
+                });
+    }
+}
@@ -12,6 +12,7 @@ import org.springframework.web.bind.annotation.RestController;
 
 import com.example.demo.appuser.AppUser;
 import com.example.demo.appuser.AppUserService;
+import com.example.demo.appuser.UserCacheNotifier;
 
 import lombok.RequiredArgsConstructor;
 
@@ -21,6 +22,7 @@ import lombok.RequiredArgsConstructor;
 public class UserController {
 
     private final AppUserService appUserService;
+    private final UserCacheNotifier userCacheNotifier;
 
     @GetMapping("/me")
     public ResponseEntity<UserProfileResponse> getCurrentUserProfile(Authentication authentication) {
@@ -36,6 +38,7 @@ public class UserController {
         
         AppUser currentUser = (AppUser) authentication.getPrincipal();
         UserProfileResponse updatedProfile = appUserService.updateUserProfile(currentUser.getId(), updateRequest);
+        userCacheNotifier.userUpdated(currentUser.getId());
         return ResponseEntity.ok(updatedProfile);
     }
 
@@ -58,6 +61,7 @@ public class UserController {
         }
 
         UserProfileResponse updatedProfile = appUserService.updateUserProfile(id, updateRequest);
+        userCacheNotifier.userUpdated(id);
         return ResponseEntity.ok(updatedProfile);
     }
 